@@ -0,0 +1,76 @@
+from argparse import ArgumentParser, Namespace
+import json
+import platform
+from time import perf_counter
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Text
+
+
+class Benchmark(NamedTuple):
+    name: Text
+    run: Callable[[], Any]
+    objects_count: int = 1
+
+
+class BenchmarkResult(NamedTuple):
+    name: Text
+    objects_count: int
+    iterations: int
+    ops_per_second: float
+    microseconds_per_object: float
+    peak_allocated_bytes: int
+
+
+def measure(benchmark: Benchmark, min_time: float = 0.2, repeat: int = 5) -> BenchmarkResult:
+    """Measure the best time of running the benchmark as many times as taking at least 'min_time' seconds."""
+    benchmark.run()
+    iterations: int = _get_iterations(benchmark.run, min_time)
+    best_time: float = min(_time(benchmark.run, iterations) for _ in range(repeat)) / iterations
+
+    tracemalloc.start()
+    try:
+        benchmark.run()
+        peak_allocated_bytes: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(benchmark.name, benchmark.objects_count, iterations, 1 / best_time,
+                           best_time / benchmark.objects_count * 1_000_000, peak_allocated_bytes)
+
+
+def _get_iterations(run: Callable[[], Any], min_time: float) -> int:
+    iterations: int = 1
+    while True:
+        elapsed_time: float = _time(run, iterations)
+        if min_time <= elapsed_time:
+            return iterations
+
+        iterations *= 2 if elapsed_time <= 0 else max(2, min(10, int(min_time / elapsed_time) + 1))
+
+
+def _time(run: Callable[[], Any], iterations: int) -> float:
+    start_time: float = perf_counter()
+    for _ in range(iterations):
+        run()
+
+    return perf_counter() - start_time
+
+
+def run_benchmarks(benchmarks: Sequence[Benchmark], argv: Optional[Sequence[Text]] = None):
+    """Run the benchmarks selected by the command line arguments and write the results as JSON."""
+    parser: ArgumentParser = ArgumentParser(description="Run the benchmarks and write the results as JSON.")
+    parser.add_argument('--filter', default='', help="Run only the benchmarks whose names contain it.")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Seconds taken by each measurement at least.")
+    parser.add_argument('--repeat', type=int, default=5, help="Measurements whose best is reported.")
+    parser.add_argument('--output', default=None, help="File to write the results into instead of stdout.")
+    arguments: Namespace = parser.parse_args(argv)
+
+    results: List[Dict[Text, Any]] = [measure(benchmark, arguments.min_time, arguments.repeat)._asdict()
+                                      for benchmark in benchmarks if arguments.filter in benchmark.name]
+    report: Text = json.dumps({'python': platform.python_version(), 'implementation': platform.python_implementation(),
+                               'results': results}, indent=2)
+    if arguments.output is None:
+        print(report)
+    else:
+        with open(arguments.output, 'w') as file:
+            file.write(report + '\n')
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+import os
+from tempfile import mkdtemp
+from typing import Any, Callable, Dict, List, Text, Tuple
+
+from benchmarks.benchmark import Benchmark, run_benchmarks
+from expire_dict import ExpireDict
+
+SIZES: Tuple[int, ...] = (10000, 100000, 1000000)
+ACCESS_COUNT: int = 10000
+LIFE_TIME: float = 3600
+EXPIRE_CYCLE: float = 3600
+
+
+class _LegacyItem:
+    __slots__ = ('set_time', 'item')
+
+    def __init__(self, item: Any):
+        self.set_time: datetime = datetime.now()
+        self.item: Any = item
+
+
+class LegacyExpireDict:
+    """The previous 'ExpireDict', scanning all the items comparing 'datetime', without its timer."""
+    def __init__(self, life_time: float):
+        self.life_time: timedelta = timedelta(seconds=life_time)
+        self._dict: Dict[Any, _LegacyItem] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        item: _LegacyItem = self._dict[key]
+        item.set_time = datetime.now()
+        return item.item
+
+    def __setitem__(self, key: Any, value: Any):
+        self._dict[key] = _LegacyItem(value)
+
+    def expire(self):
+        now: datetime = datetime.now()
+        for key in [key for key, item in self._dict.items() if item.set_time + self.life_time <= now]:
+            del self._dict[key]
+
+
+class _NoTimerExpireDict(ExpireDict):
+    def _set_expire_handler(self):
+        pass
+
+
+def _fill(expire_dict: Any, size: int) -> Any:
+    for key in range(size):
+        expire_dict[key] = key
+
+    return expire_dict
+
+
+def _fill_per_entry_life_times(expire_dict: ExpireDict, size: int) -> ExpireDict:
+    for key in range(size):
+        expire_dict.set(key, key, life_time=LIFE_TIME + key)
+
+    return expire_dict
+
+
+def _get(expire_dict: Any, size: int) -> int:
+    step: int = max(size // ACCESS_COUNT, 1)
+    total: int = 0
+    for key in range(0, size, step):
+        total += expire_dict[key]
+
+    return total
+
+
+def _load_snapshot(path: Text) -> ExpireDict:
+    expire_dict: ExpireDict = _NoTimerExpireDict(LIFE_TIME, EXPIRE_CYCLE)
+    expire_dict.load_snapshot(path)
+    return expire_dict
+
+
+def _create_snapshot_benchmarks(size: int, directory: Text) -> List[Benchmark]:
+    expire_dict: ExpireDict = _NoTimerExpireDict(LIFE_TIME, EXPIRE_CYCLE)
+    for key in range(size):
+        expire_dict[f'key{key}'] = {'id': key, 'name': f'name{key}'}
+
+    path: Text = os.path.join(directory, f'{size}.json')
+    expire_dict.dump_snapshot(path)
+    return [Benchmark(f'snapshot_dump/{size}', lambda: expire_dict.dump_snapshot(path), size),
+            Benchmark(f'snapshot_load/{size}', lambda: _load_snapshot(path), size)]
+
+
+def create_benchmarks() -> List[Benchmark]:
+    """An expiry cycle finding no expired item is what every cycle of a large and hot dictionary does mostly."""
+    factories: List[Tuple[Text, Callable[[], Any]]] = [
+        ('legacy', lambda: LegacyExpireDict(LIFE_TIME)),
+        ('expire_dict', lambda: _NoTimerExpireDict(LIFE_TIME, EXPIRE_CYCLE)),
+    ]
+    benchmarks: List[Benchmark] = []
+    for size in SIZES:
+        for name, create in factories:
+            expire_dict: Any = _fill(create(), size)
+            benchmarks.append(Benchmark(f'get/{name}/{size}', lambda expire_dict_=expire_dict, size_=size:
+                                        _get(expire_dict_, size_), min(size, ACCESS_COUNT)))
+            benchmarks.append(Benchmark(f'expire/{name}/{size}', expire_dict.expire, size))
+
+        per_entry_dict: ExpireDict = _fill_per_entry_life_times(_NoTimerExpireDict(LIFE_TIME, EXPIRE_CYCLE), size)
+        benchmarks.append(Benchmark(f'expire/per_entry_life_time/{size}', per_entry_dict.expire, size))
+
+    directory: Text = mkdtemp()
+    for size in SIZES:
+        benchmarks.extend(_create_snapshot_benchmarks(size, directory))
+
+    return benchmarks
+
+
+if __name__ == '__main__':
+    run_benchmarks(create_benchmarks())
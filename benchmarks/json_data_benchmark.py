@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Text, Tuple, Union
+
+from benchmarks.benchmark import Benchmark, run_benchmarks
+from json_data import JsonFormat, from_data_to, serializing_option, to_json_bytes_from, to_json_from
+from slotdataclass import slotdataclass
+
+LIST_SIZE: int = 10000
+DICT_SIZE: int = 1000
+NESTED_DEPTH: int = 5
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+@dataclass
+class FlatItem:
+    a: int
+    b: float
+    c: Text
+    d: bool
+    e: Optional[Text]
+
+
+class TupleItem(NamedTuple):
+    a: int
+    b: float
+    c: Text
+    d: bool
+    e: Optional[Text]
+
+
+@slotdataclass
+@dataclass
+class SlotItem:
+    a: int
+    b: float
+    c: Text
+    d: bool
+    e: Optional[Text]
+
+
+@dataclass
+class NestedItem:
+    value: int
+    items: List[FlatItem]
+    child: Optional['NestedItem']
+
+
+@serializing_option(tag=('kind', 'circle'))
+@dataclass
+class Circle:
+    kind: Text
+    radius: float
+
+
+@serializing_option(tag=('kind', 'square'))
+@dataclass
+class Square:
+    kind: Text
+    width: float
+    height: float
+
+
+@dataclass
+class Shapes:
+    shapes: List[Union[Circle, Square]]
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Polygon:
+    points: List[Point]
+    closed: bool
+
+
+@dataclass
+class Paint:
+    colors: List[Color]
+    name: Text
+
+
+@dataclass
+class Figures:
+    figures: List[Union[Polygon, Paint]]
+
+
+def _create_flat_data(index: int) -> JsonFormat:
+    return {'a': index, 'b': index / 2, 'c': f'text{index}', 'd': index % 2 == 0, 'e': None}
+
+
+def _create_nested_data(depth: int) -> JsonFormat:
+    return {'value': depth, 'items': [_create_flat_data(index) for index in range(3)],
+            'child': _create_nested_data(depth - 1) if 0 < depth else None}
+
+
+def _create_shapes_data() -> JsonFormat:
+    return {'shapes': [{'kind': 'circle', 'radius': index} if index % 2 == 0
+                       else {'kind': 'square', 'width': index, 'height': index} for index in range(LIST_SIZE)]}
+
+
+def _create_figures_data() -> JsonFormat:
+    return {'figures': [{'points': [{'x': 0, 'y': 0}, {'x': index, 'y': index}], 'closed': True} if index % 2 == 0
+                        else {'colors': ['red', 'green'], 'name': f'paint{index}'} for index in range(LIST_SIZE)]}
+
+
+def _count_nested_objects(depth: int) -> int:
+    return (depth + 1) * 4
+
+
+def _create_deserialization_benchmarks(name: Text, annotation: Any, data: JsonFormat,
+                                       objects_count: int) -> List[Benchmark]:
+    return [Benchmark(f'from_data_to/{name}/validation_on',
+                      lambda: from_data_to(annotation, data), objects_count),
+            Benchmark(f'from_data_to/{name}/validation_off',
+                      lambda: from_data_to(annotation, data, checks_validation=False, includes_none=False),
+                      objects_count)]
+
+
+def _create_serialization_benchmarks(name: Text, instance: Any, objects_count: int) -> List[Benchmark]:
+    return [Benchmark(f'to_json_from/{name}', lambda: to_json_from(instance), objects_count),
+            Benchmark(f'to_json_bytes_from/{name}', lambda: to_json_bytes_from(instance), objects_count)]
+
+
+def create_benchmarks() -> List[Benchmark]:
+    flat_data: JsonFormat = _create_flat_data(1)
+    flat_list_data: JsonFormat = [_create_flat_data(index) for index in range(LIST_SIZE)]
+    flat_dict_data: JsonFormat = {f'key{index}': _create_flat_data(index) for index in range(DICT_SIZE)}
+    nested_data: JsonFormat = _create_nested_data(NESTED_DEPTH)
+    nested_objects_count: int = _count_nested_objects(NESTED_DEPTH)
+    shapes_data: JsonFormat = _create_shapes_data()
+    figures_data: JsonFormat = _create_figures_data()
+    cases: List[Tuple[Text, Any, JsonFormat, int]] = [
+        ('dataclass', FlatItem, flat_data, 1),
+        ('named_tuple', TupleItem, flat_data, 1),
+        ('slotdataclass', SlotItem, flat_data, 1),
+        ('nested_dataclass', NestedItem, nested_data, nested_objects_count),
+        ('list_dataclass', List[FlatItem], flat_list_data, LIST_SIZE),
+        ('list_slotdataclass', List[SlotItem], flat_list_data, LIST_SIZE),
+        ('dict_dataclass', Dict[Text, FlatItem], flat_dict_data, DICT_SIZE),
+        ('tagged_union', Shapes, shapes_data, LIST_SIZE),
+        ('union_enum', Figures, figures_data, LIST_SIZE),
+    ]
+
+    benchmarks: List[Benchmark] = []
+    for name, annotation, data, objects_count in cases:
+        benchmarks.extend(_create_deserialization_benchmarks(name, annotation, data, objects_count))
+
+    for name, annotation, data, objects_count in cases:
+        benchmarks.extend(_create_serialization_benchmarks(name, from_data_to(annotation, data), objects_count))
+
+    return benchmarks
+
+
+if __name__ == '__main__':
+    run_benchmarks(create_benchmarks())
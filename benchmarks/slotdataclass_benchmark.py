@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Any, Callable, List, NamedTuple, Text, Tuple
+
+from benchmarks.benchmark import Benchmark, run_benchmarks
+from slotdataclass import slotdataclass
+
+INSTANCES_COUNT: int = 10000
+
+
+@dataclass
+class DataItem:
+    a: int
+    b: float
+    c: Text
+    d: bool = False
+
+
+class TupleItem(NamedTuple):
+    a: int
+    b: float
+    c: Text
+    d: bool = False
+
+
+@slotdataclass
+class SlotItem:
+    a: int
+    b: float
+    c: Text
+    d: bool = False
+
+
+@slotdataclass(frozen=True)
+class FrozenSlotItem:
+    a: int
+    b: float
+    c: Text
+    d: bool = False
+
+
+def _create_instances(cls: Callable[..., Any]) -> List[Any]:
+    return [cls(index, index / 2, 'text') for index in range(INSTANCES_COUNT)]
+
+
+def _sum_attributes(instances: List[Any]) -> float:
+    total: float = 0
+    for instance in instances:
+        total += instance.a + instance.b
+
+    return total
+
+
+def create_benchmarks() -> List[Benchmark]:
+    """The peak allocated bytes of 'create' divided by the objects count is the memory of an instance."""
+    cases: List[Tuple[Text, Callable[..., Any]]] = [('dataclass', DataItem), ('named_tuple', TupleItem),
+                                                     ('slotdataclass', SlotItem),
+                                                     ('frozen_slotdataclass', FrozenSlotItem)]
+    benchmarks: List[Benchmark] = []
+    for name, cls in cases:
+        instances: List[Any] = _create_instances(cls)
+        benchmarks.append(Benchmark(f'create/{name}', lambda cls_=cls: _create_instances(cls_), INSTANCES_COUNT))
+        benchmarks.append(Benchmark(f'getattr/{name}', lambda instances_=instances: _sum_attributes(instances_),
+                                    INSTANCES_COUNT))
+
+    return benchmarks
+
+
+if __name__ == '__main__':
+    run_benchmarks(create_benchmarks())
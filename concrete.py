@@ -1,5 +1,6 @@
 from functools import singledispatch
-from typing import Any, Callable, Text, Tuple, Type, Union, cast, overload
+from importlib import import_module
+from typing import Any, Callable, Optional, Text, Tuple, Type, Union, cast, overload
 
 
 @overload
@@ -40,6 +41,7 @@ class AbstractMeta(type):
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
         cls.concrete: Type = cls
+        cls.concrete_module: Optional[Text] = None
 
     def set_concrete(cls, concrete_: Type, allow_overwrite=False):
         if not allow_overwrite and cls.concrete is not cls:
@@ -47,7 +49,25 @@ class AbstractMeta(type):
 
         cls.concrete = concrete_
 
+    def set_concrete_module(cls, module_name: Text):
+        """Register the module defining the concrete class, imported the first time the class is instantiated."""
+        cls.concrete_module = module_name
+
+    def load_concrete(cls) -> Type:
+        """Import the registered module of the concrete class unless a concrete class is already set."""
+        module_name: Optional[Text] = cls.concrete_module
+        if module_name is not None:
+            if cls.concrete is cls:
+                import_module(module_name)
+
+            cls.concrete_module = None
+
+        return cls.concrete
+
     def __call__(cls, *args, **kwargs) -> Any:
+        if cls.concrete_module is not None:
+            cls.load_concrete()
+
         instance: cls.concrete = object.__new__(cls.concrete)
         instance.__init__(*args, **kwargs)
         return instance
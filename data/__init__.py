@@ -1,8 +1,10 @@
 from data.data_type import *
 from data.data_receiver import *
 from data.data_sender import *
+from data.loopback_data_sender import *
 from data.http_status import *
+from data.http_status import _HTTPStatusListBase
 
-import data.data_receiver_concrete
-import data.data_sender_concrete
-import data.http_status_concrete
+DataReceiver.set_concrete_module('data.data_receiver_concrete')
+DataSender.set_concrete_module('data.data_sender_concrete')
+_HTTPStatusListBase.set_concrete_module('data.http_status_concrete')
@@ -2,12 +2,15 @@ from dataclasses import dataclass
 from functools import lru_cache, singledispatch
 from inspect import Parameter, signature
 from types import FunctionType
-from typing import Any, Callable, Coroutine, List, Text, Tuple, ValuesView, overload
+from time import perf_counter
+from typing import (Any, Callable, Coroutine, Dict, List, Optional, Text, Tuple, Union, ValuesView, get_type_hints,
+                    overload)
 
 from async_util import await_or_not
 from concrete import AbstractMeta
 from data import DEFAULT_KEY, ErrorData, create_error_data, get_error_full_context
-from json_data import JsonFormat, from_data_to, to_json_from
+from json_data import (JsonFormat, async_from_data_to, from_data_to, from_json_bytes, to_json_bytes_from, to_json_from,
+                       warm_up_deserializer, warm_up_serializer)
 from logger import get_logger
 from slotdataclass import slotdataclass
 
@@ -19,15 +22,23 @@ RECEIVER_KEY: Text = "Receiver"
 @slotdataclass
 @dataclass
 class Receiver:
+    """Receiver of the data of the key.
+
+    With 'parallel_threshold', lists of that many elements or more are deserialized by 'async_from_data_to' on the
+    executor set by 'set_parallel_deserialization', worth it with spare cores only.
+    """
     call: Callable[[Any], Any]
     key: Text = DEFAULT_KEY
+    parallel_threshold: Optional[int] = None
     
 
 class DataReceiver(metaclass=AbstractMeta):
     def __init__(self, *receivers: Receiver, **kwargs):
         self.initialize(**kwargs)
 
-        def receive(data: JsonFormat, key: Text = DEFAULT_KEY) -> Coroutine[Any, Any, JsonFormat]:
+        def receive(data: Union[JsonFormat, bytes],
+                    key: Text = DEFAULT_KEY) -> Coroutine[Any, Any, Union[JsonFormat, bytes]]:
+            """Return the response as JSON bytes if the data is given as JSON bytes."""
             return _receive_to_receivers(data, receivers, key)
 
         self.route(receive, **kwargs)
@@ -36,34 +47,53 @@ class DataReceiver(metaclass=AbstractMeta):
         """Function that can be used by overriding when initial setting is required."""
         pass
 
-    def route(self, receive: Callable[[JsonFormat, Text], Coroutine[Any, Any, JsonFormat]], **kwargs):
+    def route(self, receive: Callable[[Union[JsonFormat, bytes], Text], Coroutine[Any, Any, Union[JsonFormat, bytes]]],
+              **kwargs):
         pass
 
 
+@singledispatch
 async def _receive_to_receivers(data: JsonFormat, receivers: Tuple[Receiver, ...], key: Text) -> JsonFormat:
+    responses: List[JsonFormat] = await _get_responses(data, receivers, key, to_json_from)
+    return responses[0] if len(responses) == 1 else responses
+
+
+@_receive_to_receivers.register(bytes)
+async def _(body: bytes, receivers: Tuple[Receiver, ...], key: Text) -> bytes:
+    try:
+        data: JsonFormat = from_json_bytes(body)
+    except Exception as e:
+        return _handle_error(e, to_json_bytes_from)
+
+    responses: List[bytes] = await _get_responses(data, receivers, key, to_json_bytes_from)
+    return responses[0] if len(responses) == 1 else b'[' + b','.join(responses) + b']'
+
+
+async def _get_responses(data: JsonFormat, receivers: Tuple[Receiver, ...], key: Text,
+                         encode: Callable[[Any], Any]) -> List[Any]:
     selected_receivers: List[Receiver] = [receiver for receiver in receivers if receiver.key == key]
     if len(selected_receivers) <= 0:
         error: NoReceiverError = NoReceiverError(key)
-        return _handle_error(error)
+        return [_handle_error(error, encode)]
 
-    responses: List[JsonFormat] = [await _receive_to_receiver(data, receiver) for receiver in selected_receivers]
-    return responses[0] if len(responses) == 1 else responses
+    return [await _receive_to_receiver(data, receiver, encode) for receiver in selected_receivers]
 
 
-async def _receive_to_receiver(data: JsonFormat, receiver: Receiver) -> JsonFormat:
+async def _receive_to_receiver(data: JsonFormat, receiver: Receiver, encode: Callable[[Any], Any]) -> Any:
     try:
         data_type: Any = _get_first_parameter_type(receiver.call)
-        data_instance: Any = from_data_to(data_type, data)
+        data_instance: Any = (from_data_to(data_type, data) if receiver.parallel_threshold is None
+                              else await async_from_data_to(data_type, data, threshold=receiver.parallel_threshold))
         response_instance: Any = await await_or_not(receiver.call(data_instance))
-        return to_json_from(response_instance)
+        return encode(response_instance)
     except Exception as e:
-        return _handle_error(e)
+        return _handle_error(e, encode)
 
 
-def _handle_error(error: Exception) -> JsonFormat:
+def _handle_error(error: Exception, encode: Callable[[Any], Any]) -> Any:
     _logger.error(get_error_full_context(error))
     error_data: ErrorData = create_error_data(error)
-    return to_json_from(error_data)
+    return encode(error_data)
 
 
 @lru_cache
@@ -80,6 +110,31 @@ def _get_first_parameter_type(func: Callable) -> Any:
     return annotation if annotation is not Parameter.empty else Any
 
 
+def warm_up(*receivers: Receiver):
+    """Compile the deserializers of the data and the serializers of the responses of the receivers ahead.
+
+    Call it before receiving data so that the first data is not slower than the others.
+    """
+    start_time: float = perf_counter()
+    for receiver in receivers:
+        try:
+            warm_up_deserializer(_get_first_parameter_type(receiver.call))
+            warm_up_serializer(_get_return_type(receiver.call))
+        except Exception as e:
+            raise WarmUpError(receiver, e) from e
+
+    _logger.info(f"Warmed up {len(receivers)} receivers in {(perf_counter() - start_time) * 1000:.1f} ms.")
+
+
+def _get_return_type(func: Callable) -> Any:
+    try:
+        type_hints: Dict[Text, Any] = get_type_hints(func)
+    except Exception:
+        type_hints = {}
+
+    return type_hints.get('return', Any)
+
+
 _registered_receivers: List[Receiver] = []
 
 
@@ -119,3 +174,12 @@ class NoReceiverError(Exception):
 
     def __str__(self) -> Text:
         return self.message
+
+
+class WarmUpError(Exception):
+    def __init__(self, receiver: Receiver, error: Exception):
+        self.message: Text = (f"Fail to warm up the receiver '{getattr(receiver.call, '__name__', receiver.call)}' "
+                              f"for the key '{receiver.key}': {error}")
+
+    def __str__(self) -> Text:
+        return self.message
@@ -1,7 +1,7 @@
 from sanic import Sanic
 from sanic.request import Request
-from sanic.response import HTTPResponse, json
-from typing import Any, Callable, Coroutine, Text
+from sanic.response import HTTPResponse, raw
+from typing import Any, Callable, Coroutine, Text, Union
 
 from concrete import concrete
 from data import DEFAULT_KEY
@@ -12,6 +12,7 @@ from json_data import JsonFormat
 URL_PARAMETER: Text = 'url'
 HOST_PARAMETER: Text = 'host'
 PORT_PARAMETER: Text = 'port'
+JSON_CONTENT_TYPE: Text = 'application/json'
 
 add_argument(RECEIVER_KEY, URL_PARAMETER, default='/')
 add_argument(RECEIVER_KEY, HOST_PARAMETER, default='0.0.0.0')
@@ -20,7 +21,8 @@ add_argument(RECEIVER_KEY, PORT_PARAMETER, default=8000, type_converter=int, des
 
 @concrete
 class SanicDataReceiver(DataReceiver):
-    def route(self, receive: Callable[[JsonFormat, Text], Coroutine[Any, Any, JsonFormat]], **kwargs):
+    def route(self, receive: Callable[[Union[JsonFormat, bytes], Text], Coroutine[Any, Any, Union[JsonFormat, bytes]]],
+              **kwargs):
         def handle(request: Request, key: Text) -> Coroutine[Any, Any, HTTPResponse]:
             return _handle_to(request, receive, key)
         app: Sanic = Sanic("Sanic Data Receiver")
@@ -37,7 +39,8 @@ def _get_key_url(base_url: Text) -> Text:
     return f"{base_url if base_url[-1] != '/' else base_url[0:-1]}/<key>"
 
 
-async def _handle_to(request: Request, receive: Callable[[JsonFormat, Text], Coroutine[Any, Any, JsonFormat]],
+async def _handle_to(request: Request,
+                     receive: Callable[[Union[JsonFormat, bytes], Text], Coroutine[Any, Any, Union[JsonFormat, bytes]]],
                      key: Text) -> HTTPResponse:
-    response: JsonFormat = await receive(request.json, key)
-    return json(response)
+    response: bytes = await receive(request.body, key)
+    return raw(response, content_type=JSON_CONTENT_TYPE)
@@ -4,7 +4,8 @@ from typing import Any, Dict, List, NamedTuple, Optional, Text, Tuple, Type, Uni
 
 from async_util import await_or_not
 from concrete import AbstractMeta
-from data import (DEFAULT_KEY, ErrorData, JsonFormat, ResponseError, from_data_to, is_error_data, to_json_from)
+from data import (DEFAULT_KEY, ErrorData, JsonFormat, ResponseError, from_data_to, from_json_bytes, is_error_data,
+                  to_json_bytes_from, to_json_from)
 
 SENDER_KEY: Text = "Sender"
 
@@ -20,6 +21,21 @@ class DataSender(metaclass=AbstractMeta):
     async def send(self, data: JsonFormat, key: Text = DEFAULT_KEY, **kwargs) -> JsonFormat:
         pass
 
+    async def send_bytes(self, body: bytes, key: Text = DEFAULT_KEY, **kwargs) -> Union[bytes, JsonFormat]:
+        """Send the JSON bytes of the data and return the response as JSON bytes or as already decoded JSON.
+
+        Override it to send the bytes as they are. Otherwise, the bytes are decoded and sent by 'send'.
+        """
+        return await await_or_not(self.send(from_json_bytes(body), key, **kwargs))
+
+    async def send_instance(self, data: Any, response_type: Type, key: Text = DEFAULT_KEY,
+                            **kwargs) -> List[Union[Any, Exception]]:
+        """Send the instance and return each response as an instance of the type, or as the error of the response."""
+        response_data: Union[JsonFormat, Exception] = await _get_response_data(self, data, key, **kwargs)
+        response_data_list: List[Union[JsonFormat, Exception]] = (response_data if isinstance(response_data, list)
+                                                                  else [response_data])
+        return [_try_get_instance_from(response_type, response_data) for response_data in response_data_list]
+
 
 class _MainSender:
     _sender: Optional[DataSender] = None
@@ -40,6 +56,11 @@ def pass_sender_arguments(**kwargs):
     _MainSender.set(DataSender(**kwargs))
 
 
+def set_sender(sender: DataSender):
+    """Set the sender used by 'send' when no sender is given."""
+    _MainSender.set(sender)
+
+
 class Response(NamedTuple):
     instance: Union[Any, List]
     error: Union[Exception, List[Exception]]
@@ -67,11 +88,8 @@ async def _send_implementation(data: Any, response_type: Type, key: Text = DEFAU
 @_send_implementation.register(DataSender)
 async def _(sender: DataSender, data: Any, response_type: Type, key: Text = DEFAULT_KEY,
             **kwargs) -> Response:
-    response_data: Union[JsonFormat, Exception] = await _get_response_data(sender, data, key, **kwargs)
-    response_data_list: List[Union[JsonFormat, Exception]] = (response_data if isinstance(response_data, list)
-                                                              else [response_data])
-    instance_list: List[Union[response_type, Exception]]\
-        = [_try_get_instance_from(response_type, response_data) for response_data in response_data_list]
+    instance_list: List[Union[response_type, Exception]] = await sender.send_instance(data, response_type, key,
+                                                                                      **kwargs)
     instance_groups: Dict[bool, List[Union[response_type, Exception]]]\
         = {not is_exception: list(instances) for is_exception, instances
            in groupby(instance_list, key=lambda instance_: isinstance(instance_, Exception))}
@@ -81,13 +99,21 @@ async def _(sender: DataSender, data: Any, response_type: Type, key: Text = DEFA
 
 
 async def _get_response_data(sender: DataSender, data: Any, key: Text, **kwargs) -> Union[JsonFormat, Exception]:
-    json_data: JsonFormat = to_json_from(data)
+    """Send the data as JSON bytes to the senders sending bytes, and as JSON to the others."""
+    sends_bytes: bool = _sends_bytes(sender)
+    encoded: Union[bytes, JsonFormat] = to_json_bytes_from(data) if sends_bytes else to_json_from(data)
     try:
-        return await await_or_not(sender.send(json_data, key, **kwargs))
+        response_data: Union[bytes, JsonFormat] = await await_or_not(
+            sender.send_bytes(encoded, key, **kwargs) if sends_bytes else sender.send(encoded, key, **kwargs))
+        return from_json_bytes(response_data) if isinstance(response_data, bytes) else response_data
     except Exception as e:
         return e
 
 
+def _sends_bytes(sender: DataSender) -> bool:
+    return type(sender).send_bytes is not DataSender.send_bytes
+
+
 def _try_get_instance_from(data_type: Type, data: Union[JsonFormat, Exception]) -> Union[JsonFormat, Exception]:
     try:
         return _get_instance_from(data_type, data)
@@ -106,6 +132,11 @@ def _get_instance_from(data_type: Type, data: Union[JsonFormat, Exception]) -> U
     return from_data_to(data_type, data)
 
 
+def from_response_bytes_to(data_type: Type, body: bytes) -> Union[Any, ResponseError]:
+    """Decode the JSON bytes of a response to the instance of the type, or to 'ResponseError' if it is an error."""
+    return _get_instance_from(data_type, from_json_bytes(body))
+
+
 def _get_single_or_lists(*single_or_lists: Optional[List]) -> Union[Any, List, None, Tuple]:
     if len(single_or_lists) <= 1:
         return _get_single_or_list(single_or_lists[0])
@@ -1,32 +1,36 @@
 from aiohttp import ClientSession, ClientResponse
 from functools import lru_cache
-from typing import Text
+from typing import Dict, Text
 
 from concrete import concrete
-from data import DEFAULT_KEY, HTTPStatusError, JsonFormat
+from data import DEFAULT_KEY, HTTPStatusError, JsonFormat, from_json_bytes, to_json_bytes_from
 from data.data_sender import DataSender
 
 URL_PARAMETER: Text = 'url'
+_JSON_HEADERS: Dict[Text, Text] = {'Content-Type': 'application/json'}
 
 
 @concrete
 class AIOHTTPDataSender(DataSender):
     async def send(self, data: JsonFormat, key: Text = DEFAULT_KEY, **kwargs) -> JsonFormat:
+        return from_json_bytes(await self.send_bytes(to_json_bytes_from(data), key, **kwargs))
+
+    async def send_bytes(self, body: bytes, key: Text = DEFAULT_KEY, **kwargs) -> bytes:
         if URL_PARAMETER not in kwargs:
             raise URLNotFoundError()
 
         url: Text = kwargs[URL_PARAMETER]
         key_url: Text = _get_key_url(url, key)
         async with ClientSession() as session:
-            async with session.post(key_url, json=data) as response:
+            async with session.post(key_url, data=body, headers=_JSON_HEADERS) as response:
                 return await _get_data(response)
 
 
-async def _get_data(response: ClientResponse) -> JsonFormat:
+async def _get_data(response: ClientResponse) -> bytes:
     if 400 <= response.status:
         raise HTTPStatusError(response.status)
 
-    return await response.json()
+    return await response.read()
 
 
 @lru_cache
@@ -0,0 +1,109 @@
+from typing import Any, Iterable, List, Optional, Set, Text, Tuple, Type, Union
+
+from async_util import await_or_not
+from data import DEFAULT_KEY, JsonFormat, ResponseError, from_data_to, to_json_from
+from data.data_receiver import (NoReceiverError, Receiver, _get_first_parameter_type, _handle_error,
+                                _receive_to_receivers, get_registered_receivers)
+from data.data_sender import DataSender, _try_get_instance_from
+
+URL_PARAMETER: Text = 'url'
+_LOCAL_HOSTS: Tuple[Text, ...] = ('0.0.0.0', '127.0.0.1', 'localhost')
+
+
+class LoopbackDataSender(DataSender):
+    """Sender calling the receivers of this process directly instead of sending the data to its own server.
+
+    The data is sent locally when the key is one of 'local_keys', or when a receiver has the key and the url is
+    not given or is one of 'local_urls'. Otherwise, it is sent by the fallback sender made of the other arguments.
+    With 'passes_instance', the instances are passed to the receivers and returned as they are when they are of the
+    annotated types, without the JSON round trip, so the receivers must not modify them.
+    """
+    receivers: Optional[Tuple[Receiver, ...]]
+    local_keys: Set[Text]
+    local_urls: Set[Text]
+    passes_instance: bool
+
+    def initialize(self, receivers: Optional[Iterable[Receiver]] = None, *, local_keys: Iterable[Text] = (),
+                   local_urls: Iterable[Text] = (), passes_instance: bool = False, **kwargs):
+        self.receivers = tuple(receivers) if receivers is not None else None
+        self.local_keys = set(local_keys)
+        self.local_urls = {_normalize_url(url) for url in local_urls}
+        self.passes_instance = passes_instance
+        self._fallback_arguments = kwargs
+        self._fallback: Optional[DataSender] = None
+
+    def is_local(self, key: Text = DEFAULT_KEY, **kwargs) -> bool:
+        if key in self.local_keys:
+            return True
+
+        url: Optional[Text] = kwargs.get(URL_PARAMETER, None)
+        return (url is None or _normalize_url(url) in self.local_urls) and 0 < len(self._get_receivers(key))
+
+    async def send(self, data: JsonFormat, key: Text = DEFAULT_KEY, **kwargs) -> JsonFormat:
+        if not self.is_local(key, **kwargs):
+            return await await_or_not(self._get_fallback().send(data, key, **kwargs))
+
+        return await _receive_to_receivers(data, self._get_receivers(key), key)
+
+    async def send_bytes(self, body: bytes, key: Text = DEFAULT_KEY, **kwargs) -> Union[bytes, JsonFormat]:
+        if not self.is_local(key, **kwargs):
+            return await await_or_not(self._get_fallback().send_bytes(body, key, **kwargs))
+
+        return await _receive_to_receivers(body, self._get_receivers(key), key)
+
+    async def send_instance(self, data: Any, response_type: Type, key: Text = DEFAULT_KEY,
+                            **kwargs) -> List[Union[Any, Exception]]:
+        if not self.passes_instance or not self.is_local(key, **kwargs):
+            return await super().send_instance(data, response_type, key, **kwargs)
+
+        receivers: Tuple[Receiver, ...] = self._get_receivers(key)
+        if len(receivers) <= 0:
+            return [_handle_error(NoReceiverError(key), ResponseError)]
+
+        responses: List[Any] = [await _receive_instance(data, receiver, response_type) for receiver in receivers]
+        if len(responses) == 1 and isinstance(responses[0], list):
+            responses = responses[0]
+
+        return [response if isinstance(response, Exception) or _is_instance(response, response_type)
+                else _try_get_instance_from(response_type, response) for response in responses]
+
+    def _get_receivers(self, key: Text) -> Tuple[Receiver, ...]:
+        receivers: Iterable[Receiver] = self.receivers if self.receivers is not None else get_registered_receivers()
+        return tuple(receiver for receiver in receivers if receiver.key == key)
+
+    def _get_fallback(self) -> DataSender:
+        if self._fallback is None:
+            self._fallback = DataSender(**self._fallback_arguments)
+
+        return self._fallback
+
+
+async def _receive_instance(data: Any, receiver: Receiver, response_type: Type) -> Any:
+    """Return the response as it is when it is of the type, or as JSON like it is sent by the server."""
+    try:
+        data_type: Any = _get_first_parameter_type(receiver.call)
+        data_instance: Any = data if _is_instance(data, data_type) else from_data_to(data_type, to_json_from(data))
+        response: Any = await await_or_not(receiver.call(data_instance))
+        return response if _is_instance(response, response_type) else to_json_from(response)
+    except Exception as e:
+        return _handle_error(e, ResponseError)
+
+
+def _is_instance(value: Any, annotation: Any) -> bool:
+    return annotation is not Any and isinstance(annotation, type) and isinstance(value, annotation)
+
+
+def _normalize_url(url: Text) -> Text:
+    return url[0:-1] if url.endswith('/') else url
+
+
+def get_local_urls(**kwargs) -> List[Text]:
+    """Return the urls of the server run by the receiver arguments, 'url', 'host' and 'port'."""
+    host: Optional[Text] = kwargs.get('host', None)
+    port: Optional[int] = kwargs.get('port', None)
+    if host is None or port is None:
+        return []
+
+    url: Text = kwargs.get(URL_PARAMETER, '/')
+    hosts: Tuple[Text, ...] = _LOCAL_HOSTS if host in _LOCAL_HOSTS else (host,)
+    return [f"http://{host_}:{port}{url}" for host_ in hosts]
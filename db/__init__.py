@@ -1,4 +1,4 @@
 from db.data_access_object import *
 from db.db_connector import *
 
-import db.db_connector_concrete
+DBConnector.set_concrete_module('db.db_connector_concrete')
@@ -52,15 +52,12 @@ class DataAccessObject(_IDataAccessObject):
     def select_where(self, condition: Text, *args, should_return_single: bool) -> Union[Any, List, None]:
         ...
 
-    def select_where(self, *args, **kwargs) -> Union[Any, List, None]:
-        return self._select_where_implementation(*args, **kwargs)
-
     @methoddispatcher
-    def _select_where_implementation(self, condition: Any, should_return_single: bool) -> Union[Any, List, None]:
+    def select_where(self, condition: Any, should_return_single: bool) -> Union[Any, List, None]:
         condition_sql, args = _convert_to_condition(condition, ' and ')
         return self.__select_where_implementation(condition_sql, *args, should_return_single=should_return_single)
 
-    @_select_where_implementation.register(str)
+    @select_where.register(str)
     def __select_where_implementation(self, condition: Text, *args,
                                       should_return_single: bool) -> Union[Any, List, None]:
         sql: Text = f"select * from {self.table_name} where {condition}"
@@ -85,15 +82,12 @@ class DataAccessObject(_IDataAccessObject):
     def update_where(self, data_object: Any, condition: Text, *condition_args) -> int:
         ...
 
-    def update_where(self, *args, **kwargs) -> int:
-        return self._update_where_implementation(*args, **kwargs)
-
     @methoddispatcher(2)
-    def _update_where_implementation(self, data_object: Any, condition: Any) -> int:
+    def update_where(self, data_object: Any, condition: Any) -> int:
         condition_sql, args = _convert_to_condition(condition, ' and ')
         return self.__update_where_implementation(data_object, condition_sql, *args)
 
-    @_update_where_implementation.register(str)
+    @update_where.register(str)
     def __update_where_implementation(self, data_object: Any, condition: Text, *condition_args) -> int:
         update_sql, update_args = _convert_to_condition(data_object, ', ', self.primary_key)
         sql: Text = f"update {self.table_name} set {update_sql} where {condition}"
@@ -110,15 +104,12 @@ class DataAccessObject(_IDataAccessObject):
     def delete_where(self, condition: Text, *args) -> int:
         ...
 
-    def delete_where(self, *args, **kwargs) -> int:
-        return self._delete_where_implementation(*args, **kwargs)
-
     @methoddispatcher
-    def _delete_where_implementation(self, condition: Any) -> int:
+    def delete_where(self, condition: Any) -> int:
         condition_sql, args = _convert_to_condition(condition, ' and ')
         return self.__delete_where_implementation(condition_sql, *args)
 
-    @_delete_where_implementation.register(str)
+    @delete_where.register(str)
     def __delete_where_implementation(self, condition: Text, *args) -> int:
         sql: Text = f"delete from {self.table_name} where {condition}"
         return self.connector.execute(sql, *args, should_return_single=False).changed_count
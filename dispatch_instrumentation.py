@@ -0,0 +1,37 @@
+from typing import Any, Dict, NamedTuple
+
+
+class DispatchStats(NamedTuple):
+    case_hits: Dict[Any, int]
+    default_hits: int
+    predicate_evaluations: int
+    resolution_seconds: float
+
+
+class DispatchInstrumentation:
+    """Counters of a dispatching function, updated only while the instrumentation is enabled on the function."""
+    __slots__ = ('case_hits', 'default_hits', 'predicate_evaluations', 'resolution_seconds')
+
+    def __init__(self):
+        self.case_hits: Dict[Any, int] = {}
+        self.default_hits: int = 0
+        self.predicate_evaluations: int = 0
+        self.resolution_seconds: float = 0.0
+
+    def record_case(self, case_key: Any, resolution_seconds: float):
+        self.case_hits[case_key] = self.case_hits.get(case_key, 0) + 1
+        self.resolution_seconds += resolution_seconds
+
+    def record_default(self, resolution_seconds: float):
+        self.default_hits += 1
+        self.resolution_seconds += resolution_seconds
+
+    def snapshot(self) -> DispatchStats:
+        return DispatchStats(dict(self.case_hits), self.default_hits, self.predicate_evaluations,
+                             self.resolution_seconds)
+
+    def reset(self):
+        self.case_hits = {}
+        self.default_hits = 0
+        self.predicate_evaluations = 0
+        self.resolution_seconds = 0.0
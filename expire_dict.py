@@ -1,80 +1,426 @@
 import asyncio
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from enum import Enum
+from functools import lru_cache
+import gc
+from heapq import heapify, heappop, heappush
+from importlib import import_module
+from itertools import compress, count, repeat
+from math import inf
+import os
+from sys import getsizeof
+from tempfile import mkstemp
+from threading import Event, Lock, Thread
+from time import monotonic, time
+from typing import Any, Awaitable, Callable, Dict, Generic, Iterable, Iterator, List, NamedTuple
+from typing import Optional, Text, Tuple, TypeVar, Union
+from weakref import ReferenceType, ref
+
+from json_data import JsonFormat, JsonObject, from_json_bytes, to_json_bytes_from
+from logger import get_logger
 from slotdataclass import slotdataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 KeyType = TypeVar("KeyType")
 ValueType = TypeVar("ValueType")
 
+_MISSING: Any = object()
+_DEFAULT_REFRESH_RATIO: float = 0.5
+_REFRESH_RETRY_RATIO: float = 0.05
+_SNAPSHOT_VERSION: int = 2
+_key_types: Tuple[type, ...] = (str, int, float, bool, type(None))
+
+_logger = get_logger(__name__)
+
+
+class Eviction(Enum):
+    LRU = 'lru'
+    LFU = 'lfu'
+
+
+class ExpireDictStats(NamedTuple):
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    count: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups_count: int = self.hits + self.misses
+        return self.hits / lookups_count if 0 < lookups_count else 0.0
+
 
 @slotdataclass
-@dataclass
-class _Item:
-    set_time: datetime
-    item: ValueType
+class _Entry:
+    value: Any
+    life_time: float
+    expire_time: float
+    size: int = 0
+    refresh_time: float = inf
+    deadline: float = inf
+    refresh_failures: int = 0
+
+
+class _LRUPolicy:
+    def __init__(self):
+        self.keys: OrderedDict = OrderedDict()
+
+    def add(self, key: Any):
+        self.keys[key] = None
+
+    def touch(self, key: Any):
+        self.keys.move_to_end(key)
+
+    def remove(self, key: Any):
+        del self.keys[key]
+
+    def get_victim(self) -> Any:
+        return next(iter(self.keys))
+
+
+class _LFUPolicy:
+    """Keys in buckets per access count, evicting the least recently used key of the least accessed ones."""
+    def __init__(self):
+        self.frequencies: Dict[Any, int] = {}
+        self.buckets: Dict[int, OrderedDict] = {}
+        self.min_frequency: int = 0
+
+    def add(self, key: Any):
+        self._link(key, 1)
+        self.min_frequency = 1
+
+    def touch(self, key: Any):
+        frequency: int = self.frequencies[key]
+        self._unlink(key, frequency)
+        self._link(key, frequency + 1)
+        if self.min_frequency == frequency and frequency not in self.buckets:
+            self.min_frequency = frequency + 1
+
+    def remove(self, key: Any):
+        self._unlink(key, self.frequencies.pop(key))
+
+    def get_victim(self) -> Any:
+        if self.min_frequency not in self.buckets:
+            self.min_frequency = min(self.buckets)
+
+        return next(iter(self.buckets[self.min_frequency]))
+
+    def _link(self, key: Any, frequency: int):
+        self.frequencies[key] = frequency
+        bucket: Optional[OrderedDict] = self.buckets.get(frequency, None)
+        if bucket is None:
+            bucket = self.buckets[frequency] = OrderedDict()
+
+        bucket[key] = None
+
+    def _unlink(self, key: Any, frequency: int):
+        bucket: OrderedDict = self.buckets[frequency]
+        del bucket[key]
+        if len(bucket) <= 0:
+            del self.buckets[frequency]
 
-    @staticmethod
-    def create(item: ValueType) -> "_Item":
-        return _Item(datetime.now(), item)
 
-    def reset_time(self):
-        self.set_time = datetime.now()
+_EvictionPolicy = Union[_LRUPolicy, _LFUPolicy]
 
 
 class ExpireDict(Generic[KeyType, ValueType]):
-    def __init__(self, life_time: int, expire_cycle: int, **kwargs):
-        self.life_time: timedelta = timedelta(seconds=life_time)
-        self.expire_cycle: int = expire_cycle
+    """Dictionary removing the items which are not accessed during their life time, checked every 'expire_cycle'
+    on the event loop, or only by 'expire' when the cycle is None.
+
+    The items of the life time of the dict are kept in the order of the access, and an access moves the item to the
+    end. The items set with their own life time are kept in a heap by their expire time, put off when popped if they
+    are accessed meanwhile. So expiring the items looks at the expired items only, and an expired item is missing
+    even before it is removed.
+    Bounded by 'max_count' items or about 'max_size' bytes measured by 'sizeof' for the key and the value, it evicts
+    the items by the eviction policy after removing the expired items.
+    With a 'loader', an item accessed once it is older than 'refresh_ratio' of its life time is loaded again by a task
+    of the running event loop, serving the current value meanwhile. A failed refresh is tried again after 5% of the
+    life time, doubled on every failure. An item not loaded again successfully is missing once it is older than
+    'max_age', its life time by default, even if it is accessed, and removed by 'expire'. A load finishing after the
+    item is set or deleted does not set the item.
+    """
+    def __init__(self, life_time: float, expire_cycle: Optional[float], *, max_count: Optional[int] = None,
+                 max_size: Optional[int] = None, eviction: Eviction = Eviction.LRU,
+                 loader: Optional[Callable[[KeyType], Awaitable[ValueType]]] = None,
+                 refresh_ratio: float = _DEFAULT_REFRESH_RATIO, max_age: Optional[float] = None,
+                 sizeof: Callable[[Any], int] = getsizeof, clock: Callable[[], float] = monotonic, **kwargs):
+        self.life_time: float = life_time
+        self.expire_cycle: Optional[float] = expire_cycle
+        self.max_count: Optional[int] = max_count
+        self.max_size: Optional[int] = max_size
+        self.loader: Optional[Callable[[KeyType], Awaitable[ValueType]]] = loader
+        self.refresh_ratio: float = refresh_ratio
+        self.max_age: Optional[float] = max_age
+        self._sizeof: Callable[[Any], int] = sizeof
+        self._clock: Callable[[], float] = clock
         self._expire_handler: Optional[asyncio.TimerHandle] = None
-        self._dict: Dict[KeyType, _Item] = dict(kwargs)
+        self._dict: Dict[KeyType, _Entry] = {}
+        self._queue: OrderedDict[KeyType, _Entry] = OrderedDict()
+        self._overrides: List[Tuple[float, int, KeyType, _Entry]] = []
+        self._loads: Dict[KeyType, asyncio.Task] = {}
+        self._deadlines: List[Tuple[float, int, KeyType]] = []
+        self._orders: Iterator[int] = count()
+        self._policy: Optional[_EvictionPolicy] = (None if max_count is None and max_size is None
+                                                   else _LFUPolicy() if eviction is Eviction.LFU else _LRUPolicy())
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._expirations: int = 0
+        self._evictions: int = 0
+        for key, value in kwargs.items():
+            self[key] = value
 
     def __getitem__(self, key: KeyType) -> ValueType:
-        item: _Item = self._dict.__getitem__(key)
-        item.reset_time()
-        return item.item
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        if entry is None:
+            self._misses += 1
+            raise KeyError(key)
+
+        now: float = self._clock()
+        if entry.expire_time <= now or entry.deadline <= now:
+            self._misses += 1
+            self._expirations += 1
+            self._remove(key, entry)
+            raise KeyError(key)
+
+        self._hits += 1
+        self._touch(key, entry, now)
+        if entry.refresh_time <= now:
+            self._start_refresh(key)
+
+        return entry.value
 
     def __setitem__(self, key: KeyType, value: ValueType):
+        self.set(key, value)
+
+    def set(self, key: KeyType, value: ValueType, life_time: Optional[float] = None):
+        """Set the item living for 'life_time' seconds since the last access, or for the life time of the dict."""
+        life_time = self.life_time if life_time is None else life_time
+        self._loads.pop(key, None)
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        if entry is not None:
+            self._unlink(key, entry)
+
+        size: int = self._sizeof(key) + self._sizeof(value) if self.max_size is not None else 0
+        if self._policy is not None:
+            self._make_room(size)
+
         if self._is_empty():
             self._start_auto_expire()
 
-        return self._dict.__setitem__(key, _Item.create(value))
+        now: float = self._clock()
+        entry = _Entry(value, life_time, now + life_time, size)
+        if self.loader is not None:
+            entry.refresh_time = now + life_time * self.refresh_ratio
+            entry.deadline = now + (life_time if self.max_age is None else self.max_age)
+            self._push_deadline(key, entry.deadline)
 
-    def __delitem__(self, key: KeyType):
-        if self._has_single_item():
-            self._stop_auto_expire()
+        self._dict[key] = entry
+        if life_time == self.life_time:
+            self._queue[key] = entry
+        else:
+            self._push_override(key, entry)
+        if self._policy is not None:
+            self._policy.add(key)
+            self._size += size
 
-        return self._dict.__delitem__(key)
+    def __delitem__(self, key: KeyType):
+        self._remove(key, self._dict[key])
+        self._loads.pop(key, None)
 
     def get(self, key: KeyType, default: Optional[ValueType] = None) -> ValueType:
-        item: Any = self._dict.get(key, default)
-        if not isinstance(item, _Item):
-            return item
-
-        item.reset_time()
-        return item.item
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def setdefault(self, key: KeyType, default: Optional[ValueType] = None) -> ValueType:
-        if key in self:
-            return self[key]
+        value: Any = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
 
-        if self._is_empty():
-            self._start_auto_expire()
+        self[key] = default
+        return default
+
+    def pop(self, key: KeyType, default: Any = _MISSING) -> ValueType:
+        self._loads.pop(key, None)
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        if entry is None or _is_expired(entry, self._clock()):
+            if entry is not None:
+                self._expirations += 1
+                self._remove(key, entry)
+
+            if default is _MISSING:
+                raise KeyError(key)
+
+            return default
 
-        item: _Item = _Item.create(default)
-        self[key] = item
-        return item.item
+        self._remove(key, entry)
+        return entry.value
+
+    def clear(self):
+        for key, entry in list(self._dict.items()):
+            self._unlink(key, entry)
+
+        for load in self._loads.values():
+            load.cancel()
+
+        self._loads = {}
+        self._overrides = []
+        self._deadlines = []
+        self._stop_auto_expire()
 
     def __contains__(self, key: KeyType) -> bool:
-        return self._dict.__contains__(key)
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        return entry is not None and not _is_expired(entry, self._clock())
+
+    def __len__(self) -> int:
+        """Return the count of the items, including the expired items not removed yet."""
+        return len(self._dict)
+
+    def __iter__(self) -> Iterator[KeyType]:
+        return iter(list(self._dict))
+
+    async def fetch(self, key: KeyType) -> ValueType:
+        """Return the value of the key, waiting for the loader to load it if it is missing.
+
+        The calls missing the same key at once wait for the same load, which is also the refresh if one is running.
+        """
+        value: Any = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if self.loader is None:
+            raise KeyError(key)
+
+        load: Optional[asyncio.Task] = self._loads.get(key, None)
+        if load is None:
+            load = self._start_load(key)
+
+        return await asyncio.shield(load)
+
+    def get_stats(self) -> ExpireDictStats:
+        return ExpireDictStats(self._hits, self._misses, self._expirations, self._evictions, len(self._dict),
+                               self._size)
+
+    def reset_stats(self):
+        self._hits = self._misses = self._expirations = self._evictions = 0
+
+    def _touch(self, key: KeyType, entry: _Entry, now: float):
+        entry.expire_time = now + entry.life_time
+        if entry.life_time == self.life_time:
+            self._queue.move_to_end(key)
+        if self._policy is not None:
+            self._policy.touch(key)
+
+    def _start_refresh(self, key: KeyType):
+        if key in self._loads:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._start_load(key).add_done_callback(lambda load: _log_refresh_error(key, load))
+
+    def _start_load(self, key: KeyType) -> asyncio.Task:
+        load: asyncio.Task = asyncio.ensure_future(self._load(key))
+        self._loads[key] = load
+        return load
+
+    async def _load(self, key: KeyType) -> ValueType:
+        try:
+            value: ValueType = await self.loader(key)
+        except Exception:
+            if self._finish_load(key):
+                self._retry_refresh_later(key)
+
+            raise
+
+        if self._finish_load(key):
+            entry: Optional[_Entry] = self._dict.get(key, None)
+            self.set(key, value, None if entry is None else entry.life_time)
+
+        return value
+
+    def _finish_load(self, key: KeyType) -> bool:
+        """Forget the running load, telling whether a set or a delete of the key has not dropped it meanwhile."""
+        if self._loads.get(key, None) is not asyncio.current_task():
+            return False
+
+        del self._loads[key]
+        return True
+
+    def _retry_refresh_later(self, key: KeyType):
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        if entry is None:
+            return
+
+        entry.refresh_time = self._clock() + entry.life_time * _REFRESH_RETRY_RATIO * 2 ** entry.refresh_failures
+        entry.refresh_failures += 1
+
+    def _push_override(self, key: KeyType, entry: _Entry):
+        """Keep the item of its own life time in the heap by the expire time, which is put off lazily by 'expire' if
+        the item is accessed meanwhile. The ones of the items set again or removed are dropped once they outnumber.
+        """
+        heappush(self._overrides, (entry.expire_time, next(self._orders), key, entry))
+        if 2 * len(self._dict) + 16 < len(self._overrides):
+            self._overrides = [item for item in self._overrides if self._dict.get(item[2], None) is item[3]]
+            heapify(self._overrides)
+
+    def _push_deadline(self, key: KeyType, deadline: float):
+        """Keep the deadline for 'expire', dropping the ones of the items set again or removed once they outnumber."""
+        heappush(self._deadlines, (deadline, next(self._orders), key))
+        if 2 * len(self._dict) + 16 < len(self._deadlines):
+            self._deadlines = [item for item in self._deadlines if self._has_deadline(item[2], item[0])]
+            heapify(self._deadlines)
+
+    def _has_deadline(self, key: KeyType, deadline: float) -> bool:
+        entry: Optional[_Entry] = self._dict.get(key, None)
+        return entry is not None and entry.deadline == deadline
+
+    def _make_room(self, size: int):
+        """Remove the expired items, and evict items too if the item of the size still does not fit in."""
+        if not self._is_over_limit(size):
+            return
+
+        self.expire()
+        self._evict(size)
+
+    def _evict(self, added_size: int, added_count: int = 1):
+        while self._is_over_limit(added_size, added_count) and not self._is_empty():
+            key: KeyType = self._policy.get_victim()
+            self._remove(key, self._dict[key])
+            self._evictions += 1
+
+    def _is_over_limit(self, added_size: int, added_count: int = 1) -> bool:
+        return (self.max_count is not None and self.max_count < len(self._dict) + added_count) or \
+            (self.max_size is not None and self.max_size < self._size + added_size)
+
+    def _remove(self, key: KeyType, entry: _Entry):
+        self._unlink(key, entry)
+        if self._is_empty():
+            self._stop_auto_expire()
+
+    def _unlink(self, key: KeyType, entry: _Entry):
+        del self._dict[key]
+        if entry.life_time == self.life_time:
+            del self._queue[key]
+
+        if self._policy is not None:
+            self._policy.remove(key)
+            self._size -= entry.size
 
     def _is_empty(self) -> bool:
         return len(self._dict) <= 0
 
-    def _has_single_item(self) -> bool:
-        return len(self._dict) == 1
-
     def _start_auto_expire(self):
+        if self.expire_cycle is None:
+            return
+
         if self._expire_handler is not None:
             self._stop_auto_expire()
 
@@ -91,17 +437,431 @@ class ExpireDict(Generic[KeyType, ValueType]):
         self._expire_handler = asyncio.get_event_loop().call_later(self.expire_cycle, self._run_auto_expire)
 
     def _run_auto_expire(self):
+        self._expire_handler = None
         self.expire()
         if not self._is_empty():
             self._set_expire_handler()
 
-    def expire(self):
-        now: datetime = datetime.now()
-        del_keys: List[KeyType] = []
-        for key in self._dict.keys():
-            item: _Item = self._dict[key]
-            if item.set_time + self.life_time <= now:
-                del_keys.append(key)
+    def expire(self) -> int:
+        """Remove the expired items, the ones older than 'max_age' too, and return the count of them."""
+        now: float = self._clock()
+        expired_count: int = 0
+        queue: OrderedDict = self._queue
+        while 0 < len(queue):
+            key, entry = next(iter(queue.items()))
+            if now < entry.expire_time:
+                break
+
+            self._remove(key, entry)
+            expired_count += 1
+
+        while 0 < len(self._overrides) and self._overrides[0][0] <= now:
+            _, _, key, entry = heappop(self._overrides)
+            if self._dict.get(key, None) is not entry:
+                continue
+
+            if entry.expire_time <= now:
+                self._remove(key, entry)
+                expired_count += 1
+            else:
+                heappush(self._overrides, (entry.expire_time, next(self._orders), key, entry))
+
+        while 0 < len(self._deadlines) and self._deadlines[0][0] <= now:
+            deadline, _, key = heappop(self._deadlines)
+            if self._has_deadline(key, deadline):
+                self._remove(key, self._dict[key])
+                expired_count += 1
+
+        self._expirations += expired_count
+        return expired_count
+
+    def dump_snapshot(self, path: Text, *, encode: Optional[Callable[[ValueType], JsonFormat]] = None,
+                      encode_key: Optional[Callable[[KeyType], JsonFormat]] = None, pauses_gc: bool = False):
+        """Write the items not expired with their remaining times to the file, which is replaced once written.
+
+        The items are written as columns, the ones of the life time of the dict in the order of their expiry, to be
+        loaded by 'load_snapshot'. The values are encoded as by 'to_json_from' unless the encoder is given. The keys
+        are written as they are, the tuples of them as lists read back as tuples, unless the encoder is given, failing
+        with TypeError for the other keys. With 'pauses_gc', the garbage collector of the whole process, of the other
+        threads too, is stopped while writing, which is faster for many items.
+        """
+        with _pausing_gc() if pauses_gc else nullcontext():
+            now: float = self._clock()
+            queue: JsonObject = _dump_items(list(self._queue), list(self._queue.values()), self.life_time, now,
+                                            encode, encode_key)
+            overridden_items: List[Tuple[KeyType, _Entry]] = [(key, entry) for _, _, key, entry in self._overrides
+                                                              if self._dict.get(key, None) is entry]
+            overrides: JsonObject = _dump_items([key for key, _ in overridden_items],
+                                                [entry for _, entry in overridden_items], None, now, encode, encode_key)
+            body: bytes = to_json_bytes_from({'version': _SNAPSHOT_VERSION, 'time': time(), 'queue': queue,
+                                              'overrides': overrides})
+
+        _write_atomically(path, body)
+
+    def load_snapshot(self, path: Text, *, decode: Optional[Callable[[JsonFormat], ValueType]] = None,
+                      decode_key: Optional[Callable[[JsonFormat], KeyType]] = None, pauses_gc: bool = False) -> int:
+        """Set the items written by 'dump_snapshot' with the times remaining to them when written, less the time
+        passed since then, dropping the items expired meanwhile, and return the count of the items set.
+
+        Decode the values with 'get_deserializer' of their type to get the instances back instead of their JSON.
+        'pauses_gc' stops the garbage collector of the whole process while building the items, like 'dump_snapshot'.
+        """
+        with open(path, 'rb') as file:
+            body: bytes = file.read()
+
+        with _pausing_gc() if pauses_gc else nullcontext():
+            snapshot: JsonObject = from_json_bytes(body)
+            if snapshot['version'] != _SNAPSHOT_VERSION:
+                raise ValueError(f"Unknown snapshot version: {snapshot['version']}")
+
+            elapsed_time: float = max(time() - snapshot['time'], 0.0)
+            start_time: float = self._clock() - elapsed_time
+            queue: JsonObject = snapshot['queue']
+            overrides: JsonObject = snapshot['overrides']
+            queue_keys, queue_entries = self._load_items(queue, repeat(queue['life_time']), start_time, elapsed_time,
+                                                         decode, decode_key)
+            override_keys, override_entries = self._load_items(overrides, overrides['life_times'], start_time,
+                                                               elapsed_time, decode, decode_key)
+            self._set_loaded(queue_keys, queue_entries, queue['life_time'])
+            self._set_loaded(override_keys, override_entries, None)
+            heapify(self._overrides)
+            heapify(self._deadlines)
+
+        if self._policy is not None:
+            self._evict(0, 0)
+
+        if self._expire_handler is None and not self._is_empty():
+            self._start_auto_expire()
+
+        return len(queue_keys) + len(override_keys)
+
+    def _load_items(self, items_data: JsonObject, life_times: Iterable[float], start_time: float,
+                    elapsed_time: float, decode: Optional[Callable[[JsonFormat], ValueType]],
+                    decode_key: Optional[Callable[[JsonFormat], KeyType]]) -> Tuple[List[KeyType], List[_Entry]]:
+        """Build the entries of the items not expired column by column, dropping the expired ones before decoding."""
+        expire_ins: List[float] = items_data['expire_in']
+        deadline_ins: Optional[List[Optional[float]]] = items_data['deadline_in']
+        is_alive: List[bool] = ([elapsed_time < expire_in for expire_in in expire_ins] if deadline_ins is None
+                                else [elapsed_time < expire_in and (deadline_in is None or elapsed_time < deadline_in)
+                                      for expire_in, deadline_in in zip(expire_ins, deadline_ins)])
+        columns: List[Any] = [items_data['keys'], items_data['values'], life_times, expire_ins,
+                              items_data['refresh_in'], deadline_ins]
+        if not all(is_alive):
+            columns = [column if column is None else list(compress(column, is_alive)) for column in columns]
+
+        keys, values, life_times, expire_ins, refresh_ins, deadline_ins = columns
+        if items_data['encoded_keys'] or decode_key is not None:
+            keys = list(map(_decode_key if decode_key is None else decode_key, keys))
+
+        if decode is not None:
+            values = list(map(decode, values))
+
+        expire_times: List[float] = [start_time + expire_in for expire_in in expire_ins]
+        if self.max_size is None and deadline_ins is None:
+            entries: List[_Entry] = list(map(_Entry, values, life_times, expire_times))
+        else:
+            sizes: Iterable[int] = repeat(0) if self.max_size is None else \
+                [self._sizeof(key) + self._sizeof(value) for key, value in zip(keys, values)]
+            entries = list(map(_Entry, values, life_times, expire_times, sizes, _get_times(refresh_ins, start_time),
+                               _get_times(deadline_ins, start_time)))
+        if deadline_ins is not None:
+            self._deadlines.extend((entry.deadline, next(self._orders), key)
+                                   for key, entry in zip(keys, entries) if entry.deadline < inf)
+
+        return keys, entries
+
+    def _set_loaded(self, keys: List[KeyType], entries: List[_Entry], life_time: Optional[float]):
+        """Set the loaded entries at once. The ones of the life time of the dict are queued, sorted once by their
+        expiry unless they are of the queue already in the order, and the others are put into the heap.
+        """
+        if not self._is_empty():
+            for key in keys:
+                entry: Optional[_Entry] = self._dict.get(key, None)
+                if entry is not None:
+                    self._unlink(key, entry)
+
+        self._dict.update(zip(keys, entries))
+        if self._policy is not None:
+            for key, entry in zip(keys, entries):
+                self._policy.add(key)
+                self._size += entry.size
+
+        is_sorted: bool = life_time == self.life_time
+        is_queued: List[bool] = [is_sorted] * len(entries) if life_time is not None else \
+            [entry.life_time == self.life_time for entry in entries]
+        if not is_sorted:
+            self._overrides.extend((entry.expire_time, next(self._orders), key, entry)
+                                   for key, entry, queued in zip(keys, entries, is_queued) if not queued)
+            keys, entries = list(compress(keys, is_queued)), list(compress(entries, is_queued))
+
+        if is_sorted and len(self._queue) <= 0:
+            self._queue = OrderedDict(zip(keys, entries))
+        elif 0 < len(keys):
+            self._queue.update(zip(keys, entries))
+            self._queue = OrderedDict(sorted(self._queue.items(), key=lambda item: item[1].expire_time))
+
+
+def _dump_items(keys: List[Any], entries: List[_Entry], life_time: Optional[float], now: float,
+                encode: Optional[Callable[[Any], JsonFormat]],
+                encode_key: Optional[Callable[[Any], JsonFormat]]) -> JsonObject:
+    """Return the columns of the items not expired, with their life time or a column of them if it is not given."""
+    is_alive: List[bool] = [now < entry.expire_time and now < entry.deadline for entry in entries]
+    if not all(is_alive):
+        keys, entries = list(compress(keys, is_alive)), list(compress(entries, is_alive))
+
+    has_ages: bool = any(entry.deadline < inf for entry in entries)
+    encoded_keys: bool = encode_key is not None or not all(type(key) in _key_types for key in keys)
+    values: List[Any] = [entry.value for entry in entries]
+    items_data: JsonObject = {
+        'keys': list(map(_encode_key if encode_key is None else encode_key, keys)) if encoded_keys else keys,
+        'encoded_keys': encoded_keys,
+        'values': values if encode is None else list(map(encode, values)),
+        'expire_in': [entry.expire_time - now for entry in entries],
+        'refresh_in': [_get_remaining(entry.refresh_time, now) for entry in entries] if has_ages else None,
+        'deadline_in': [_get_remaining(entry.deadline, now) for entry in entries] if has_ages else None,
+    }
+    if life_time is not None:
+        items_data['life_time'] = life_time
+    else:
+        items_data['life_times'] = [entry.life_time for entry in entries]
+
+    return items_data
+
+
+def _get_remaining(time_: float, now: float) -> Optional[float]:
+    return time_ - now if time_ < inf else None
+
+
+def _get_times(remaining_times: Optional[List[Optional[float]]], start_time: float) -> Iterable[float]:
+    if remaining_times is None:
+        return repeat(inf)
+
+    return [start_time + remaining if remaining is not None else inf for remaining in remaining_times]
+
+
+def _encode_key(key: Any) -> JsonFormat:
+    """Encode the values as they are, the tuples as lists, and the frozensets and the classes as objects, since
+    neither lists nor objects are keys.
+    """
+    if type(key) in _key_types:
+        return key
+
+    if type(key) is tuple:
+        return list(map(_encode_key, key))
+
+    if type(key) is frozenset:
+        return {'frozenset': list(map(_encode_key, key))}
+
+    if isinstance(key, type) and '<locals>' not in key.__qualname__:
+        return {'type': f'{key.__module__}:{key.__qualname__}'}
+
+    raise TypeError(f"The key {key!r} cannot be written without 'encode_key', not being a value, a class, "
+                    f"or a tuple or a frozenset of them.")
+
+
+def _decode_key(key: JsonFormat) -> Any:
+    if type(key) is list:
+        return tuple(map(_decode_key, key))
+
+    if type(key) is dict:
+        return frozenset(map(_decode_key, key['frozenset'])) if 'frozenset' in key else _import_type(key['type'])
+
+    return key
+
+
+@lru_cache(maxsize=None)
+def _import_type(name: Text) -> type:
+    module_name, qualname = name.split(':')
+    found: Any = import_module(module_name)
+    for attribute in qualname.split('.'):
+        found = getattr(found, attribute)
+
+    return found
+
+
+@contextmanager
+def _pausing_gc():
+    """Stop the cyclic garbage collector, which would traverse all the items again and again while building many."""
+    is_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if is_enabled:
+            gc.enable()
+
+
+def _write_atomically(path: Text, body: bytes):
+    directory: Text = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(body)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def _is_expired(entry: _Entry, now: float) -> bool:
+    return entry.expire_time <= now or entry.deadline <= now
+
+
+def _log_refresh_error(key: Any, load: asyncio.Task):
+    if not load.cancelled() and load.exception() is not None:
+        _logger.warning(f"Failed to refresh {key!r}, keeping the current value: {load.exception()!r}")
+
+
+class Sweeper(Enum):
+    THREAD = 'thread'
+    TASK = 'task'
+
+
+_DEFAULT_SHARDS_COUNT: int = 16
+
+
+class _Shard(NamedTuple):
+    lock: Lock
+    items: ExpireDict
+
+
+class ShardedExpireDict(Generic[KeyType, ValueType]):
+    """'ExpireDict' usable from any thread, split into shards by the hash of the keys, each guarded by its own lock.
+
+    The expired items are removed every 'expire_cycle' by a daemon thread, or by a task of the running event loop
+    when the sweeper is 'Sweeper.TASK'. The bounds and the other options are shared equally by the shards.
+    Call 'close' to stop the sweeper, which also stops once the dict is not referenced anymore.
+    """
+    def __init__(self, life_time: float, expire_cycle: float, *, shards_count: int = _DEFAULT_SHARDS_COUNT,
+                 sweeper: Sweeper = Sweeper.THREAD, max_count: Optional[int] = None, max_size: Optional[int] = None,
+                 eviction: Eviction = Eviction.LRU, sizeof: Callable[[Any], int] = getsizeof,
+                 clock: Callable[[], float] = monotonic, **kwargs):
+        self.life_time: float = life_time
+        self.expire_cycle: float = expire_cycle
+        self._shards: Tuple[_Shard, ...] = tuple(
+            _Shard(Lock(), ExpireDict(life_time, None, max_count=_divide(max_count, shards_count),
+                                      max_size=_divide(max_size, shards_count), eviction=eviction, sizeof=sizeof,
+                                      clock=clock))
+            for _ in range(shards_count))
+        self._stop_event: Event = Event()
+        self._sweeper_task: Optional[asyncio.Task] = None
+        for key, value in kwargs.items():
+            self[key] = value
+
+        self._start_sweeper(sweeper)
+
+    def _get_shard(self, key: KeyType) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __getitem__(self, key: KeyType) -> ValueType:
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            return shard.items[key]
+
+    def __setitem__(self, key: KeyType, value: ValueType):
+        self.set(key, value)
+
+    def set(self, key: KeyType, value: ValueType, life_time: Optional[float] = None):
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            shard.items.set(key, value, life_time)
+
+    def __delitem__(self, key: KeyType):
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            del shard.items[key]
+
+    def get(self, key: KeyType, default: Optional[ValueType] = None) -> ValueType:
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            return shard.items.get(key, default)
+
+    def setdefault(self, key: KeyType, default: Optional[ValueType] = None) -> ValueType:
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            return shard.items.setdefault(key, default)
+
+    def pop(self, key: KeyType, default: Any = _MISSING) -> ValueType:
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            return shard.items.pop(key, default)
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.items.clear()
+
+    def __contains__(self, key: KeyType) -> bool:
+        shard: _Shard = self._get_shard(key)
+        with shard.lock:
+            return key in shard.items
+
+    def __len__(self) -> int:
+        return sum(len(shard.items) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[KeyType]:
+        keys: List[KeyType] = []
+        for shard in self._shards:
+            with shard.lock:
+                keys.extend(shard.items)
+
+        return iter(keys)
+
+    def expire(self) -> int:
+        """Remove the expired items shard by shard, so that only one shard is locked at once."""
+        expired_count: int = 0
+        for shard in self._shards:
+            with shard.lock:
+                expired_count += shard.items.expire()
+
+        return expired_count
+
+    def get_stats(self) -> ExpireDictStats:
+        return ExpireDictStats(*(sum(values) for values in zip(*(shard.items.get_stats() for shard in self._shards))))
+
+    def reset_stats(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.items.reset_stats()
+
+    def close(self):
+        self._stop_event.set()
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
+
+    def _start_sweeper(self, sweeper: Sweeper):
+        reference: ReferenceType = ref(self)
+        if sweeper is Sweeper.TASK:
+            self._sweeper_task = asyncio.get_running_loop().create_task(_sweep_in_task(reference, self.expire_cycle))
+        else:
+            Thread(target=_sweep_in_thread, args=(reference, self.expire_cycle, self._stop_event),
+                   name=f"{type(self).__name__}-sweeper", daemon=True).start()
+
+
+def _divide(bound: Optional[int], shards_count: int) -> Optional[int]:
+    return -(-bound // shards_count) if bound is not None else None
+
+
+def _sweep_in_thread(reference: ReferenceType, expire_cycle: float, stop_event: Event):
+    while not stop_event.wait(expire_cycle):
+        items: Optional[ShardedExpireDict] = reference()
+        if items is None:
+            return
+
+        items.expire()
+        del items
+
+
+async def _sweep_in_task(reference: ReferenceType, expire_cycle: float):
+    while True:
+        await asyncio.sleep(expire_cycle)
+        items: Optional[ShardedExpireDict] = reference()
+        if items is None:
+            return
 
-        for key in del_keys:
-            del self[key]
+        items.expire()
+        del items
@@ -1,6 +1,13 @@
 from json_data.deserialization import *
 from json_data.json_format import *
+from json_data.intern_table import *
+from json_data.lazy_object import *
 from json_data.serialization import *
+from json_data.json_codec import *
+from json_data.json_stream import *
+from json_data.parallel_deserialization import *
+from json_data.record_array import *
+from json_data.validation_report import *
 
 import json_data.deserialization_concrete
 import json_data.serialization_concrete
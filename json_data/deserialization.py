@@ -1,40 +1,189 @@
-from contextlib import contextmanager
-from functools import lru_cache, wraps
+from functools import lru_cache
 from inspect import Parameter, signature
-from itertools import groupby, islice
-from typing import (Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Text, Tuple, Type,
-                    get_origin, get_type_hints)
+from itertools import islice
+from threading import Lock, local
+from typing import (Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Text, Tuple, Type,
+                    Union, get_args, get_origin, get_type_hints)
 
+from json_data.intern_table import _intern_value
 from json_data.json_format import JsonFormat, JsonObject
-from logger import get_logger
+from json_data.lazy_object import LazyObject
+from json_data.validation_report import (MISSED_VARIABLES_MESSAGE, UNUSED_VARIABLES_MESSAGE,
+                                         _deserialize_with_report, _record_validation_findings)
 from switch_dispatch import switch_dispatch
 
-_logger = get_logger(__name__)
-
 _serializing_option_property_name: Text = '__serializing_option__'
 
+Deserializer = Callable[[JsonFormat], Any]
+
 
 class _SerializingOption(NamedTuple):
     checks_validation: bool = True
     includes_none: bool = True
+    tag: Optional[Tuple[Text, Any]] = None
+    lazy: bool = False
+    interns: bool = False
+
+    def merge(self, other: "_SerializingOption") -> "_SerializingOption":
+        """Return the option passed down to the fields. The tag belongs to a class only, so it is not passed."""
+        return _SerializingOption(checks_validation=self.checks_validation and other.checks_validation,
+                                  includes_none=self.includes_none and other.includes_none,
+                                  lazy=self.lazy or other.lazy, interns=self.interns or other.interns)
+
+
+_default_option: _SerializingOption = _SerializingOption()
+
+
+def from_data_to(annotation: Any, data: JsonFormat, *, checks_validation: bool = True, includes_none: bool = True,
+                 lazy: bool = False, interns: bool = False) -> Any:
+    option: _SerializingOption = _SerializingOption(checks_validation=checks_validation, includes_none=includes_none,
+                                                    lazy=lazy, interns=interns)
+    return _deserialize_with_report(_get_deserializer(annotation, option), data)
+
+
+def get_deserializer(annotation: Any, *, checks_validation: bool = True, includes_none: bool = True,
+                     lazy: bool = False, interns: bool = False) -> Deserializer:
+    """Return the compiled deserializer of the annotation. Unlike 'from_data_to', fails when compiling it fails."""
+    return _find_deserializer(annotation, _SerializingOption(checks_validation=checks_validation,
+                                                             includes_none=includes_none, lazy=lazy,
+                                                             interns=interns))
+
+
+def warm_up_deserializer(annotation: Any, *, checks_validation: bool = True, includes_none: bool = True,
+                         lazy: bool = False, interns: bool = False) -> Deserializer:
+    """Compile the deserializers of the annotation and of all the annotations nested in it ahead.
+
+    Unlike 'get_deserializer', fails when compiling any of the nested deserializers fails.
+    """
+    option: _SerializingOption = _SerializingOption(checks_validation=checks_validation, includes_none=includes_none,
+                                                    lazy=lazy, interns=interns)
+    _warm_up_nested_deserializers(annotation, option, set())
+    return _find_deserializer(annotation, option)
+
+
+def _warm_up_nested_deserializers(annotation: Any, option: _SerializingOption, visited: Set[Any]):
+    key: Any = _get_ordered_key(annotation)
+    if key in visited:
+        return
+
+    visited.add(key)
+    _find_deserializer(annotation, option)
+    for arg in get_args(annotation):
+        _warm_up_nested_deserializers(arg, option, visited)
+
+    if compile_deserializer.dispatch(annotation) is compile_deserializer.dispatch(object):
+        cls_option: _SerializingOption = option.merge(getattr(annotation, _serializing_option_property_name,
+                                                              _default_option))
+        for field_annotation in _get_cached_type_hints(annotation).values():
+            _warm_up_nested_deserializers(field_annotation, cls_option, visited)
+
+
+_MAX_DESERIALIZERS_COUNT: int = 65536
+
+_deserializers: Dict[Tuple[Any, _SerializingOption], Deserializer] = {}
+_deserializers_lock: Lock = Lock()
+
+
+class _CompilingDeserializers(local):
+    """The forwarding deserializers of the annotations which the thread is compiling."""
+    def __init__(self):
+        self.forwards: Dict[Tuple[Any, _SerializingOption], Deserializer] = {}
+
+
+_compiling_deserializers: _CompilingDeserializers = _CompilingDeserializers()
+
+
+def _find_deserializer(annotation: Any, option: _SerializingOption) -> Deserializer:
+    key: Tuple[Any, _SerializingOption] = (_get_ordered_key(annotation), option)
+    try:
+        return _deserializers[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return _check_valid(annotation, compile_deserializer(annotation, option))
+
+    forwards: Dict[Tuple[Any, _SerializingOption], Deserializer] = _compiling_deserializers.forwards
+    forward: Optional[Deserializer] = forwards.get(key, None)
+    if forward is not None:
+        return forward
+
+    # Recursive annotations reach themselves while compiling, so they are given a forwarding deserializer,
+    # kept apart from the other threads until the compiled one is published.
+    forwards[key] = lambda data: _get_deserializer(annotation, option)(data)
+    try:
+        deserializer: Deserializer = _check_valid(annotation, compile_deserializer(annotation, option))
+    finally:
+        del forwards[key]
+
+    with _deserializers_lock:
+        if _MAX_DESERIALIZERS_COUNT <= len(_deserializers):
+            _deserializers.clear()
+
+        return _deserializers.setdefault(key, deserializer)
+
+
+def _clear_deserializers():
+    with _deserializers_lock:
+        _deserializers.clear()
 
 
-def _check_valid(original: Any) -> Callable:
-    @wraps(original)
-    def wrapper(annotation: Any, data: Any, *args, **kwargs) -> Any:
+def _get_ordered_key(annotation: Any) -> Any:
+    """Return the key telling apart the annotations which are equal regardless of the order, like 'Union'."""
+    args: Tuple[Any, ...] = get_args(annotation)
+    if len(args) <= 0:
+        return annotation
+
+    return get_origin(annotation), tuple(_get_ordered_key(arg) for arg in args)
+
+
+def _get_deserializer(annotation: Any, option: _SerializingOption) -> Deserializer:
+    try:
+        return _find_deserializer(annotation, option)
+    except Exception as e:
+        error: Exception = e
+
+    def fail(data: JsonFormat) -> Any:
+        raise DeserializingFailError(annotation, data).with_traceback(error.__traceback__) from error
+    return fail
+
+
+def _get_nested_deserializer(annotation: Any, option: _SerializingOption) -> Deserializer:
+    """Return the deserializer of a value nested in an object or a container.
+
+    When the option or the class is lazy, objects are given as 'LazyObject' deserialized on the first access to them.
+    """
+    deserialize: Deserializer = _get_deserializer(annotation, option)
+    cls_option: _SerializingOption = getattr(annotation, _serializing_option_property_name, _default_option)
+    if not (option.lazy or cls_option.lazy) or not _is_deferrable(annotation):
+        return deserialize
+
+    cls: Optional[Type] = annotation if isinstance(annotation, type) else None
+    return lambda data: LazyObject(deserialize, data, cls) if isinstance(data, dict) else deserialize(data)
+
+
+def _is_deferrable(annotation: Any) -> bool:
+    if get_origin(annotation) is Union:
+        return True
+
+    return isinstance(annotation, type) and annotation is not Any and not issubclass(annotation, dict)
+
+
+def _check_valid(annotation: Any, deserialize: Deserializer) -> Deserializer:
+    checks_instance: bool = isinstance(annotation, type) and annotation is not Any
+
+    def deserialize_with_check(data: JsonFormat) -> Any:
         try:
-            deserialized: Any = original(annotation, data, *args, **kwargs)
-        except (DeserializingFailError, InvalidAnnotationError) as e:
-            raise e
+            deserialized: Any = deserialize(data)
+        except (DeserializingFailError, InvalidAnnotationError):
+            raise
         except Exception as e:
             raise DeserializingFailError(annotation, data).with_traceback(e.__traceback__) from e
 
-        if isinstance(annotation, type) and not _is_matched_annotation(deserialized, annotation):
+        if checks_instance and not _is_matched_annotation(deserialized, annotation):
             raise InvalidAnnotationError(annotation, deserialized)
 
         return deserialized
-    wrapper.register = original.register
-    return wrapper
+    return deserialize_with_check
 
 
 def _is_matched_annotation(data: Any, annotation: Any) -> bool:
@@ -47,63 +196,88 @@ def _is_matched_annotation(data: Any, annotation: Any) -> bool:
     return False
 
 
-def _compare_annotation(x: Any, y: Any) -> bool:
-    x_origin: Any = get_origin(x) or x
-    y_origin: Any = get_origin(y) or y
-    return x_origin == y_origin
+def _normalize_annotation(annotation: Any) -> Any:
+    return get_origin(annotation) or annotation
 
 
-@_check_valid
-@switch_dispatch(False, _compare_annotation)
-def from_data_to(annotation: Any, data: JsonFormat, *,
-                 checks_validation: bool = True, includes_none: bool = True) -> Any:
-    cls_option: _SerializingOption = getattr(annotation, _serializing_option_property_name, _SerializingOption())
-    checks_validation = checks_validation and cls_option.checks_validation
-    includes_none = includes_none and cls_option.includes_none
-    local_variables: Dict[Text, Any] = locals()
-    options: Dict[Text, bool] = {name: local_variables[name] for name in _get_kwargs_names(from_data_to)}
-    if isinstance(data, List):
-        return from_data_to(List[annotation], data, **options)
+@switch_dispatch(False, key=_normalize_annotation)
+def compile_deserializer(annotation: Any, option: _SerializingOption) -> Deserializer:
+    cls_option: _SerializingOption = getattr(annotation, _serializing_option_property_name, _default_option)
+    option = option.merge(cls_option)
+    checks_validation, includes_none = option.checks_validation, option.includes_none
 
     annotations: Dict[Text, Any] = _get_cached_type_hints(annotation)
-    deserialized_data: JsonObject = {name: from_data_to(annotations[name], value, **options)
-                                     for name, value in data.items() if name in annotations}
+    field_deserializers: Dict[Text, Deserializer] = {name: _get_nested_deserializer(field_annotation, option)
+                                                     for name, field_annotation in annotations.items()}
+    is_named_tuple: bool = issubclass(annotation, tuple)
+    init_parameters: Dict[Text, Parameter] = {} if is_named_tuple else _get_valid_init_parameters(annotation)
+    init_names: FrozenSet[Text] = frozenset(annotations) if is_named_tuple else frozenset(init_parameters)
+    required_init_names: Tuple[Text, ...] = tuple(name for name, parameter in init_parameters.items()
+                                                  if parameter.default is Parameter.empty)
+    fields_count: int = len(field_deserializers)
+    tag: Optional[Tuple[Text, Any]] = _get_tag(annotation)
+    tag_name: Optional[Text] = tag[0] if tag is not None else None
+    interns_instance: bool = option.interns and _is_frozen(annotation)
+
+    def deserialize_object(data: JsonFormat) -> Any:
+        if isinstance(data, list):
+            return _get_deserializer(List[annotation], option)(data)
+
+        init_arguments: JsonObject = {}
+        left_arguments: List[Tuple[Text, Any]] = []
+        unused_names: List[Text] = []
+        for name, value in data.items():
+            deserialize: Deserializer = field_deserializers.get(name)
+            if deserialize is None:
+                if name != tag_name:
+                    unused_names.append(name)
+            elif name in init_names:
+                init_arguments[name] = deserialize(value)
+            else:
+                left_arguments.append((name, deserialize(value)))
+
+        added_init_arguments_names: List[Text] = [name for name in required_init_names if name not in init_arguments]
+        for name in added_init_arguments_names:
+            init_arguments[name] = None
+
+        instance: annotation = annotation(**init_arguments)
+        for name, value in left_arguments:
+            setattr(instance, name, value)
 
-    grouped_arguments = groupby(deserialized_data.items(), key=(lambda item: _is_in_init(annotation, item[0])))
-    arguments: Dict[bool, JsonObject] = {is_in_init: dict(arguments) for is_in_init, arguments in grouped_arguments}
+        has_missed: bool = len(init_arguments) - len(added_init_arguments_names) + len(left_arguments) < fields_count
+        missed_arguments_names: List[Text] = ([name for name in field_deserializers
+                                               if name not in data and not hasattr(instance, name)]
+                                              if has_missed and (includes_none or checks_validation) else [])
+        if includes_none:
+            for name in missed_arguments_names:
+                setattr(instance, name, None)
 
-    init_arguments: JsonObject = arguments.get(True, {})
-    supplemented_init_arguments: JsonObject = _get_supplemented_init_arguments(init_arguments, annotation)
+        if checks_validation:
+            _record_validation_warning(annotation, missed_arguments_names + added_init_arguments_names, unused_names)
 
-    left_arguments: JsonObject = arguments.get(False, {})
-    curtailed_left_arguments: JsonObject = _get_curtailed_left_arguments(left_arguments, annotation)
+        return _intern_value(instance) if interns_instance else instance
+    return deserialize_object
 
-    def swap_for_named_tuple():
-        nonlocal supplemented_init_arguments, curtailed_left_arguments
-        supplemented_init_arguments, curtailed_left_arguments = curtailed_left_arguments, supplemented_init_arguments
 
-    with _process_back_and_forth(annotation, swap_for_named_tuple, swap_for_named_tuple):
-        instance: annotation = annotation(**supplemented_init_arguments)
-        for name, value in curtailed_left_arguments.items():
-            setattr(instance, name, value)
+def _is_frozen(cls: Type) -> bool:
+    dataclass_params: Any = getattr(cls, '__dataclass_params__', None)
+    return issubclass(cls, tuple) or (dataclass_params is not None and dataclass_params.frozen)
 
-    missed_arguments_names: Optional[List[Text]] = (_get_missed_arguments_names(instance, annotation)
-                                                    if includes_none else None)
-    for name in missed_arguments_names or []:
-        setattr(instance, name, None)
 
-    if checks_validation:
-        missed_arguments_names = missed_arguments_names or _get_missed_arguments_names(instance, annotation)
-        added_init_arguments_names: List[Text] = list(supplemented_init_arguments.keys() - init_arguments.keys())
-        dumped_arguments_names: List[Text] = list(left_arguments.keys() - curtailed_left_arguments.keys())
-        _print_validation_warning(missed_arguments_names + added_init_arguments_names, dumped_arguments_names)
+def _register_deserialize_function(*comparison_values: Any) -> Callable[[Callable], Callable]:
+    """Register a function deserializing '(annotation, data, **options)' to 'from_data_to' like before compiling."""
+    def register_wrapper(deserialize: Callable) -> Callable:
+        def compile_function(annotation: Any, option: _SerializingOption) -> Deserializer:
+            return lambda data: deserialize(annotation, data, checks_validation=option.checks_validation,
+                                            includes_none=option.includes_none)
 
-    return instance
+        compile_deserializer.register(*comparison_values)(compile_function)
+        _clear_deserializers()
+        return deserialize
+    return register_wrapper
 
 
-@lru_cache(1)
-def _get_kwargs_names(func: Callable) -> List[Text]:
-    return [name for name, parameter in signature(func).parameters.items() if parameter.kind is Parameter.KEYWORD_ONLY]
+from_data_to.register = _register_deserialize_function
 
 
 @lru_cache
@@ -111,9 +285,9 @@ def _get_cached_type_hints(cls: Type) -> Dict[Text, Any]:
     return get_type_hints(cls)
 
 
-def _is_in_init(cls: Type, parameter_name: Text) -> bool:
-    valid_init_parameters: Dict[Text, Parameter] = _get_valid_init_parameters(cls)
-    return parameter_name in valid_init_parameters
+def _get_tag(cls: Any) -> Optional[Tuple[Text, Any]]:
+    option: Optional[_SerializingOption] = getattr(cls, '__dict__', {}).get(_serializing_option_property_name, None)
+    return option.tag if option is not None else None
 
 
 _ignore_parameter_kind: Set = {Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD}
@@ -126,60 +300,45 @@ def _get_valid_init_parameters(cls: Type) -> Dict[Text, Parameter]:
             if parameter.kind not in _ignore_parameter_kind}
 
 
-def _get_supplemented_init_arguments(init_arguments: JsonObject, cls: Type) -> JsonObject:
-    init_parameters: Mapping[Text, Parameter] = _get_valid_init_parameters(cls)
-    return {name: init_arguments[name] if name in init_arguments else None
-            for name, parameter in init_parameters.items()
-            if name in init_arguments or parameter.default == Parameter.empty}
-
-
-def _get_curtailed_left_arguments(left_arguments: JsonObject, cls: Type) -> JsonObject:
-    annotations: Dict[Text, Any] = _get_cached_type_hints(cls)
-    return {name: value for name, value in left_arguments.items() if name in annotations}
-
-
-def _get_missed_arguments_names(created_object: Any, cls: Type) -> List[Text]:
-    annotations: Dict[Text, Any] = _get_cached_type_hints(cls)
-    missed_arguments_names: List[Text] = []
-    for name in annotations:
-        try:
-            getattr(created_object, name)
-        except AttributeError:
-            missed_arguments_names.append(name)
-
-    return missed_arguments_names
-
-
-@contextmanager
-def _process_back_and_forth(cls: Type, prev_process: Callable[[], Any], next_process: Callable[[], Any]):
-    is_named_tuple: bool = issubclass(cls, tuple)
-    if is_named_tuple:
-        prev_process()
-    yield
-    if is_named_tuple:
-        next_process()
-
-
-def _print_validation_warning(missed_arguments_name: List[Text], dumped_arguments_name: List[Text]):
+def _record_validation_warning(annotation: Any, missed_arguments_name: List[Text], dumped_arguments_name: List[Text]):
     if 0 < len(missed_arguments_name):
-        _print_warning("Missed variables in data", missed_arguments_name)
+        _record_validation_findings(annotation, MISSED_VARIABLES_MESSAGE, missed_arguments_name)
 
     if 0 < len(dumped_arguments_name):
-        _print_warning("Unused variables in data", dumped_arguments_name)
+        _record_validation_findings(annotation, UNUSED_VARIABLES_MESSAGE, dumped_arguments_name)
 
 
-def _print_warning(message: Text, variables: Iterable[Text]):
-    _logger.warning(f"{message}: {', '.join(variables)}")
+def serializing_option(*, checks_validation: bool = True, includes_none: bool = True,
+                       tag: Optional[Tuple[Text, Any]] = None, lazy: bool = False,
+                       interns: bool = False) -> Callable[[Type], Type]:
+    """Set the options deserializing the class.
 
+    The tag is a pair of a key and a hashable value. Data having the value at the key is deserialized to the class
+    when the class is one of the candidates of a 'Union', and the key is written with the value when serializing.
+    A lazy class is deserialized on the first access to it when it is nested, and so are the objects in it.
+    An interning class shares the equal strings and keys in it through a bounded table, and its equal instances too
+    when it is frozen, so the instances must not be changed.
+    """
+    if tag is not None:
+        _check_tag(tag)
 
-def serializing_option(*, checks_validation: bool = True, includes_none: bool = True) -> Callable[[Type], Type]:
     def wrapper(cls: Type) -> Type:
         setattr(cls, _serializing_option_property_name, _SerializingOption(checks_validation=checks_validation,
-                                                                           includes_none=includes_none))
+                                                                           includes_none=includes_none, tag=tag,
+                                                                           lazy=lazy, interns=interns))
+        _clear_deserializers()
         return cls
     return wrapper
 
 
+def _check_tag(tag: Tuple[Text, Any]):
+    try:
+        tag_name, tag_value = tag
+        hash(tag_value)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"The tag '{tag}' must be a pair of a key and a hashable value.") from e
+
+
 class DeserializingFailError(Exception):
     def __init__(self, annotation: Any, data: Any):
         self.message: Text = f"Fail to deserialize '{data}: {type(data).__name__}' to '{annotation}'."
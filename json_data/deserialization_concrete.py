@@ -1,42 +1,89 @@
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
-from typing import (Any, Callable, Dict, Iterable, KeysView, List, NamedTuple, Text, Tuple, Type, Union,
-                    get_args, get_origin, get_type_hints)
-
-from json_data import JsonObject
-from json_data.deserialization import from_data_to, _compare_annotation
+from functools import lru_cache
+from typing import (Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Text, Tuple, Type, Union,
+                    get_args, get_origin)
+
+from json_data import JsonFormat, JsonObject
+from json_data.deserialization import (Deserializer, _SerializingOption, _default_option, _get_cached_type_hints,
+                                       _get_deserializer, _get_nested_deserializer, _get_tag, _normalize_annotation,
+                                       _serializing_option_property_name, compile_deserializer)
+from json_data.intern_table import _intern_string
+from json_data.record_array import RecordArray, get_record_names
 from switch_dispatch import switch_dispatch
 
 
-@from_data_to.register(int, float)
-def deserialize_number(annotation: Type, data: Union[int, float, Decimal], **kwargs) -> Any:
-    return annotation(data)
+@compile_deserializer.register(int, float)
+def compile_number(annotation: Type, option: _SerializingOption) -> Deserializer:
+    return annotation
 
 
-@from_data_to.register(Text, bool, type(None), Any)
-def deserialize_value(annotation: Type, data: Union[Text, bool, None, Any], **kwargs) -> Any:
-    return data
+@compile_deserializer.register(Text, bool, type(None), Any)
+def compile_value(annotation: Any, option: _SerializingOption) -> Deserializer:
+    return _intern_string if option.interns and annotation is not bool else _pass_through
 
 
-@from_data_to.register(List)
-def deserialize_list(annotation: Any, data_list: List, **kwargs) -> Any:
-    return deserialize_generic(lambda args: [from_data_to(args[0], value, **kwargs) for value in data_list],
-                               annotation, data_list)
+def _pass_through(data: JsonFormat) -> Any:
+    return data
 
 
-@from_data_to.register(Dict)
-def deserialize_dict(annotation: Any, data_dict: Dict, **kwargs) -> Any:
-    return deserialize_generic(lambda args: {key: from_data_to(args[1], value, **kwargs)
-                                             for key, value in data_dict.items()}, annotation, data_dict)
+@compile_deserializer.register(List)
+def compile_list(annotation: Any, option: _SerializingOption) -> Deserializer:
+    args: Tuple[Any, ...] = get_args(annotation)
+    if len(args) <= 0:
+        return _pass_through
+
+    deserialize: Deserializer = _get_nested_deserializer(args[0], option)
+    return lambda data_list: [deserialize(value) for value in data_list]
 
 
-def deserialize_generic(deserialize: Callable[[Tuple[Any, ...]], Any], annotation: Any, values: Any) -> Any:
+@compile_deserializer.register(RecordArray)
+def compile_record_array(annotation: Any, option: _SerializingOption) -> Deserializer:
+    """Deserialize the objects having exactly the fields into the columns directly, and the others as a record."""
+    args: Tuple[Any, ...] = get_args(annotation)
+    if len(args) != 1:
+        raise TypeError(f"'{annotation}' must be given the type of the records.")
+
+    record_type: Type = args[0]
+    deserialize_record: Deserializer = _get_deserializer(record_type, option)
+    option = option.merge(getattr(record_type, _serializing_option_property_name, _default_option))
+    annotations: Dict[Text, Any] = _get_cached_type_hints(record_type)
+    fields: Tuple[Tuple[Text, Deserializer], ...] = tuple((name, _get_deserializer(annotations[name], option))
+                                                          for name in get_record_names(record_type))
+    fields_count: int = len(fields)
+
+    def deserialize_record_array(data_list: List[JsonFormat]) -> RecordArray:
+        if not isinstance(data_list, list):
+            raise TypeError(f"'{annotation}' is deserialized from a list.")
+
+        records: RecordArray = RecordArray(record_type)
+        for data in data_list:
+            if isinstance(data, dict) and len(data) == fields_count:
+                try:
+                    values: List[Any] = [deserialize(data[name]) for name, deserialize in fields]
+                except KeyError:
+                    records.append(deserialize_record(data))
+                    continue
+
+                records.append_values(values)
+            else:
+                records.append(deserialize_record(data))
+
+        return records
+    return deserialize_record_array
+
+
+@compile_deserializer.register(Dict)
+def compile_dict(annotation: Any, option: _SerializingOption) -> Deserializer:
     args: Tuple[Any, ...] = get_args(annotation)
     if len(args) <= 0:
-        return values
+        return _pass_through
 
-    return deserialize(args)
+    deserialize: Deserializer = _get_nested_deserializer(args[1], option)
+    if option.interns:
+        return lambda data_dict: {_intern_string(key): deserialize(value) for key, value in data_dict.items()}
+
+    return lambda data_dict: {key: deserialize(value) for key, value in data_dict.items()}
 
 
 class Predict(NamedTuple):
@@ -44,11 +91,74 @@ class Predict(NamedTuple):
     probability: float
 
 
-@from_data_to.register(Union)
-def deserialize_union(annotation: Any, data: Any, **kwargs) -> Any:
+_MAX_INDEXED_NAMES_COUNT: int = 1024
+
+
+@compile_deserializer.register(Union)
+def compile_union(annotation: Any, option: _SerializingOption) -> Deserializer:
     args: Tuple[Any, ...] = get_args(annotation)
-    predict, probability = find_predict_annotation_from(args, data)
-    return from_data_to(predict, data, **kwargs)
+    deserializers: Dict[Any, Deserializer] = {arg: _get_deserializer(arg, option) for arg in args}
+    tags_index: Dict[Text, Dict[Any, Any]] = _create_tags_index(args)
+    names_index: Dict[FrozenSet[Text], Any] = {}
+    types_index: Dict[Type, Any] = {}
+
+    def find_by_tag(data: JsonObject) -> Optional[Any]:
+        for tag_name, candidates in tags_index.items():
+            try:
+                candidate: Optional[Any] = candidates.get(data.get(tag_name, None), None)
+            except TypeError:
+                continue
+
+            if candidate is not None:
+                return candidate
+
+        return None
+
+    def find_by_names(data: JsonObject) -> Any:
+        names: FrozenSet[Text] = frozenset(data)
+        candidate: Optional[Any] = names_index.get(names, None)
+        if candidate is None:
+            candidate = find_predict_annotation_from(args, data).annotation
+            if len(names_index) < _MAX_INDEXED_NAMES_COUNT:
+                names_index[names] = candidate
+
+        return candidate
+
+    def find_by_type(data: Any) -> Any:
+        data_type: Type = type(data)
+        try:
+            return types_index[data_type]
+        except KeyError:
+            candidate: Any = find_predict_annotation_from(args, data).annotation
+            types_index[data_type] = candidate
+            return candidate
+
+    def deserialize_union(data: JsonFormat) -> Any:
+        if not isinstance(data, dict):
+            return deserializers[find_by_type(data)](data)
+
+        candidate: Optional[Any] = find_by_tag(data) if 0 < len(tags_index) else None
+        return deserializers[candidate if candidate is not None else find_by_names(data)](data)
+
+    for arg in args:
+        if isinstance(arg, type):
+            try:
+                find_by_names(dict.fromkeys(_get_cached_type_hints(arg)))
+            except Exception:
+                pass
+
+    return deserialize_union
+
+
+def _create_tags_index(candidates: Iterable) -> Dict[Text, Dict[Any, Any]]:
+    tags_index: Dict[Text, Dict[Any, Any]] = {}
+    for candidate in candidates:
+        tag: Optional[Tuple[Text, Any]] = _get_tag(candidate)
+        if tag is not None:
+            tag_name, tag_value = tag
+            tags_index.setdefault(tag_name, {}).setdefault(tag_value, candidate)
+
+    return tags_index
 
 
 def find_predict_annotation_from(candidates: Iterable, data: Any) -> Predict:
@@ -56,16 +166,20 @@ def find_predict_annotation_from(candidates: Iterable, data: Any) -> Predict:
                key=lambda candidate: candidate.probability)
 
 
-@switch_dispatch(False, _compare_annotation)
+@switch_dispatch(False, key=_normalize_annotation)
 def find_predict_annotation(annotation: Type, data: JsonObject) -> Predict:
     if not isinstance(annotation, type) or not isinstance(data, dict):
         return Predict(annotation, 0.0)
 
-    data_argument_names: KeysView[Text] = data.keys()
-    annotations: KeysView[Text] = get_type_hints(annotation).keys()
+    annotations: Tuple[Text, ...] = _get_sorted_annotation_names(annotation)
     matched_names_count: int = len(list(filter(lambda names: names[0] == names[1],
-                                               zip(sorted(data_argument_names), sorted(annotations)))))
-    return Predict(annotation, matched_names_count / max(len(data_argument_names), len(annotations)))
+                                               zip(sorted(data.keys()), annotations))))
+    return Predict(annotation, matched_names_count / max(len(data), len(annotations)))
+
+
+@lru_cache
+def _get_sorted_annotation_names(cls: Type) -> Tuple[Text, ...]:
+    return tuple(sorted(_get_cached_type_hints(cls)))
 
 
 @find_predict_annotation.register(Any)
@@ -85,11 +199,11 @@ def _(annotation: Any, data: Any) -> Predict:
     return find_predict_annotation_from(args, data)
 
 
-@from_data_to.register(lambda annotation: isinstance(annotation, type) and issubclass(annotation, Enum))
-def deserialize_enum(annotation: Any, data: Any, **kwargs) -> Any:
-    return annotation(data)
+@compile_deserializer.register(lambda annotation: isinstance(annotation, type) and issubclass(annotation, Enum))
+def compile_enum(annotation: Any, option: _SerializingOption) -> Deserializer:
+    return annotation
 
 
-@from_data_to.register(datetime)
-def deserialize_datetime(annotation: Any, data: Any, **kwargs) -> Any:
-    return data
+@compile_deserializer.register(datetime)
+def compile_datetime(annotation: Any, option: _SerializingOption) -> Deserializer:
+    return _pass_through
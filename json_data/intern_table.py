@@ -0,0 +1,75 @@
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Text, Tuple, Type
+
+_DEFAULT_MAX_COUNT: int = 65536
+
+
+class _MainInternTable:
+    """Shared strings and value objects, cleared when the count of them reaches 'max_count'."""
+    max_count: int = _DEFAULT_MAX_COUNT
+    strings: Dict[Text, Text] = {}
+    values: Dict[Any, Any] = {}
+
+
+def set_intern_table_size(max_count: int = _DEFAULT_MAX_COUNT):
+    """Set how many strings, and how many value objects, are kept shared by the interning deserializers."""
+    _MainInternTable.max_count = max_count
+    clear_intern_table()
+
+
+def clear_intern_table():
+    _MainInternTable.strings = {}
+    _MainInternTable.values = {}
+
+
+def _intern_string(value: Any) -> Any:
+    if type(value) is not str:
+        return value
+
+    strings: Dict[Text, Text] = _MainInternTable.strings
+    interned: Any = strings.get(value, None)
+    if interned is not None:
+        return interned
+
+    if _MainInternTable.max_count <= len(strings):
+        strings.clear()
+
+    return strings.setdefault(value, value)
+
+
+def _intern_value(value: Any) -> Any:
+    """Return the shared instance equal to the value with the same types in it, or the value if it cannot be hashed."""
+    values: Dict[Any, Any] = _MainInternTable.values
+    try:
+        key: Any = _get_typed_key(value)
+        interned: Any = values.get(key, None)
+    except TypeError:
+        return value
+
+    if interned is not None:
+        return interned
+
+    if _MainInternTable.max_count <= len(values):
+        values.clear()
+
+    return values.setdefault(key, value)
+
+
+def _get_typed_key(value: Any) -> Any:
+    """Return the key telling apart the equal values of different types, like 1, True and 1.0, in the fields too."""
+    cls: Type = type(value)
+    if isinstance(value, (tuple, frozenset)):
+        items: Iterable[Any] = value
+    elif is_dataclass(value):
+        items = (getattr(value, name) for name in _get_field_names(cls))
+    else:
+        return cls, value
+
+    keys: Any = (frozenset if isinstance(value, frozenset) else tuple)(_get_typed_key(item) for item in items)
+    return cls, keys
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: Type) -> Tuple[Text, ...]:
+    return tuple(field.name for field in fields(cls))
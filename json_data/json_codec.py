@@ -0,0 +1,130 @@
+from datetime import date, datetime, time
+from enum import Enum
+import json
+from typing import Any, Callable, NamedTuple, Optional, Text, Tuple, Type, Union
+from uuid import UUID
+
+from json_data.deserialization import DeserializingFailError, from_data_to
+from json_data.json_format import JsonFormat
+from json_data.serialization import _get_shallow_serializer, _registered_types, to_json_from
+
+# The types orjson encodes by itself even with the passthrough options, skipping the serializers registered for them.
+_orjson_native_types: Tuple[Type, ...] = (str, int, float, bool, type(None), dict, list, tuple, Enum, UUID)
+
+
+class JsonBackend(NamedTuple):
+    name: Text
+    encode: Callable[[Any], bytes]
+    decode: Callable[[Union[bytes, Text]], JsonFormat]
+
+
+def to_json_bytes_from(instance: Any) -> bytes:
+    return _MainBackend.get().encode(instance)
+
+
+def from_json_bytes(body: Union[bytes, Text]) -> JsonFormat:
+    return _MainBackend.get().decode(body) if 0 < len(body) else None
+
+
+def from_json_bytes_to(annotation: Any, body: Union[bytes, Text], *,
+                       checks_validation: bool = True, includes_none: bool = True, lazy: bool = False) -> Any:
+    try:
+        data: JsonFormat = from_json_bytes(body)
+    except Exception as e:
+        raise DeserializingFailError(annotation, body).with_traceback(e.__traceback__) from e
+
+    return from_data_to(annotation, data, checks_validation=checks_validation, includes_none=includes_none, lazy=lazy)
+
+
+def create_json_backend(name: Text, dumps: Callable[[JsonFormat], Union[bytes, Text]],
+                        loads: Callable[[Union[bytes, Text]], JsonFormat]) -> JsonBackend:
+    """Create a backend encoding the JSON tree made by 'to_json_from' with 'dumps' and decoding with 'loads'."""
+    def encode(instance: Any) -> bytes:
+        encoded: Union[bytes, Text] = dumps(to_json_from(instance))
+        return encoded if isinstance(encoded, bytes) else encoded.encode()
+    return JsonBackend(name, encode, loads)
+
+
+def _create_orjson_backend() -> Optional[JsonBackend]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    option: int = (orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME |
+                   orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_NON_STR_KEYS)
+
+    def encode(instance: Any) -> bytes:
+        try:
+            if _overrides_native_type():
+                return orjson.dumps(to_json_from(instance), default=_serialize_shallow, option=option)
+
+            return orjson.dumps(instance, default=_serialize_shallow, option=option)
+        except TypeError:
+            # orjson does not keep the error raised while serializing, so the JSON tree is made again to raise it.
+            return _stdlib_backend.encode(instance)
+    return JsonBackend('orjson', encode, orjson.loads)
+
+
+def _overrides_native_type() -> bool:
+    return any(issubclass(cls, _orjson_native_types) for cls in _registered_types)
+
+
+def _serialize_shallow(instance: Any) -> JsonFormat:
+    serialized: JsonFormat = _get_shallow_serializer(type(instance))(instance)
+    return serialized if serialized is not instance else _encode_passed_value(instance)
+
+
+def _encode_passed_value(value: Any) -> JsonFormat:
+    """Return the value passed through by orjson and kept as it is by its serializer, as the standard library encodes
+    it, so that orjson does not pass it again."""
+    for json_type in (str, int, float, list, dict):
+        if isinstance(value, json_type):
+            return json_type(value)
+
+    return _encode_special_value(value)
+
+
+def _create_ujson_backend() -> Optional[JsonBackend]:
+    try:
+        import ujson
+    except ImportError:
+        return None
+
+    return create_json_backend('ujson', lambda data: ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False,
+                                                                 default=_encode_special_value), ujson.loads)
+
+
+def _encode_special_value(value: Any) -> JsonFormat:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_stdlib_backend: JsonBackend = create_json_backend(
+    'json', lambda data: json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_encode_special_value),
+    json.loads)
+
+
+class _MainBackend:
+    _backend: Optional[JsonBackend] = None
+
+    @staticmethod
+    def get() -> JsonBackend:
+        if _MainBackend._backend is None:
+            _MainBackend.set(_create_orjson_backend() or _create_ujson_backend() or _stdlib_backend)
+
+        return _MainBackend._backend
+
+    @staticmethod
+    def set(backend: JsonBackend):
+        _MainBackend._backend = backend
+
+
+def get_json_backend() -> JsonBackend:
+    return _MainBackend.get()
+
+
+def set_json_backend(backend: JsonBackend):
+    _MainBackend.set(backend)
@@ -0,0 +1,209 @@
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Pattern, Text, Union
+
+from json_data.deserialization import Deserializer, DeserializingFailError, _SerializingOption, _get_deserializer
+from json_data.json_codec import from_json_bytes
+from json_data.json_format import JsonFormat
+from json_data.validation_report import _Findings, _deserialize_into, _report_findings
+
+_structure_pattern: Pattern = re.compile(rb'[\[\]{}",]')
+_string_pattern: Pattern = re.compile(rb'["\\]')
+_BACKSLASH: int = ord('\\')
+_OPENING_BRACKETS: bytes = b'[{'
+_CLOSING_BRACKETS: bytes = b']}'
+
+
+class JsonArrayParser:
+    """Parser splitting a JSON array given in chunks into the decoded elements, as soon as each element completes.
+
+    Only the element being parsed is kept, so the memory does not grow with the size of the whole array.
+    """
+    def __init__(self):
+        self._buffer: bytearray = bytearray()
+        self._position: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escaped: bool = False
+        self._element_start: Optional[int] = None
+        self._elements_count: int = 0
+        self._is_finished: bool = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self._is_finished
+
+    def feed(self, chunk: Union[bytes, Text]) -> List[JsonFormat]:
+        """Parse the chunk following the previous ones, and return the elements completed by it."""
+        if self._is_finished:
+            if len(chunk.strip()) <= 0:
+                return []
+
+            raise InvalidJsonStreamError("Data after the end of the array", chunk)
+
+        self._buffer += chunk.encode() if isinstance(chunk, str) else chunk
+        elements: List[JsonFormat] = []
+        self._parse(elements)
+        if self._is_finished and 0 < len(self._buffer[self._position:].strip()):
+            raise InvalidJsonStreamError("Data after the end of the array", bytes(self._buffer[self._position:]))
+
+        self._compact()
+        return elements
+
+    def close(self):
+        """Check that the array ended after the last chunk."""
+        if not self._is_finished:
+            raise InvalidJsonStreamError("The array is not terminated", bytes(self._buffer))
+
+    def _parse(self, elements: List[JsonFormat]):
+        buffer: bytearray = self._buffer
+        length: int = len(buffer)
+        position: int = self._position
+        while position < length and not self._is_finished:
+            if self._escaped:
+                self._escaped = False
+                position += 1
+                continue
+
+            if self._in_string:
+                match = _string_pattern.search(buffer, position)
+                if match is None:
+                    position = length
+                    break
+
+                self._escaped = buffer[match.start()] == _BACKSLASH
+                self._in_string = self._escaped
+                position = match.end()
+                continue
+
+            match = _structure_pattern.search(buffer, position)
+            if match is None:
+                self._check_blank(position, length)
+                position = length
+                break
+
+            token: int = buffer[match.start()]
+            if self._depth == 0:
+                self._check_blank(position, match.start())
+                if token != _OPENING_BRACKETS[0]:
+                    raise InvalidJsonStreamError("The data is not an array", bytes(buffer[position:match.end()]))
+
+                self._depth = 1
+                self._element_start = match.end()
+            elif self._element_start is None:
+                self._check_blank(position, match.start())
+                if self._depth != 1 or token not in b',]':
+                    raise InvalidJsonStreamError("Missing ',' between the elements", bytes(buffer[:match.end()]))
+
+                if token == _CLOSING_BRACKETS[0]:
+                    self._is_finished = True
+                else:
+                    self._element_start = match.end()
+            elif token == ord('"'):
+                self._in_string = True
+            elif token in _OPENING_BRACKETS:
+                self._depth += 1
+            elif token in _CLOSING_BRACKETS:
+                self._depth -= 1
+                if self._depth == 1:
+                    elements.append(self._pop_element(match.end()))
+                elif self._depth == 0:
+                    if token != _CLOSING_BRACKETS[0]:
+                        raise InvalidJsonStreamError("Mismatched bracket", bytes(buffer[:match.end()]))
+
+                    self._finish_scalar_element(match.start(), elements)
+                    self._is_finished = True
+            elif self._depth == 1:
+                self._finish_scalar_element(match.start(), elements)
+                self._element_start = match.end()
+
+            position = match.end()
+
+        self._position = position
+
+    def _finish_scalar_element(self, end: int, elements: List[JsonFormat]):
+        if len(self._buffer[self._element_start:end].strip()) <= 0:
+            if 0 < self._elements_count or self._buffer[end] != _CLOSING_BRACKETS[0]:
+                raise InvalidJsonStreamError("Missing an element", bytes(self._buffer[:end + 1]))
+
+            self._element_start = None
+            return
+
+        elements.append(self._pop_element(end))
+
+    def _pop_element(self, end: int) -> JsonFormat:
+        text: bytes = bytes(self._buffer[self._element_start:end])
+        self._element_start = None
+        self._elements_count += 1
+        try:
+            return from_json_bytes(text)
+        except Exception as e:
+            raise InvalidJsonStreamError("Fail to decode the element", text) from e
+
+    def _check_blank(self, start: int, end: int):
+        if self._element_start is None and 0 < len(self._buffer[start:end].strip()):
+            raise InvalidJsonStreamError("Unexpected data", bytes(self._buffer[start:end]))
+
+    def _compact(self):
+        consumed: int = self._position if self._element_start is None else self._element_start
+        del self._buffer[:consumed]
+        self._position -= consumed
+        if self._element_start is not None:
+            self._element_start -= consumed
+
+
+def iterate_json_array_to(annotation: Any, chunks: Iterable[Union[bytes, Text]], *, checks_validation: bool = True,
+                          includes_none: bool = True, lazy: bool = False) -> Iterator[Any]:
+    """Yield the elements of the JSON array given in chunks, deserialized to the annotation one by one."""
+    deserialize: Deserializer = _get_deserializer(annotation, _SerializingOption(
+        checks_validation=checks_validation, includes_none=includes_none, lazy=lazy))
+    parser: JsonArrayParser = JsonArrayParser()
+    findings: _Findings = {}
+    try:
+        for chunk in chunks:
+            for data in _feed(parser, annotation, chunk):
+                yield _deserialize_into(findings, deserialize, data)
+
+        _close(parser, annotation)
+    finally:
+        _report_findings(findings)
+
+
+async def async_iterate_json_array_to(annotation: Any, chunks: AsyncIterable[Union[bytes, Text]], *,
+                                      checks_validation: bool = True, includes_none: bool = True,
+                                      lazy: bool = False) -> AsyncIterator[Any]:
+    """Yield the elements of the JSON array given in chunks by an async stream, deserialized to the annotation."""
+    deserialize: Deserializer = _get_deserializer(annotation, _SerializingOption(
+        checks_validation=checks_validation, includes_none=includes_none, lazy=lazy))
+    parser: JsonArrayParser = JsonArrayParser()
+    findings: _Findings = {}
+    try:
+        async for chunk in chunks:
+            for data in _feed(parser, annotation, chunk):
+                yield _deserialize_into(findings, deserialize, data)
+
+        _close(parser, annotation)
+    finally:
+        _report_findings(findings)
+
+
+def _feed(parser: JsonArrayParser, annotation: Any, chunk: Union[bytes, Text]) -> List[JsonFormat]:
+    try:
+        return parser.feed(chunk)
+    except InvalidJsonStreamError as e:
+        raise DeserializingFailError(List[annotation], e.data) from e
+
+
+def _close(parser: JsonArrayParser, annotation: Any):
+    try:
+        parser.close()
+    except InvalidJsonStreamError as e:
+        raise DeserializingFailError(List[annotation], e.data) from e
+
+
+class InvalidJsonStreamError(ValueError):
+    def __init__(self, reason: Text, data: Union[bytes, Text]):
+        self.data: Union[bytes, Text] = data
+        self.message: Text = f"{reason}: '{data[:100]}'."
+
+    def __str__(self) -> Text:
+        return self.message
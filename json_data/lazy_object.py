@@ -0,0 +1,102 @@
+from typing import Any, Callable, Optional, Text, Type
+
+from json_data.json_format import JsonFormat
+
+_not_deserialized: Any = object()
+
+
+class LazyObject:
+    """Proxy deserializing its data on the first access, and delegating everything to the deserialized instance.
+
+    'isinstance' does not deserialize the data when the class to deserialize to is known.
+    """
+    __slots__ = ('_lazy_deserialize', '_lazy_data', '_lazy_class', '_lazy_instance')
+
+    def __init__(self, deserialize: Callable[[JsonFormat], Any], data: JsonFormat, cls: Optional[Type] = None):
+        object.__setattr__(self, '_lazy_deserialize', deserialize)
+        object.__setattr__(self, '_lazy_data', data)
+        object.__setattr__(self, '_lazy_class', cls)
+        object.__setattr__(self, '_lazy_instance', _not_deserialized)
+
+    @property
+    def __class__(self) -> Type:
+        if self._lazy_instance is _not_deserialized and self._lazy_class is not None:
+            return self._lazy_class
+
+        return type(materialize(self))
+
+    def __getattr__(self, name: Text) -> Any:
+        return getattr(materialize(self), name)
+
+    def __setattr__(self, name: Text, value: Any):
+        setattr(materialize(self), name, value)
+
+    def __delattr__(self, name: Text):
+        delattr(materialize(self), name)
+
+    def __repr__(self) -> Text:
+        return repr(materialize(self))
+
+    def __str__(self) -> Text:
+        return str(materialize(self))
+
+    def __eq__(self, other: Any) -> bool:
+        return materialize(self) == other
+
+    def __ne__(self, other: Any) -> bool:
+        return materialize(self) != other
+
+    def __lt__(self, other: Any) -> bool:
+        return materialize(self) < other
+
+    def __le__(self, other: Any) -> bool:
+        return materialize(self) <= other
+
+    def __gt__(self, other: Any) -> bool:
+        return materialize(self) > other
+
+    def __ge__(self, other: Any) -> bool:
+        return materialize(self) >= other
+
+    def __hash__(self) -> int:
+        return hash(materialize(self))
+
+    def __bool__(self) -> bool:
+        return bool(materialize(self))
+
+    def __len__(self) -> int:
+        return len(materialize(self))
+
+    def __iter__(self):
+        return iter(materialize(self))
+
+    def __contains__(self, item: Any) -> bool:
+        return item in materialize(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        return materialize(self)[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        materialize(self)[key] = value
+
+    def __delitem__(self, key: Any):
+        del materialize(self)[key]
+
+
+def is_materialized(value: Any) -> bool:
+    return type(value) is not LazyObject or value._lazy_instance is not _not_deserialized
+
+
+def materialize(value: Any) -> Any:
+    """Return the deserialized instance of the lazy proxy, or the value itself when it is not a proxy."""
+    if type(value) is not LazyObject:
+        return value
+
+    instance: Any = value._lazy_instance
+    if instance is _not_deserialized:
+        instance = value._lazy_deserialize(value._lazy_data)
+        object.__setattr__(value, '_lazy_instance', instance)
+        object.__setattr__(value, '_lazy_deserialize', None)
+        object.__setattr__(value, '_lazy_data', None)
+
+    return instance
@@ -0,0 +1,131 @@
+import asyncio
+import atexit
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+import pickle
+import sys
+from typing import Any, List, Optional, Set, Tuple, get_args, get_origin
+
+from json_data.deserialization import _get_deserializer, _SerializingOption, from_data_to
+from json_data.json_format import JsonFormat, JsonList
+from json_data.validation_report import _deserialize_into, _Findings, _report_findings
+
+_DEFAULT_THRESHOLD: int = 10000
+_DEFAULT_CHUNK_SIZE: int = 5000
+_value_annotations: Set[Any] = {int, float, str, bool, type(None), Any}
+
+
+class _MainParallelOption:
+    threshold: int = _DEFAULT_THRESHOLD
+    chunk_size: int = _DEFAULT_CHUNK_SIZE
+    _executor: Optional[Executor] = None
+    _owns_executor: bool = False
+
+    @staticmethod
+    def get_executor() -> Executor:
+        if _MainParallelOption._executor is None:
+            executor: Executor = ThreadPoolExecutor() if _is_free_threaded() else ProcessPoolExecutor()
+            atexit.register(executor.shutdown)
+            _MainParallelOption._executor = executor
+            _MainParallelOption._owns_executor = True
+
+        return _MainParallelOption._executor
+
+    @staticmethod
+    def set_executor(executor: Optional[Executor]):
+        """Set the executor given by the caller, who shuts it down. The default one is shut down here if it is made."""
+        if _MainParallelOption._owns_executor and _MainParallelOption._executor is not None:
+            _MainParallelOption._executor.shutdown(wait=False)
+            atexit.unregister(_MainParallelOption._executor.shutdown)
+
+        _MainParallelOption._executor = executor
+        _MainParallelOption._owns_executor = False
+
+
+def _is_free_threaded() -> bool:
+    is_gil_enabled: Any = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def set_parallel_deserialization(*, threshold: int = _DEFAULT_THRESHOLD, chunk_size: int = _DEFAULT_CHUNK_SIZE,
+                                 executor: Optional[Executor] = None):
+    """Set how lists are deserialized by 'async_from_data_to'.
+
+    Lists having 'threshold' or more elements are split into chunks of 'chunk_size' elements deserialized on the
+    executor. The executor is a process pool, or a thread pool for the builds running without the GIL, by default.
+    A given executor is left to the caller to shut down.
+    """
+    _MainParallelOption.threshold = threshold
+    _MainParallelOption.chunk_size = chunk_size
+    _MainParallelOption.set_executor(executor)
+
+
+async def async_from_data_to(annotation: Any, data: JsonFormat, *, checks_validation: bool = True,
+                             includes_none: bool = True, lazy: bool = False, interns: bool = False,
+                             threshold: Optional[int] = None) -> Any:
+    """Deserialize like 'from_data_to', deserializing lists of 'threshold' or more elements on the executor.
+
+    The threshold is the one set by 'set_parallel_deserialization' unless it is given.
+
+    Only worth it with spare cores, since the chunks and the instances are pickled across the processes. The elements
+    keep their order, the findings of all the chunks are reported at once, and the error of the first failing element
+    is raised like 'from_data_to'. Lazy objects are deserialized here, since they defer the work anyway.
+    """
+    option: _SerializingOption = _SerializingOption(checks_validation=checks_validation, includes_none=includes_none,
+                                                    lazy=lazy, interns=interns)
+    threshold = _MainParallelOption.threshold if threshold is None else threshold
+    if lazy or _get_element_annotation(annotation) is None or not isinstance(data, list) or len(data) < threshold:
+        return from_data_to(annotation, data, checks_validation=checks_validation, includes_none=includes_none,
+                            lazy=lazy, interns=interns)
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    deserialize_chunk: partial = partial(_deserialize_chunk, annotation, option)
+    executor: Executor = _MainParallelOption.get_executor()
+    if isinstance(executor, ProcessPoolExecutor) and (interns or not _is_picklable(annotation)):
+        results: List[Any] = [await loop.run_in_executor(None, deserialize_chunk, data)]
+    else:
+        chunk_size: int = max(_MainParallelOption.chunk_size, 1)
+        results = await asyncio.gather(*(loop.run_in_executor(executor, deserialize_chunk,
+                                                              data[index:index + chunk_size])
+                                         for index in range(0, len(data), chunk_size)),
+                                       return_exceptions=True)
+
+    findings: _Findings = {}
+    for result in results:
+        if not isinstance(result, BaseException):
+            for finding, count in result[1].items():
+                findings[finding] = findings.get(finding, 0) + count
+
+    _report_findings(findings)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return list(chain.from_iterable(instances for instances, _ in results))
+
+
+def _deserialize_chunk(annotation: Any, option: _SerializingOption, data: JsonList) -> Tuple[List[Any], _Findings]:
+    """Deserialize the chunk like the whole list, returning the findings to report them in the calling process."""
+    findings: _Findings = {}
+    return _deserialize_into(findings, _get_deserializer(annotation, option), data), findings
+
+
+def _get_element_annotation(annotation: Any) -> Optional[Any]:
+    """Return the annotation of the elements worth deserializing in parallel, when the annotation is of a list."""
+    if get_origin(annotation) is list:
+        args: Any = get_args(annotation)
+        element_annotation: Any = args[0] if len(args) == 1 else None
+    else:
+        element_annotation = annotation if isinstance(annotation, type) and not issubclass(annotation, list) else None
+
+    return element_annotation if element_annotation not in _value_annotations else None
+
+
+@lru_cache(maxsize=None)
+def _is_picklable(annotation: Any) -> bool:
+    try:
+        pickle.dumps(annotation)
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,150 @@
+from array import array
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from itertools import repeat
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, MutableSequence, Optional, Sequence, Text, Tuple,
+                    Type, TypeVar, Union, get_type_hints, overload)
+
+_T = TypeVar('_T')
+
+_Column = MutableSequence[Any]
+
+_array_typecodes: Dict[Type, Text] = {int: 'q', float: 'd'}
+
+
+class RecordArray(Sequence[_T]):
+    """Records of a dataclass or a 'NamedTuple' stored as a column per field instead of an object per record.
+
+    The columns of 'int' and 'float' fields are arrays, and the others are lists. A record is built whenever it is
+    read, so changing it does not change the array; set it back to the index instead.
+    """
+    __slots__ = ('record_type', 'names', '_columns', '_length')
+
+    def __init__(self, record_type: Type[_T], records: Iterable[_T] = ()):
+        self.record_type: Type[_T] = record_type
+        self.names: Tuple[Text, ...] = get_record_names(record_type)
+        self._columns: List[_Column] = [array(typecode) if typecode is not None else []
+                                       for typecode in _get_typecodes(record_type)]
+        self._length: int = 0
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> _T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordArray[_T]":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_T, "RecordArray[_T]"]:
+        if isinstance(index, slice):
+            return _create_record_array(self.record_type, [column[index] for column in self._columns],
+                                        len(range(*index.indices(self._length))))
+
+        if index < -self._length or self._length <= index:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        return self.record_type(*(column[index] for column in self._columns))
+
+    def __setitem__(self, index: int, record: _T):
+        if index < -self._length or self._length <= index:
+            raise IndexError(f"{type(self).__name__} assignment index out of range")
+
+        for column_index, value in enumerate(_get_values(self.record_type, record)):
+            try:
+                self._columns[column_index][index] = value
+            except (TypeError, OverflowError):
+                self._columns[column_index] = list(self._columns[column_index])
+                self._columns[column_index][index] = value
+
+    def __iter__(self) -> Iterator[_T]:
+        if len(self._columns) <= 0:
+            return (self.record_type() for _ in repeat(None, self._length))
+
+        record_type: Type[_T] = self.record_type
+        return (record_type(*values) for values in zip(*self._columns))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RecordArray):
+            return self.record_type is other.record_type and self._length == other._length and \
+                all(list(column) == list(other_column) for column, other_column in zip(self._columns, other._columns))
+
+        return isinstance(other, Sequence) and len(self) == len(other) and all(map(_is_equal, self, other))
+
+    def __repr__(self) -> Text:
+        return f"{type(self).__name__}({self.record_type.__name__}, {list(self)!r})"
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[Any, ...]]:
+        return _create_record_array, (self.record_type, self._columns, self._length)
+
+    def append(self, record: _T):
+        self.append_values(_get_values(self.record_type, record))
+
+    def append_values(self, values: Sequence[Any]):
+        """Append the record having the values of the fields in the order of 'names', without building it."""
+        if len(values) != len(self._columns):
+            raise ValueError(f"{type(self).__name__} of '{self.record_type.__name__}' needs {len(self._columns)} "
+                             f"values of {self.names}, not {len(values)}.")
+
+        for column_index, value in enumerate(values):
+            try:
+                self._columns[column_index].append(value)
+            except (TypeError, OverflowError):
+                self._columns[column_index] = list(self._columns[column_index])
+                self._columns[column_index].append(value)
+
+        self._length += 1
+
+    def extend(self, records: Iterable[_T]):
+        for record in records:
+            self.append(record)
+
+    def column(self, name: Text) -> Sequence[Any]:
+        """Return the values of the field, as an 'array' for numbers. Changing it changes the records."""
+        return self._columns[self.names.index(name)]
+
+
+def _create_record_array(record_type: Type[_T], columns: List[_Column], length: int) -> RecordArray[_T]:
+    records: RecordArray[_T] = RecordArray(record_type)
+    records._columns = columns
+    records._length = length
+    return records
+
+
+def _is_equal(record: Any, other: Any) -> bool:
+    return record == other
+
+
+def _get_values(record_type: Type, record: Any) -> Sequence[Any]:
+    if not isinstance(record, record_type):
+        raise TypeError(f"'{record}: {type(record).__name__}' is not a record of '{record_type.__name__}'.")
+
+    if isinstance(record, tuple):
+        return record
+
+    return tuple(getattr(record, name) for name in get_record_names(record_type))
+
+
+@lru_cache(maxsize=None)
+def get_record_names(record_type: Type) -> Tuple[Text, ...]:
+    """Return the names of the fields of the records, in the order of the arguments building a record."""
+    if isinstance(record_type, type) and issubclass(record_type, tuple) and hasattr(record_type, '_fields'):
+        return record_type._fields
+
+    if is_dataclass(record_type) and isinstance(record_type, type):
+        if not all(field.init for field in fields(record_type)):
+            raise TypeError(f"All the fields of '{record_type.__name__}' must be initialized by '__init__' "
+                            f"to be records of {RecordArray.__name__}.")
+
+        return tuple(field.name for field in fields(record_type))
+
+    raise TypeError(f"'{record_type}' must be a dataclass or a NamedTuple to be records of {RecordArray.__name__}.")
+
+
+@lru_cache(maxsize=None)
+def _get_typecodes(record_type: Type) -> Tuple[Optional[Text], ...]:
+    annotations: Dict[Text, Any] = get_type_hints(record_type)
+    return tuple(_array_typecodes.get(annotations.get(name, Any), None) for name in get_record_names(record_type))
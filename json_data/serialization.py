@@ -1,24 +1,206 @@
-from functools import singledispatch
-from typing import Any, Iterable, Text, get_type_hints
+from functools import lru_cache, singledispatch
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Tuple, Type, get_args, get_origin, get_type_hints
 
 from json_data import JsonFormat
+from json_data.deserialization import _get_tag
+
+Serializer = Callable[[Any], JsonFormat]
+
+_primitive_types: Set[Type] = {int, float, str, bool, type(None)}
+_ignore_slots: Set[Text] = {'__dict__', '__weakref__'}
+_registered_types: Set[Type] = set()
 
 
-@singledispatch
 def to_json_from(instance: Any) -> JsonFormat:
+    cls: Type = type(instance)
+    return instance if cls in _primitive_types else _get_serializer(cls)(instance)
+
+
+def get_serializer(cls: Type) -> Serializer:
+    return _get_serializer(cls)
+
+
+def get_shallow_serializer(cls: Type) -> Serializer:
+    """Return the serializer converting only the instance itself, leaving the values of its fields as they are.
+
+    It is for encoders walking into nested values by themselves, so that no whole JSON tree has to be built.
+    """
+    return _get_shallow_serializer(cls)
+
+
+def warm_up_serializer(annotation: Any):
+    """Compile the serializers of the classes in the annotation and of the classes nested in their fields ahead."""
+    _warm_up_nested_serializers(annotation, set())
+
+
+def _warm_up_nested_serializers(annotation: Any, visited: Set[Any]):
+    if annotation in visited:
+        return
+
+    visited.add(annotation)
+    for arg in get_args(annotation):
+        _warm_up_nested_serializers(arg, visited)
+
+    if not isinstance(annotation, type) or annotation is Any:
+        return
+
+    _get_serializer(annotation)
+    _get_shallow_serializer(annotation)
+    if compile_serializer.dispatch(annotation) is compile_serializer.dispatch(object):
+        for field_annotation in _get_type_hints_or_empty(annotation).values():
+            _warm_up_nested_serializers(field_annotation, visited)
+
+
+@lru_cache(maxsize=None)
+def _get_serializer(cls: Type) -> Serializer:
+    compile_function: Callable[[Type], Serializer] = compile_serializer.dispatch(cls)
+    if compile_function is not compile_serializer.dispatch(object):
+        return compile_function(cls)
+
+    return _add_tag(cls, compile_function(cls))
+
+
+@lru_cache(maxsize=None)
+def _get_shallow_serializer(cls: Type) -> Serializer:
+    if compile_serializer.dispatch(cls) is not compile_serializer.dispatch(object):
+        return _get_serializer(cls)
+
+    return _add_tag(cls, _compile_shallow_serializer(cls))
+
+
+def _add_tag(cls: Type, serialize: Serializer) -> Serializer:
+    """Write the tag telling the class apart among the candidates of a 'Union', even if it is not a field."""
+    tag: Optional[Tuple[Text, Any]] = _get_tag(cls)
+    if tag is None:
+        return serialize
+
+    tag_name, tag_value = tag
+    return lambda instance: {tag_name: tag_value, **serialize(instance)}
+
+
+def _compile_shallow_serializer(cls: Type) -> Serializer:
+    if issubclass(cls, tuple):
+        names: Tuple[Text, ...] = _get_tuple_names(cls)
+        if names == getattr(cls, '_fields', None):
+            return lambda instance: dict(zip(names, instance))
+
+        return lambda instance: {name: getattr(instance, name) for name in names}
+
+    if _has_dict(cls):
+        return _get_dict
+
+    slots_names: Optional[Tuple[Text, ...]] = _get_slots_names(cls)
+    if slots_names is None:
+        return _fail_to_serialize
+
+    return lambda instance: {name: getattr(instance, name) for name in slots_names}
+
+
+@singledispatch
+def compile_serializer(cls: Type) -> Serializer:
+    if issubclass(cls, tuple):
+        return _compile_tuple_serializer(cls)
+
+    if _has_dict(cls):
+        return _compile_dict_serializer(cls)
+
+    slots_names: Optional[Tuple[Text, ...]] = _get_slots_names(cls)
+    if slots_names is None:
+        return _fail_to_serialize
+
+    return _compile_attributes_serializer(slots_names, tuple(_compile_field_serializer(cls, name)
+                                                             for name in slots_names))
+
+
+def _get_tuple_names(cls: Type) -> Tuple[Text, ...]:
+    return tuple(_get_type_hints_or_empty(cls))
+
+
+def _has_dict(cls: Type) -> bool:
+    return '__dict__' in dir(cls)
+
+
+def _get_dict(instance: Any) -> JsonFormat:
+    return instance.__dict__
+
+
+def _get_slots_names(cls: Type) -> Optional[Tuple[Text, ...]]:
+    """Return the names of the slots of the class and of its bases, the names of the bases first."""
+    if getattr(cls, '__slots__', None) is None:
+        return None
+
+    names: List[Text] = []
+    for base in reversed(cls.__mro__):
+        slots: Any = vars(base).get('__slots__', ())
+        names.extend(name for name in ((slots,) if isinstance(slots, str) else slots)
+                     if name not in _ignore_slots and name not in names)
+
+    return tuple(names)
+
+
+def _compile_tuple_serializer(cls: Type) -> Serializer:
+    names: Tuple[Text, ...] = _get_tuple_names(cls)
+    serializers: Tuple[Serializer, ...] = tuple(_compile_field_serializer(cls, name) for name in names)
+    if names != getattr(cls, '_fields', None):
+        return _compile_attributes_serializer(names, serializers)
+
+    return lambda instance: {name: serialize(value) for name, serialize, value in zip(names, serializers, instance)}
+
+
+def _compile_dict_serializer(cls: Type) -> Serializer:
+    serializers: Dict[Text, Serializer] = {name: _compile_field_serializer(cls, name)
+                                           for name in _get_type_hints_or_empty(cls)}
+    return lambda instance: {name: serializers.get(name, to_json_from)(value)
+                             for name, value in instance.__dict__.items()}
+
+
+def _compile_attributes_serializer(names: Tuple[Text, ...], serializers: Tuple[Serializer, ...]) -> Serializer:
+    fields: Tuple[Tuple[Text, Serializer], ...] = tuple(zip(names, serializers))
+    return lambda instance: {name: serialize(getattr(instance, name)) for name, serialize in fields}
+
+
+def _compile_field_serializer(cls: Type, name: Text) -> Serializer:
+    annotation: Any = _get_type_hints_or_empty(cls).get(name, Any)
+    args: Tuple[Any, ...] = get_args(annotation)
+    if get_origin(annotation) is list and len(args) == 1 and args[0] in _primitive_types:
+        return _serialize_primitive_list
+
+    return to_json_from
+
+
+def _serialize_primitive_list(instances: Any) -> JsonFormat:
+    if type(instances) is not list:
+        return to_json_from(instances)
+
+    return [instance if type(instance) in _primitive_types else to_json_from(instance) for instance in instances]
+
+
+@lru_cache(maxsize=None)
+def _get_type_hints_or_empty(cls: Type) -> Dict[Text, Any]:
     try:
-        variables_names: Iterable[Text] = _get_variables_names(instance)
-    except AttributeError as e:
-        raise SerializingFailError(instance).with_traceback(e.__traceback__) from e
+        return get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+def _fail_to_serialize(instance: Any) -> JsonFormat:
+    raise SerializingFailError(instance)
+
 
-    return {name: to_json_from(getattr(instance, name)) for name in variables_names}
+def _register_serialize_function(cls: Type, func: Optional[Callable[[Any], JsonFormat]] = None) -> Callable:
+    """Register a function serializing an instance of the class to 'to_json_from' like before compiling."""
+    if func is None:
+        return lambda func_: _register_serialize_function(cls, func_)
 
+    compile_serializer.register(cls)(lambda cls_: func)
+    _registered_types.add(cls)
+    _primitive_types.discard(cls)
+    _get_serializer.cache_clear()
+    _get_shallow_serializer.cache_clear()
+    return func
 
-def _get_variables_names(instance: Any) -> Iterable[Text]:
-    if isinstance(instance, tuple):
-        return get_type_hints(type(instance)).keys()
 
-    return instance.__dict__.keys() if '__dict__' in dir(instance) else instance.__slots__
+to_json_from.register = _register_serialize_function
 
 
 class SerializingFailError(Exception):
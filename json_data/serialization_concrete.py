@@ -1,36 +1,95 @@
 from datetime import datetime
 from enum import Enum
-from time import mktime
-from typing import Dict, List, Text, Union
+from functools import lru_cache
+from typing import Dict, List, Text, Tuple, Type, Union
+from uuid import UUID
 
-from json_data import JsonList, JsonObject, JsonValue
-from json_data.serialization import to_json_from
+from json_data import JsonFormat, JsonList, JsonObject, JsonValue
+from json_data.lazy_object import LazyObject, materialize
+from json_data.record_array import RecordArray, get_record_names
+from json_data.serialization import Serializer, _compile_field_serializer, compile_serializer, to_json_from
+
+
+@compile_serializer.register(int)
+@compile_serializer.register(float)
+@compile_serializer.register(str)
+@compile_serializer.register(bool)
+@compile_serializer.register(type(None))
+def compile_value(cls: Type) -> Serializer:
+    return serialize_value
 
 
-@to_json_from.register(int)
-@to_json_from.register(float)
-@to_json_from.register(str)
-@to_json_from.register(bool)
-@to_json_from.register(type(None))
 def serialize_value(instance: Union[int, float, Text, bool, type(None)]) -> JsonValue:
     return instance
 
 
-@to_json_from.register(list)
+@compile_serializer.register(list)
+def compile_list(cls: Type) -> Serializer:
+    return serialize_list
+
+
 def serialize_list(instances: List) -> JsonList:
     return [to_json_from(instance) for instance in instances]
 
 
-@to_json_from.register(dict)
+@compile_serializer.register(dict)
+def compile_dict(cls: Type) -> Serializer:
+    return serialize_dict
+
+
 def serialize_dict(instances: Dict) -> JsonObject:
     return {name: to_json_from(value) for name, value in instances.items()}
 
 
-@to_json_from.register(Enum)
+@compile_serializer.register(Enum)
+def compile_enum(cls: Type) -> Serializer:
+    return serialize_enum
+
+
 def serialize_enum(instance: Enum) -> JsonValue:
     return instance.value
 
 
-@to_json_from.register(datetime)
+@compile_serializer.register(datetime)
+def compile_datetime(cls: Type) -> Serializer:
+    return serialize_datetime
+
+
 def serialize_datetime(instance: datetime) -> JsonValue:
     return instance
+
+
+@compile_serializer.register(UUID)
+def compile_uuid(cls: Type) -> Serializer:
+    return serialize_uuid
+
+
+def serialize_uuid(instance: UUID) -> JsonValue:
+    return str(instance)
+
+
+@compile_serializer.register(LazyObject)
+def compile_lazy_object(cls: Type) -> Serializer:
+    return serialize_lazy_object
+
+
+def serialize_lazy_object(instance: LazyObject) -> JsonFormat:
+    return to_json_from(materialize(instance))
+
+
+@compile_serializer.register(RecordArray)
+def compile_record_array(cls: Type) -> Serializer:
+    return serialize_record_array
+
+
+def serialize_record_array(instance: RecordArray) -> JsonList:
+    names: Tuple[Text, ...] = instance.names
+    serializers: Tuple[Serializer, ...] = _get_field_serializers(instance.record_type)
+    columns: List = [instance.column(name) for name in names]
+    return [{name: serialize(value) for name, serialize, value in zip(names, serializers, values)}
+            for values in zip(*columns)]
+
+
+@lru_cache(maxsize=None)
+def _get_field_serializers(record_type: Type) -> Tuple[Serializer, ...]:
+    return tuple(_compile_field_serializer(record_type, name) for name in get_record_names(record_type))
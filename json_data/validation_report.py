@@ -0,0 +1,140 @@
+from contextvars import ContextVar, Token
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Text, Tuple
+
+from logger import get_logger
+
+_logger = get_logger(__name__)
+
+MISSED_VARIABLES_MESSAGE: Text = "Missed variables in data"
+UNUSED_VARIABLES_MESSAGE: Text = "Unused variables in data"
+
+
+class ValidationFinding(NamedTuple):
+    message: Text
+    annotation: Any
+    name: Text
+
+
+_Findings = Dict[ValidationFinding, int]
+
+_findings_in_call: ContextVar[Optional[_Findings]] = ContextVar('_findings_in_call', default=None)
+
+
+class _RateLimiter:
+    """Token bucket allowing 'burst' summaries at once, refilled by 'rate' summaries per second."""
+    def __init__(self, rate: float, burst: int):
+        self.rate: float = rate
+        self.burst: int = burst
+        self.tokens: float = burst
+        self.updated_time: float = monotonic()
+
+    def acquire(self) -> bool:
+        now: float = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_time) * self.rate)
+        self.updated_time = now
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class _MainReport:
+    lock: Lock = Lock()
+    findings: _Findings = {}
+    suppressed_summaries_count: int = 0
+    limiter: _RateLimiter = _RateLimiter(1.0, 10)
+
+
+def _record_validation_findings(annotation: Any, message: Text, names: Iterable[Text]):
+    """Count the findings in the current 'from_data_to' call, or report them at once out of any call."""
+    findings: Optional[_Findings] = _findings_in_call.get()
+    if findings is None:
+        findings = {}
+        _count_findings(findings, annotation, message, names)
+        _report(findings)
+    else:
+        _count_findings(findings, annotation, message, names)
+
+
+def _count_findings(findings: _Findings, annotation: Any, message: Text, names: Iterable[Text]):
+    for name in names:
+        finding: ValidationFinding = ValidationFinding(message, annotation, name)
+        findings[finding] = findings.get(finding, 0) + 1
+
+
+def _deserialize_with_report(deserialize: Callable[[Any], Any], data: Any) -> Any:
+    """Deserialize the data, collecting the findings while doing it into one summary."""
+    if _findings_in_call.get() is not None:
+        return deserialize(data)
+
+    findings: _Findings = {}
+    token: Token = _findings_in_call.set(findings)
+    try:
+        return deserialize(data)
+    finally:
+        _findings_in_call.reset(token)
+        _report_findings(findings)
+
+
+def _deserialize_into(findings: _Findings, deserialize: Callable[[Any], Any], data: Any) -> Any:
+    """Deserialize the data, collecting the findings into the ones of a longer work reported by '_report_findings'."""
+    token: Token = _findings_in_call.set(findings)
+    try:
+        return deserialize(data)
+    finally:
+        _findings_in_call.reset(token)
+
+
+def _report_findings(findings: _Findings):
+    if 0 < len(findings):
+        _report(findings)
+
+
+def _report(findings: _Findings):
+    with _MainReport.lock:
+        for finding, count in findings.items():
+            _MainReport.findings[finding] = _MainReport.findings.get(finding, 0) + count
+
+        if not _MainReport.limiter.acquire():
+            _MainReport.suppressed_summaries_count += 1
+            return
+
+        suppressed_summaries_count: int = _MainReport.suppressed_summaries_count
+        _MainReport.suppressed_summaries_count = 0
+
+    _logger.warning(_create_summary(findings, suppressed_summaries_count))
+
+
+def _create_summary(findings: _Findings, suppressed_summaries_count: int) -> Text:
+    groups: Dict[Tuple[Text, Any], List[Text]] = {}
+    for finding, count in findings.items():
+        groups.setdefault((finding.message, finding.annotation), []).append(f"{finding.name} ({count})")
+
+    lines: List[Text] = [f"{message} of {getattr(annotation, '__name__', annotation)}: {', '.join(names)}"
+                         for (message, annotation), names in groups.items()]
+    if 0 < suppressed_summaries_count:
+        lines.append(f"{suppressed_summaries_count} summaries before are suppressed by the rate limit")
+
+    return '\n'.join(lines)
+
+
+def get_validation_report() -> Dict[ValidationFinding, int]:
+    """Return the counts of all the findings reported so far, whether their summaries are logged or suppressed."""
+    with _MainReport.lock:
+        return dict(_MainReport.findings)
+
+
+def reset_validation_report():
+    with _MainReport.lock:
+        _MainReport.findings = {}
+        _MainReport.suppressed_summaries_count = 0
+        _MainReport.limiter = _RateLimiter(_MainReport.limiter.rate, _MainReport.limiter.burst)
+
+
+def set_validation_warning_rate(rate: float, burst: int):
+    """Allow 'burst' summaries at once and 'rate' summaries per second after that."""
+    with _MainReport.lock:
+        _MainReport.limiter = _RateLimiter(rate, burst)
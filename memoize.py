@@ -0,0 +1,195 @@
+import asyncio
+from contextlib import nullcontext
+from dataclasses import is_dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Event, Lock
+from typing import Any, Callable, ContextManager, Dict, Hashable, Optional, Tuple, Union, overload
+
+from expire_dict import ExpireDict
+from json_data import to_json_from
+
+_DEFAULT_LIFE_TIME: float = 60
+_DEFAULT_MAX_COUNT: int = 1024
+_MISSING: Any = object()
+_plain_types: Tuple[type, ...] = (int, str, type(None))
+
+Cache = Union[ExpireDict, Any]
+
+
+class _Failure:
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error: BaseException = error
+
+
+class _Call:
+    """A call running in a thread, waited by the other threads calling with the same key."""
+    __slots__ = ('done', 'result')
+
+    def __init__(self):
+        self.done: Event = Event()
+        self.result: Any = None
+
+
+@overload
+def memoize(*, life_time: float = _DEFAULT_LIFE_TIME, max_count: Optional[int] = _DEFAULT_MAX_COUNT,
+            caches_error: bool = False, key: Optional[Callable[..., Hashable]] = None,
+            cache: Optional[Cache] = None) -> Callable[[Callable], Callable]:
+    ...
+
+
+@overload
+def memoize(func: Callable, *, life_time: float = _DEFAULT_LIFE_TIME, max_count: Optional[int] = _DEFAULT_MAX_COUNT,
+            caches_error: bool = False, key: Optional[Callable[..., Hashable]] = None,
+            cache: Optional[Cache] = None) -> Callable:
+    ...
+
+
+def memoize(func: Optional[Callable] = None, *, life_time: float = _DEFAULT_LIFE_TIME,
+            max_count: Optional[int] = _DEFAULT_MAX_COUNT, caches_error: bool = False,
+            key: Optional[Callable[..., Hashable]] = None,
+            cache: Optional[Cache] = None) -> Union[Callable[[Callable], Callable], Callable]:
+    """Keep the results of the function, or of the coroutine function, per arguments in an 'ExpireDict'.
+
+    The calls with the same arguments running at once share the one running first, instead of each running the
+    function. The arguments are told apart by 'key', or by their JSON made by 'to_json_from' unless they are values.
+    The errors are kept like the results only when 'caches_error' is set, and the interruptions like
+    'KeyboardInterrupt' never. The default cache is guarded by a lock. A given cache is used as is, so give a
+    'ShardedExpireDict' for the functions called from several threads.
+    """
+    if func is None:
+        return lambda func_: memoize(func_, life_time=life_time, max_count=max_count, caches_error=caches_error,
+                                     key=key, cache=cache)
+
+    cache_lock: ContextManager = nullcontext() if cache is not None else Lock()
+    cache = cache if cache is not None else ExpireDict(life_time, None, max_count=max_count)
+    make_key: Callable[..., Hashable] = key if key is not None else _make_key
+    wrapper: Callable = (_memoize_coroutine_function if iscoroutinefunction(func)
+                         else _memoize_function)(func, cache, cache_lock, make_key, caches_error)
+
+    def cache_clear():
+        with cache_lock:
+            cache.clear()
+
+    wrapper.cache = cache
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def _memoize_function(func: Callable, cache: Cache, cache_lock: ContextManager, make_key: Callable[..., Hashable],
+                      caches_error: bool) -> Callable:
+    lock: Lock = Lock()
+    calls: Dict[Hashable, _Call] = {}
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        call_key: Hashable = make_key(*args, **kwargs)
+        with cache_lock:
+            cached: Any = cache.get(call_key, _MISSING)
+
+        if cached is not _MISSING:
+            return _get_result(cached)
+
+        with lock:
+            call: Optional[_Call] = calls.get(call_key, None)
+            is_running: bool = call is None
+            if is_running:
+                call = calls[call_key] = _Call()
+
+        if not is_running:
+            call.done.wait()
+            return _get_result(call.result)
+
+        try:
+            call.result = _call(func, args, kwargs)
+            with cache_lock:
+                _keep_result(cache, call_key, call.result, caches_error)
+        finally:
+            with lock:
+                del calls[call_key]
+
+            call.done.set()
+
+        return _get_result(call.result)
+    return wrapper
+
+
+def _memoize_coroutine_function(func: Callable, cache: Cache, cache_lock: ContextManager,
+                                make_key: Callable[..., Hashable], caches_error: bool) -> Callable:
+    tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def keep_result(call_key: Hashable, task: asyncio.Task):
+        if tasks.get(call_key, None) is task:
+            del tasks[call_key]
+
+        if not task.cancelled():
+            error: Optional[BaseException] = task.exception()
+            with cache_lock:
+                _keep_result(cache, call_key, _Failure(error) if error is not None else task.result(), caches_error)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Any:
+        call_key: Hashable = make_key(*args, **kwargs)
+        with cache_lock:
+            cached: Any = cache.get(call_key, _MISSING)
+
+        if cached is not _MISSING:
+            return _get_result(cached)
+
+        task: Optional[asyncio.Task] = tasks.get(call_key, None)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = tasks[call_key] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(lambda done_task: keep_result(call_key, done_task))
+
+        return await asyncio.shield(task)
+    return wrapper
+
+
+def _call(func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """Call the function, returning even the interruptions as failures, so that the waiting calls raise them too."""
+    try:
+        return func(*args, **kwargs)
+    except BaseException as e:
+        return _Failure(e)
+
+
+def _keep_result(cache: Cache, call_key: Hashable, result: Any, caches_error: bool):
+    if not isinstance(result, _Failure) or (caches_error and isinstance(result.error, Exception)):
+        cache[call_key] = result
+
+
+def _get_result(result: Any) -> Any:
+    if isinstance(result, _Failure):
+        raise result.error
+
+    return result
+
+
+def _make_key(*args, **kwargs) -> Hashable:
+    return (tuple(_freeze(arg) for arg in args),
+            tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())))
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return the key of the value, paired with its type to tell apart the equal values of other types, like 1, True
+    and 1.0. Containers are frozen per element, and dataclasses by their JSON, since they are not hashable mostly.
+    """
+    cls: type = type(value)
+    if cls in _plain_types:
+        return value
+
+    if cls is tuple or cls is list:
+        return cls, tuple(map(_freeze, value))
+
+    if cls is set or cls is frozenset:
+        return cls, frozenset(map(_freeze, value))
+
+    if cls is dict:
+        return cls, frozenset((_freeze(name), _freeze(item)) for name, item in value.items())
+
+    if is_dataclass(value) or not isinstance(value, Hashable):
+        return cls, _freeze(to_json_from(value))
+
+    return cls, value
@@ -1,15 +1,21 @@
-from functools import singledispatch, wraps
-from types import FunctionType
-from typing import Callable, Union, overload
+from functools import singledispatch, update_wrapper
+from inspect import Parameter, signature
+from time import perf_counter
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Type, Union, get_type_hints, overload
+
+from dispatch_instrumentation import DispatchInstrumentation, DispatchStats
+
+ArgumentIndexes = Union[int, Tuple[int, ...]]
 
 
 @overload
-def methoddispatcher(checked_argument_index: int = 1) -> Callable[[Callable], Callable]:
+def methoddispatcher(checked_argument_index: ArgumentIndexes = 1) -> Callable[[Callable], Callable]:
     ...
 
 
 @overload
-def methoddispatcher(func: Callable, checked_argument_index: int = 1) -> Callable:
+def methoddispatcher(func: Callable, checked_argument_index: ArgumentIndexes = 1) -> Callable:
     ...
 
 
@@ -18,17 +24,133 @@ def methoddispatcher(*args, **kwargs) -> Union[Callable[[Callable], Callable], C
 
 
 @singledispatch
-def _methoddispatcher_implementation(checked_argument_index: int = 1) -> Callable[[Callable], Callable]:
+def _methoddispatcher_implementation(checked_argument_index: ArgumentIndexes = 1) -> Callable[[Callable], Callable]:
     return lambda func: _(func, checked_argument_index)
 
 
 @_methoddispatcher_implementation.register(FunctionType)
-def _(func: Callable, checked_argument_index: int = 1) -> Callable:
-    dispatcher = singledispatch(func)
+def _(func: Callable, checked_argument_index: ArgumentIndexes = 1) -> Callable:
+    return _MethodDispatcher(func, checked_argument_index)
+
+
+class _MissingArgument:
+    pass
+
+
+class _MethodDispatcher:
+    """Function dispatching by the types of the arguments at the indexes, caching the function found per types.
+
+    As a method, it is bound on every access like functions, so that nothing is kept in the instances.
+    """
+    def __init__(self, func: Callable, checked_argument_index: ArgumentIndexes):
+        update_wrapper(self, func)
+        self._func: Callable = func
+        self._indexes: Tuple[int, ...] = ((checked_argument_index,) if isinstance(checked_argument_index, int)
+                                          else tuple(checked_argument_index))
+        self._single_dispatcher: Callable = singledispatch(func)
+        self._registry: Dict[Tuple[Type, ...], Callable] = {}
+        self._dispatches: Dict[Any, Callable] = {}
+        self._instrumentation: Optional[DispatchInstrumentation] = None
+        self._resolve: Callable[[Any], Callable] = self.dispatch
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Callable:
+        return self if instance is None else MethodType(self, instance)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if len(self._indexes) == 1:
+            index: int = self._indexes[0]
+            key: Any = type(args[index]) if index < len(args) else _MissingArgument
+        else:
+            key = tuple(type(args[index]) if index < len(args) else _MissingArgument for index in self._indexes)
+
+        return self._resolve(key)(*args, **kwargs)
+
+    def dispatch(self, key: Union[Type, Tuple[Type, ...]]) -> Callable:
+        """Return the function called for the type, or for the tuple of types when dispatching by several arguments."""
+        try:
+            return self._dispatches[key]
+        except KeyError:
+            pass
+
+        dispatched: Callable = (self._single_dispatcher.dispatch(key) if len(self._indexes) == 1
+                                else self._find(key))
+        self._dispatches[key] = dispatched
+        return dispatched
+
+    def _find(self, types: Tuple[Type, ...]) -> Callable:
+        found: Callable = self._func
+        found_distances: Optional[Tuple[int, ...]] = None
+        for registered_types, func in self._registry.items():
+            if not all(issubclass(cls, registered_type) for cls, registered_type in zip(types, registered_types)):
+                continue
+
+            distances: Tuple[int, ...] = tuple(_get_distance(cls, registered_type)
+                                               for cls, registered_type in zip(types, registered_types))
+            if found_distances is None or distances < found_distances:
+                found, found_distances = func, distances
+
+        return found
+
+    def register(self, *types: Union[Type, Tuple[Type, ...], Callable]) -> Callable:
+        """Register the function called for the types, given in the order of the argument indexes.
+
+        The types are read from the annotations of the function when they are not given.
+        """
+        if len(types) == 1 and isinstance(types[0], FunctionType):
+            return self._register(self._get_annotated_types(types[0]), types[0])
+
+        if len(types) == 1 and isinstance(types[0], tuple):
+            types = types[0]
+
+        return lambda func: self._register(types, func)
+
+    def _register(self, types: Tuple[Type, ...], func: Callable) -> Callable:
+        if len(self._indexes) < len(types):
+            raise TypeError(f"'{self.__name__}' dispatches by {len(self._indexes)} arguments, not {len(types)}.")
+
+        if len(self._indexes) == 1:
+            self._single_dispatcher.register(types[0], func)
+        else:
+            self._registry[tuple(types) + (object,) * (len(self._indexes) - len(types))] = func
+
+        self._dispatches.clear()
+        return func
+
+    def _get_annotated_types(self, func: Callable) -> Tuple[Type, ...]:
+        parameters: List[Parameter] = list(signature(func).parameters.values())
+        type_hints: Dict[Text, Any] = get_type_hints(func)
+        return tuple(type_hints.get(parameters[index].name, object) for index in self._indexes)
+
+    def _dispatch_with_instrumentation(self, key: Any) -> Callable:
+        start_time: float = perf_counter()
+        dispatched: Callable = self.dispatch(key)
+        resolution_seconds: float = perf_counter() - start_time
+        if dispatched is self._func:
+            self._instrumentation.record_default(resolution_seconds)
+        else:
+            self._instrumentation.record_case(key, resolution_seconds)
+
+        return dispatched
+
+    def instrument(self, enabled: bool = True):
+        """Start or stop counting the dispatches by the types of the arguments. Stopped, it costs nothing more."""
+        if enabled and self._instrumentation is None:
+            self._instrumentation = DispatchInstrumentation()
+        elif not enabled:
+            self._instrumentation = None
+
+        self._resolve = self._dispatch_with_instrumentation if enabled else self.dispatch
+
+    def get_dispatch_stats(self) -> Optional[DispatchStats]:
+        return self._instrumentation.snapshot() if self._instrumentation is not None else None
+
+    def reset_dispatch_stats(self):
+        if self._instrumentation is not None:
+            self._instrumentation.reset()
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return dispatcher.dispatch(type(args[checked_argument_index]))(*args, **kwargs)
 
-    wrapper.register = dispatcher.register
-    return wrapper
+def _get_distance(cls: Type, registered_type: Type) -> int:
+    try:
+        return cls.__mro__.index(registered_type)
+    except ValueError:
+        return len(cls.__mro__)
@@ -1,7 +1,8 @@
 from importlib import import_module
 from typing import Any, Dict, List, Text
 
-from data import DataReceiver, RECEIVER_KEY, Receiver, SENDER_KEY, get_registered_receivers, pass_sender_arguments
+from data import (DataReceiver, DataSender, LoopbackDataSender, RECEIVER_KEY, Receiver, SENDER_KEY, get_local_urls,
+                  get_registered_receivers, set_sender, warm_up)
 from argument_getter import get_arguments
 
 
@@ -9,8 +10,14 @@ def run(module_name: Text):
     import_module(module_name)
 
     receivers: List[Receiver] = get_registered_receivers()
-    receiver_arguments: Dict[Text, Any] = get_arguments(RECEIVER_KEY)
-    data_receiver: DataReceiver = DataReceiver(*receivers, **receiver_arguments)
+    warm_up(*receivers)
+
+    DataReceiver.load_concrete()
+    DataSender.load_concrete()
 
+    receiver_arguments: Dict[Text, Any] = get_arguments(RECEIVER_KEY)
     sender_arguments: Dict[Text, Any] = get_arguments(SENDER_KEY)
-    pass_sender_arguments(**sender_arguments)
+    set_sender(LoopbackDataSender(receivers=receivers, local_urls=get_local_urls(**receiver_arguments),
+                                  **sender_arguments))
+
+    data_receiver: DataReceiver = DataReceiver(*receivers, **receiver_arguments)
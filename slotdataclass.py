@@ -1,21 +1,107 @@
-from dataclasses import dataclass, _FIELDS
-from typing import Any, Dict, Text
+from dataclasses import dataclass, fields, _FIELDS, _PARAMS
+from types import FunctionType
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Tuple, Union, overload
 
 
-_ANNOTATIONS: Text = '__annotations__'
 _DICT: Text = '__dict__'
 _SLOTS: Text = '__slots__'
+_WEAKREF: Text = '__weakref__'
 
 
-def slotdataclass(cls: type) -> type:
-    annotations: Dict[Text, type] = getattr(cls, _ANNOTATIONS, None)
-    attributes: Dict[Text, Any]
-    if annotations is not None:
-        attributes = {name: value for name, value in vars(cls).items() if name not in annotations and name != _DICT}
-        attributes[_ANNOTATIONS] = annotations
-        attributes[_SLOTS] = annotations.keys()
+@overload
+def slotdataclass(*, eq: bool = True, order: bool = False, frozen: bool = False,
+                  weakref_slot: bool = False) -> Callable[[type], type]:
+    ...
+
+
+@overload
+def slotdataclass(cls: type, *, eq: bool = True, order: bool = False, frozen: bool = False,
+                  weakref_slot: bool = False) -> type:
+    ...
+
+
+def slotdataclass(cls: Optional[type] = None, *, eq: bool = True, order: bool = False, frozen: bool = False,
+                  weakref_slot: bool = False) -> Union[Callable[[type], type], type]:
+    """Make the dataclass having the fields as '__slots__' instead of '__dict__'.
+
+    The options are passed to 'dataclass' unless the class is already a dataclass, for which TypeError is raised if
+    they are given otherwise than it was made with, and 'weakref_slot' adds the slot of '__weakref__'. The defaults
+    are lost if 'dataclass' is applied again after this, so put this outermost.
+    """
+    if cls is None:
+        return lambda cls_: _make_slotdataclass(cls_, eq, order, frozen, weakref_slot)
+
+    return _make_slotdataclass(cls, eq, order, frozen, weakref_slot)
+
+
+def _make_slotdataclass(cls: type, eq: bool, order: bool, frozen: bool, weakref_slot: bool) -> type:
+    if _FIELDS not in vars(cls):
+        cls = dataclass(cls, eq=eq, order=order, frozen=frozen)
     else:
-        attributes = {_SLOTS: ()}
+        _check_options(cls, eq=eq, order=order, frozen=frozen)
+
+    inherited_slots: Set[Text] = _get_inherited_slots(cls)
+    field_names: List[Text] = [field.name for field in fields(cls)]
+    slots: List[Text] = [name for name in field_names if name not in inherited_slots]
+    if weakref_slot and not _has_weakref(cls):
+        slots.append(_WEAKREF)
+
+    attributes: Dict[Text, Any] = {name: value for name, value in vars(cls).items()
+                                   if name not in field_names and name not in (_DICT, _WEAKREF, _SLOTS)}
+    attributes[_SLOTS] = tuple(slots)
+    if getattr(cls, _PARAMS).frozen:
+        attributes.setdefault('__getstate__', _get_frozen_state)
+        attributes.setdefault('__setstate__', _set_frozen_state)
+
+    wrapper: type = type(cls)(cls.__name__, cls.__bases__, attributes)
+    _update_class_cells(attributes, cls, wrapper)
+    return wrapper
+
+
+_default_options: Dict[Text, bool] = {'eq': True, 'order': False, 'frozen': False}
+
+
+def _check_options(cls: type, **options: bool):
+    params: Any = getattr(cls, _PARAMS)
+    for name, value in options.items():
+        if value != _default_options[name] and getattr(params, name) != value:
+            raise TypeError(f"'{cls.__name__}' is already a dataclass made with '{name}={getattr(params, name)}', "
+                            f"which cannot be changed to '{name}={value}'.")
+
+
+def _get_inherited_slots(cls: type) -> Set[Text]:
+    slots: Set[Text] = set()
+    for base in cls.__mro__[1:]:
+        base_slots: Any = vars(base).get(_SLOTS, ())
+        slots.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+
+    return slots
+
+
+def _has_weakref(cls: type) -> bool:
+    return any(_WEAKREF in vars(base) for base in cls.__mro__[1:])
+
+
+def _get_frozen_state(self: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(self, field.name) for field in fields(self))
+
+
+def _set_frozen_state(self: Any, state: Tuple[Any, ...]):
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def _update_class_cells(attributes: Dict[Text, Any], cls: type, wrapper: type):
+    """Make 'super()' in the methods refer to the new class instead of the replaced one."""
+    for value in attributes.values():
+        func: Any = value.fget if isinstance(value, property) else getattr(value, '__func__', value)
+        if not isinstance(func, FunctionType) or func.__closure__ is None:
+            continue
+
+        for cell in func.__closure__:
+            try:
+                if cell.cell_contents is cls:
+                    cell.cell_contents = wrapper
+            except ValueError:
+                pass
 
-    wrapper: type = type(cls.__name__, cls.__bases__, attributes)
-    return dataclass(wrapper) if _FIELDS not in attributes else wrapper
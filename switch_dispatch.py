@@ -1,8 +1,13 @@
 from functools import singledispatch, wraps
 from inspect import Parameter, signature
+from time import perf_counter
 from types import FunctionType
 from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Text, Tuple
 
+from dispatch_instrumentation import DispatchInstrumentation, DispatchStats
+
+_MAX_MEMOIZED_DISPATCHES_COUNT: int = 4096
+
 
 class Case(NamedTuple):
     value: Any
@@ -10,15 +15,124 @@ class Case(NamedTuple):
     separate_comparator: Optional[Callable[[Any], bool]]
 
 
+class _OrderedCase(NamedTuple):
+    order: int
+    case: Case
+    key: Any
+
+
+class _Cases:
+    """Cases found by the hash of the normalized values, trying the predicates registered before the found case.
+
+    With a custom comparator, the values cannot be hashed, so the cases are scanned in the registered order.
+    """
+    def __init__(self, comparator: Optional[Callable[[Any, Any], bool]], key: Callable[[Any], Any]):
+        self.comparator: Optional[Callable[[Any, Any], bool]] = comparator
+        self.key: Callable[[Any], Any] = key
+        self.indexed_cases: Dict[Any, _OrderedCase] = {}
+        self.scanned_cases: List[_OrderedCase] = []
+        self.dispatches: Dict[Tuple[type, Any], Optional[Case]] = {}
+        self.next_order: int = 0
+        self.instrumentation: Optional[DispatchInstrumentation] = None
+
+    def add(self, case: Case):
+        ordered_case: _OrderedCase = _OrderedCase(self.next_order, case,
+                                                  self.key(case.value) if case.separate_comparator is None else None)
+        self.next_order += 1
+        self.dispatches.clear()
+        if self.comparator is None and case.separate_comparator is None:
+            try:
+                self.indexed_cases[ordered_case.key] = ordered_case
+                return
+            except TypeError:
+                pass
+
+        self.scanned_cases.append(ordered_case)
+
+    def remove(self, case: Case):
+        self.dispatches.clear()
+        for key, ordered_case in self.indexed_cases.items():
+            if ordered_case.case is case:
+                del self.indexed_cases[key]
+                return
+
+        self.scanned_cases = [ordered_case for ordered_case in self.scanned_cases if ordered_case.case is not case]
+
+    def find_legacy(self, value: Any) -> Optional[Case]:
+        key: Any = self.key(value)
+        indexed_case: Optional[_OrderedCase] = self._find_indexed(key)
+        if indexed_case is not None:
+            return indexed_case.case
+
+        return next((ordered_case.case for ordered_case in self.scanned_cases
+                     if ordered_case.case.separate_comparator is None and self._is_equal(value, key, ordered_case)),
+                    None)
+
+    def find(self, value: Any) -> Optional[Case]:
+        dispatch_key: Tuple[type, Any] = (type(value), value)
+        try:
+            return self.dispatches[dispatch_key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._find(value)
+
+        case: Optional[Case] = self._find(value)
+        if len(self.dispatches) < _MAX_MEMOIZED_DISPATCHES_COUNT:
+            self.dispatches[dispatch_key] = case
+
+        return case
+
+    def _find(self, value: Any) -> Optional[Case]:
+        key: Any = self.key(value)
+        indexed_case: Optional[_OrderedCase] = self._find_indexed(key)
+        for ordered_case in self.scanned_cases:
+            if indexed_case is not None and indexed_case.order < ordered_case.order:
+                break
+
+            if self.instrumentation is not None and ordered_case.case.separate_comparator is not None:
+                self.instrumentation.predicate_evaluations += 1
+
+            if _check_by_separate_comparator(value, ordered_case.case) or \
+                    (ordered_case.case.separate_comparator is None and self._is_equal(value, key, ordered_case)):
+                return ordered_case.case
+
+        return indexed_case.case if indexed_case is not None else None
+
+    def _find_indexed(self, key: Any) -> Optional[_OrderedCase]:
+        if self.comparator is not None or len(self.indexed_cases) <= 0:
+            return None
+
+        try:
+            return self.indexed_cases.get(key, None)
+        except TypeError:
+            return None
+
+    def _is_equal(self, value: Any, key: Any, ordered_case: _OrderedCase) -> bool:
+        if self.comparator is not None:
+            return self.comparator(value, ordered_case.case.value)
+
+        return key == ordered_case.key
+
+
+def _get_same(value: Any) -> Any:
+    return value
+
+
 @singledispatch
-def switch_dispatch(allow_overwrite: bool = False, comparator: Callable[[Any, Any], bool] = None) -> Callable:
-    return lambda func: _(func, allow_overwrite, comparator)
+def switch_dispatch(allow_overwrite: bool = False, comparator: Callable[[Any, Any], bool] = None,
+                    key: Callable[[Any], Any] = None) -> Callable:
+    """Make the function dispatching to the case registered with the value equal to the first argument.
+
+    The values are compared after being normalized by 'key', or by 'comparator' which cannot use the hash of them.
+    """
+    return lambda func: _(func, allow_overwrite, comparator, key)
 
 
 @switch_dispatch.register(FunctionType)
-def _(func: Callable, allow_overwrite: bool = False, comparator: Callable[[Any, Any], bool] = None) -> Callable:
-    cases: List[Case] = []
-    valid_comparator: Callable[[Any, Any], bool] = comparator if comparator is not None else lambda x, y: x == y
+def _(func: Callable, allow_overwrite: bool = False, comparator: Callable[[Any, Any], bool] = None,
+      key: Callable[[Any], Any] = None) -> Callable:
+    cases: _Cases = _Cases(comparator, key if key is not None else _get_same)
 
     @singledispatch
     def register(*comparison_values: Any) -> Callable[[Callable], Callable]:
@@ -28,14 +142,14 @@ def _(func: Callable, allow_overwrite: bool = False, comparator: Callable[[Any,
     def register_default(*comparison_values: Any) -> Callable[[Callable], Callable]:
         def register_wrapper(case_func: Callable) -> Callable:
             for value in comparison_values:
-                legacy: Optional[Case] = _find_legacy_case(value, cases, valid_comparator)
+                legacy: Optional[Case] = cases.find_legacy(value)
                 if legacy is not None:
                     if not allow_overwrite:
                         raise OverwriteCaseError(func, value)
                     else:
                         cases.remove(legacy)
 
-                cases.append(Case(value, case_func, None))
+                cases.add(Case(value, case_func, None))
             return case_func
         return register_wrapper
 
@@ -45,39 +159,57 @@ def _(func: Callable, allow_overwrite: bool = False, comparator: Callable[[Any,
             return register_default(separate_comparator, *args)
 
         def register_wrapper(case_func: Callable) -> Callable:
-            cases.append(Case(None, case_func, separate_comparator))
+            cases.add(Case(None, case_func, separate_comparator))
             return case_func
         return register_wrapper
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        first_argument: Any = _get_first_argument(func, args, kwargs)
-        case: Optional[Case] = _find_execute_case(first_argument, cases, valid_comparator)
-        return case.func(*args, **kwargs) if case is not None else func(*args, **kwargs)
+    def dispatch(value: Any) -> Callable:
+        """Return the function called for the value, like 'dispatch' of 'singledispatch'."""
+        case: Optional[Case] = cases.find(value)
+        return case.func if case is not None else func
 
-    wrapper.register = register
-    return wrapper
+    def dispatch_with_instrumentation(value: Any) -> Callable:
+        start_time: float = perf_counter()
+        case: Optional[Case] = cases.find(value)
+        resolution_seconds: float = perf_counter() - start_time
+        if case is None:
+            cases.instrumentation.record_default(resolution_seconds)
+            return func
 
+        cases.instrumentation.record_case(case.value if case.separate_comparator is None
+                                          else case.separate_comparator, resolution_seconds)
+        return case.func
 
-def _find_legacy_case(value: Any, cases: List[Case], comparator: Callable[[Any, Any], bool]) -> Optional[Case]:
-    return _find_case(lambda case: _check_by_common_comparator(value, case, comparator), cases)
+    resolve: Callable[[Any], Callable] = dispatch
 
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        first_argument: Any = _get_first_argument(func, args, kwargs)
+        return resolve(first_argument)(*args, **kwargs)
 
-def _find_execute_case(value: Any, cases: List[Case],
-                       comparator: Callable[[Any, Any], bool]) -> Optional[Case]:
-    return _find_case(lambda case: (_check_by_common_comparator(value, case, comparator)) or
-                                   (_check_by_separate_comparator(value, case)), cases)
+    def instrument(enabled: bool = True):
+        """Start or stop counting the dispatches. Stopped, the dispatching costs nothing more."""
+        nonlocal resolve
+        if enabled and cases.instrumentation is None:
+            cases.instrumentation = DispatchInstrumentation()
+        elif not enabled:
+            cases.instrumentation = None
 
+        resolve = dispatch_with_instrumentation if enabled else dispatch
 
-def _find_case(condition: Callable[[Case], bool], cases: List[Case]) -> Optional[Case]:
-    try:
-        return next(case for case in cases if condition(case))
-    except StopIteration:
-        return None
+    def get_dispatch_stats() -> Optional[DispatchStats]:
+        return cases.instrumentation.snapshot() if cases.instrumentation is not None else None
 
+    def reset_dispatch_stats():
+        if cases.instrumentation is not None:
+            cases.instrumentation.reset()
 
-def _check_by_common_comparator(value: Any, case: Case, comparator: Callable[[Any, Any], bool]) -> bool:
-    return case.separate_comparator is None and comparator(value, case.value)
+    wrapper.register = register
+    wrapper.dispatch = dispatch
+    wrapper.instrument = instrument
+    wrapper.get_dispatch_stats = get_dispatch_stats
+    wrapper.reset_dispatch_stats = reset_dispatch_stats
+    return wrapper
 
 
 def _check_by_separate_comparator(value: Any, case: Case) -> bool:
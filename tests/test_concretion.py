@@ -1,4 +1,6 @@
 import unittest
+from typing import Text
+from unittest.mock import patch
 
 from concrete import AbstractMeta, NoAbstractError, OverwriteConcreteError, concrete
 
@@ -65,3 +67,34 @@ class TestConcrete(unittest.TestCase):
             @concrete
             class Concrete(Base):
                 pass
+
+    def test_lazy_concrete(self):
+        class Base(metaclass=AbstractMeta):
+            pass
+
+        class Concrete(Base):
+            pass
+
+        def import_concrete_module(module_name: Text):
+            self.assertEqual(module_name, 'concrete_module')
+            concrete(Concrete)
+
+        Base.set_concrete_module('concrete_module')
+        with patch('concrete.import_module', side_effect=import_concrete_module) as import_module:
+            self.assertFalse(import_module.called)
+            self.assertTrue(isinstance(Base(), Concrete))
+            self.assertTrue(isinstance(Base(), Concrete))
+            self.assertEqual(import_module.call_count, 1)
+
+    def test_lazy_concrete_already_set(self):
+        class Base(metaclass=AbstractMeta):
+            pass
+
+        @concrete
+        class Concrete(Base):
+            pass
+
+        Base.set_concrete_module('concrete_module')
+        with patch('concrete.import_module') as import_module:
+            self.assertTrue(isinstance(Base(), Concrete))
+            self.assertFalse(import_module.called)
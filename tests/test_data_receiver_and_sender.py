@@ -1,12 +1,15 @@
 from asyncio import run
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from typing import Any, Callable, Coroutine, List, Text
 import unittest
 
-from data import DataSender, DEFAULT_KEY, Response, send, to_json_from
-from data.data_receiver import DataReceiver, NoReceiverError, Receiver, get_registered_receivers, register_as_receiver
-from json_data import DeserializingFailError, JsonFormat, SerializingFailError
+from data import (DataSender, DEFAULT_KEY, ErrorData, LoopbackDataSender, Response, ResponseError,
+                  from_response_bytes_to, get_local_urls, send, to_json_bytes_from, to_json_from)
+from data.data_receiver import (DataReceiver, NoReceiverError, Receiver, WarmUpError, get_registered_receivers,
+                                register_as_receiver, warm_up)
+from json_data import DeserializingFailError, JsonFormat, SerializingFailError, set_parallel_deserialization
 from logger import intercept_log
 
 
@@ -134,6 +137,115 @@ class TestDataReceiver(unittest.TestCase):
         self.assertEqual(actual, expected)
         self.assertEqual(actual2, expected2)
 
+    def test_warm_up(self):
+        @dataclass
+        class InvalidData:
+            a: List[Callable]
+
+        def pass_data(target: InvalidData) -> TestData:
+            return TestData(1, 'test')
+
+        warm_up(Receiver(get_increased_data), Receiver(lambda target: target))
+        with self.assertRaises(WarmUpError):
+            warm_up(Receiver(get_increased_data), Receiver(pass_data))
+
+    def test_parallel_receiver(self):
+        received: List[List[TestData]] = []
+
+        def count(targets: List[TestData]) -> int:
+            received.append(targets)
+            return len(targets)
+
+        TestReceiver(Receiver(count, parallel_threshold=4), sender=self.sender)
+        with CountingExecutor(2) as executor:
+            set_parallel_deserialization(chunk_size=3, executor=executor)
+            try:
+                for size in [3, 10]:
+                    actual, error = run(self.send([TestData(index, 'test') for index in range(size)], int))
+                    self.assertEqual(actual, size)
+            finally:
+                set_parallel_deserialization()
+
+        self.assertEqual(received[1], [TestData(index, 'test') for index in range(10)])
+        self.assertEqual(executor.submitted_count, 4)
+
+    def test_response_bytes(self):
+        self.assertEqual(from_response_bytes_to(TestData, b'{"a": 1, "b": "test"}'), TestData(1, 'test'))
+
+        error: ResponseError = from_response_bytes_to(TestData, to_json_bytes_from(ErrorData('Exception', 'test')))
+        self.assertTrue(isinstance(error, ResponseError))
+        self.assertEqual(error.exception, 'Exception')
+
+
+class TestJsonDataSender(unittest.TestCase):
+    def test_json_sender(self):
+        class JsonSender(DataSender):
+            async def send(self, data: JsonFormat, key: Text = DEFAULT_KEY, **kwargs) -> JsonFormat:
+                return {'a': data['a'] + 1, 'b': data['b'] + key}
+
+        actual, error = run(send(JsonSender(), TestData(1, 'test'), TestData, '2'))
+        self.assertEqual(actual, TestData(2, 'test2'))
+        self.assertEqual(run(JsonSender().send_bytes(b'{"a": 1, "b": "test"}', '2')), {'a': 2, 'b': 'test2'})
+
+
+class TestLoopbackDataSender(unittest.TestCase):
+    def test_loopback(self):
+        sender: LoopbackDataSender = LoopbackDataSender(receivers=[Receiver(get_increased_data)])
+        actual, error = run(send(sender, TestData(1, 'test'), TestData))
+
+        self.assertEqual(actual, TestData(2, 'test2'))
+        self.assertIsNone(error)
+
+    def test_passes_instance(self):
+        input_: TestData = TestData(1, 'test')
+
+        def pass_data(target: TestData) -> TestData:
+            self.assertIs(target, input_)
+            return target
+
+        def raise_exception(target: TestData) -> None:
+            raise Exception("Error is occurred!")
+
+        sender: LoopbackDataSender = LoopbackDataSender(receivers=[Receiver(pass_data), Receiver(raise_exception)],
+                                                        passes_instance=True)
+        with intercept_log(lambda message: self.assertTrue(0 <= message.find("Error is occurred!"))):
+            actual, error = run(send(sender, input_, TestData))
+
+        self.assertIs(actual, input_)
+        self.assertTrue(isinstance(error, ResponseError))
+        self.assertEqual(error.exception, Exception.__name__)
+
+    def test_no_receiver(self):
+        sender: LoopbackDataSender = LoopbackDataSender(receivers=[], local_keys=['test'], passes_instance=True)
+        with intercept_log(lambda message: self.assertTrue(0 <= message.find("no receiver"))):
+            actual, error = run(send(sender, TestData(1, 'test'), TestData, 'test'))
+
+        self.assertEqual(error.exception, NoReceiverError.__name__)
+
+    def test_fallback(self):
+        local_urls: List[Text] = get_local_urls(url='/', host='0.0.0.0', port=8000)
+        sender: LoopbackDataSender = LoopbackDataSender(receivers=[Receiver(get_increased_data)],
+                                                        local_urls=local_urls)
+        fallback: TestSender = TestSender()
+        TestReceiver(Receiver(lambda target: TestData(0, 'remote')), sender=fallback)
+        sender._fallback = fallback
+
+        local, error = run(send(sender, TestData(1, 'test'), TestData, url='http://127.0.0.1:8000/'))
+        remote, error = run(send(sender, TestData(1, 'test'), TestData, url='http://remote:8000/'))
+
+        self.assertEqual(local, TestData(2, 'test2'))
+        self.assertEqual(remote, TestData(0, 'remote'))
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers)
+        self.submitted_count: int = 0
+
+    def submit(self, *args, **kwargs) -> Future:
+        self.submitted_count += 1
+        return super().submit(*args, **kwargs)
+
 
 @dataclass
 class TestData:
@@ -1,14 +1,23 @@
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
 from re import Pattern, compile
-from typing import Any, Dict, List, NamedTuple, Optional, Text, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Text, Union
 import unittest
-
-from json_data import DeserializingFailError, InvalidAnnotationError, JsonFormat, from_data_to, serializing_option
+from unittest.mock import patch
+
+from json_data import (MISSED_VARIABLES_MESSAGE, UNUSED_VARIABLES_MESSAGE, Deserializer, DeserializingFailError,
+                       InvalidAnnotationError, JsonFormat, ValidationFinding, from_data_to, from_json_bytes,
+                       get_deserializer, get_validation_report, is_materialized, reset_validation_report,
+                       serializing_option, set_intern_table_size, set_validation_warning_rate, to_json_bytes_from,
+                       to_json_from)
+from json_data import deserialization
 from logger import intercept_log
 
 
 class TestDeserialization(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_validation_report()
+
     def test_value_deserialize(self):
         json_data: JsonFormat = 1
         deserialized_data: int = from_data_to(int, json_data)
@@ -84,6 +93,33 @@ class TestDeserialization(unittest.TestCase):
         with self.assertRaises(AttributeError):
             c: bool = deserialized_data.c
 
+    def test_aggregated_warning_deserialize(self):
+        @dataclass
+        class LessArgs:
+            a: int
+            b: Text
+
+        json_data: JsonFormat = [{'a': 1}, {'a': 2, 'c': True}, {'a': 3, 'c': False}]
+        messages: List[Text] = []
+        with intercept_log(messages.append, needs_full_format_log=False):
+            from_data_to(LessArgs, json_data)
+
+        self.assertEqual(len(messages), 1)
+        self.assertIn(f"{MISSED_VARIABLES_MESSAGE} of LessArgs: b (3)", messages[0])
+        self.assertIn(f"{UNUSED_VARIABLES_MESSAGE} of LessArgs: c (2)", messages[0])
+        self.assertEqual(get_validation_report(), {ValidationFinding(MISSED_VARIABLES_MESSAGE, LessArgs, 'b'): 3,
+                                                   ValidationFinding(UNUSED_VARIABLES_MESSAGE, LessArgs, 'c'): 2})
+
+        set_validation_warning_rate(0.001, 1)
+        messages.clear()
+        with intercept_log(messages.append, needs_full_format_log=False):
+            for _ in range(3):
+                from_data_to(LessArgs, json_data[0])
+
+        set_validation_warning_rate(1.0, 10)
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(get_validation_report()[ValidationFinding(MISSED_VARIABLES_MESSAGE, LessArgs, 'b')], 6)
+
     def test_derived_deserialize(self):
         class Derived(Item):
             b: int
@@ -212,6 +248,40 @@ class TestDeserialization(unittest.TestCase):
         test_item_1(self, deserialized_data.item_or_list)
         test_item_list(self, deserialized_data.item_or_list2)
 
+    def test_tagged_union_deserialize(self):
+        @serializing_option(tag=('kind', 'circle'))
+        class Circle:
+            size: int
+
+        @serializing_option(tag=('kind', 'square'))
+        class Square:
+            size: int
+
+        json_data: JsonFormat = [{'kind': 'square', 'size': 1}, {'kind': 'circle', 'size': 2}, {'size': 3}]
+        with intercept_log(lambda message: self.assertTrue(False)):
+            deserialized_data: List[Union[Circle, Square]] = from_data_to(List[Union[Circle, Square]], json_data)
+
+        self.assertTrue(isinstance(deserialized_data[0], Square))
+        self.assertTrue(isinstance(deserialized_data[1], Circle))
+        self.assertTrue(isinstance(deserialized_data[2], Circle))
+        self.assertEqual([item.size for item in deserialized_data], [1, 2, 3])
+
+        serialized_data: JsonFormat = to_json_from(deserialized_data)
+        self.assertEqual(serialized_data[0], {'kind': 'square', 'size': 1})
+        self.assertEqual(from_json_bytes(to_json_bytes_from(deserialized_data)), serialized_data)
+        round_trip_data: List[Union[Circle, Square]] = from_data_to(List[Union[Square, Circle]], serialized_data)
+        self.assertEqual([type(item) for item in round_trip_data], [Square, Circle, Circle])
+
+        with self.assertRaises(TypeError):
+            serializing_option(tag=('kind', ['circle']))
+
+    def test_union_order_deserialize(self):
+        json_data: JsonFormat = {'a': 1, 'b': 'test'}
+        self.assertEqual(from_data_to(Union[Dict[Text, Any], Item], json_data), json_data)
+        test_item_1(self, from_data_to(Union[Item, Dict[Text, Any]], json_data))
+        self.assertEqual(from_data_to(Union[Item, Dict[Text, Any]], {'c': 1}), {'c': 1})
+        self.assertEqual(from_data_to(Union[int, Item], True), True)
+
     def test_enum_deserialize(self):
         class MyIntEnum(IntEnum):
             A = 1
@@ -303,6 +373,127 @@ class TestDeserialization(unittest.TestCase):
         with self.assertRaises(AttributeError):
             b: Text = false_option_data2.b
 
+    def test_recursive_deserialize(self):
+        json_data: JsonFormat = {'value': 0, 'children': [{'value': 1, 'children': []},
+                                                          {'value': 2, 'children': [{'value': 3, 'children': []}]}]}
+        deserialized_data: Node = from_data_to(Node, json_data)
+        self.assertEqual(deserialized_data, Node(0, [Node(1, []), Node(2, [Node(3, [])])]))
+
+    def test_cached_deserializer(self):
+        deserializer: Deserializer = get_deserializer(List[Item])
+        self.assertIs(deserializer, get_deserializer(List[Item]))
+        test_item_list(self, deserializer([{'a': 1, 'b': 'test'}, {'a': 2, 'b': 'test2'}]))
+
+        with self.assertRaises(TypeError):
+            get_deserializer(Callable)
+
+        with self.assertRaises(DeserializingFailError):
+            from_data_to(Callable, 1)
+
+    def test_compiling_deserializer(self):
+        deserialization._clear_deserializers()
+        has_published_node: List[bool] = []
+        compile_deserializer: Callable = deserialization.compile_deserializer
+
+        def compile_and_check(annotation: Any, option: Any) -> Deserializer:
+            has_published_node.append(any(key[0] is Node for key in list(deserialization._deserializers)))
+            return compile_deserializer(annotation, option)
+
+        with patch.object(deserialization, 'compile_deserializer', compile_and_check):
+            deserializer: Deserializer = get_deserializer(Node)
+
+        self.assertNotIn(True, has_published_node)
+        self.assertEqual(deserializer({'value': 0, 'children': [{'value': 1, 'children': []}]}),
+                         Node(0, [Node(1, [])]))
+
+        with patch.object(deserialization, '_MAX_DESERIALIZERS_COUNT', 2):
+            for _ in range(3):
+                get_deserializer(type('Created', (), {'__annotations__': {'a': int}}))
+
+            self.assertLessEqual(len(deserialization._deserializers), 2)
+
+    def test_interning_deserialize(self):
+        @serializing_option(interns=True)
+        @dataclass(frozen=True)
+        class Status:
+            code: int
+            label: Text
+
+        @dataclass
+        class Response:
+            status: Status
+            tags: Dict[Text, Text]
+
+        json_data: JsonFormat = [{'status': {'code': 200, 'label': ''.join(['o', 'k'])},
+                                  'tags': {''.join(['ke', 'y']): ''.join(['val', 'ue'])}} for _ in range(2)]
+        responses: List[Response] = from_data_to(List[Response], json_data)
+        self.assertIs(responses[0].status, responses[1].status)
+        self.assertIsNot(responses[0].tags['key'], responses[1].tags['key'])
+
+        responses = from_data_to(List[Response], json_data, interns=True)
+        self.assertIs(responses[0].tags['key'], responses[1].tags['key'])
+        self.assertIs(next(iter(responses[0].tags)), next(iter(responses[1].tags)))
+
+        set_intern_table_size(0)
+        try:
+            responses = from_data_to(List[Response], json_data)
+            self.assertEqual(responses[0].status, responses[1].status)
+        finally:
+            set_intern_table_size()
+
+    def test_interning_equal_values_of_other_types(self):
+        @serializing_option(interns=True)
+        @dataclass(frozen=True)
+        class Value:
+            v: Any
+
+        @serializing_option(interns=True)
+        @dataclass(frozen=True)
+        class Pair:
+            value: Value
+            other: Value
+
+        values: List[Value] = from_data_to(List[Value], [{'v': 1}, {'v': True}, {'v': 1.0}, {'v': 1}])
+        self.assertEqual([type(value.v) for value in values], [int, bool, float, int])
+        self.assertIs(values[0], values[3])
+
+        pairs: List[Pair] = from_data_to(List[Pair], [{'value': {'v': 1}, 'other': {'v': 1}},
+                                                      {'value': {'v': True}, 'other': {'v': 1}},
+                                                      {'value': {'v': 1}, 'other': {'v': 1.0}}])
+        self.assertEqual([(type(pair.value.v), type(pair.other.v)) for pair in pairs],
+                         [(int, int), (bool, int), (int, float)])
+
+    def test_lazy_deserialize(self):
+        json_data: JsonFormat = {'value': 0, 'children': [{'value': 1, 'children': []},
+                                                          {'value': 2, 'children': [{'value': 3, 'children': 'x'}]}]}
+        deserialized_data: Node = from_data_to(Node, json_data, lazy=True)
+        children: List[Node] = deserialized_data.children
+        self.assertIsInstance(children[0], Node)
+        self.assertFalse(is_materialized(children[0]))
+        self.assertEqual(children[0].value, 1)
+        self.assertTrue(is_materialized(children[0]))
+        self.assertEqual(children[0], Node(1, []))
+        self.assertFalse(is_materialized(children[1]))
+        with self.assertRaises(DeserializingFailError):
+            value: int = children[1].children[0].value
+
+        self.assertEqual(to_json_from(from_data_to(Node, json_data['children'][0], lazy=True)),
+                         json_data['children'][0])
+
+        @serializing_option(lazy=True)
+        class LazyItem(Item):
+            pass
+
+        class LazyContainer:
+            items: List[LazyItem]
+            item: Item
+
+        container: LazyContainer = from_data_to(LazyContainer, {'items': [{'a': 1, 'b': 'test'}],
+                                                                'item': {'a': 2, 'b': 'test2'}})
+        self.assertFalse(is_materialized(container.items[0]))
+        self.assertTrue(is_materialized(container.item))
+        test_item_1(self, container.items[0])
+
     def test_not_matched_deserialize(self):
         class Container:
             a: bool
@@ -339,6 +530,12 @@ class Item:
     b: Text
 
 
+@dataclass
+class Node:
+    value: int
+    children: List['Node']
+
+
 def test_item(test_case: unittest.TestCase, item: Item, **kwargs):
     for name, value in kwargs.items():
         test_case.assertEqual(getattr(item, name), value)
@@ -0,0 +1,427 @@
+import asyncio
+from dataclasses import dataclass
+import os
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
+from typing import Any, List, Text
+import unittest
+from unittest.mock import patch
+
+from expire_dict import Eviction, ExpireDict, ExpireDictStats, ShardedExpireDict, Sweeper
+from json_data import get_deserializer
+from memoize import memoize
+
+
+@dataclass
+class Item:
+    name: Text
+    count: int
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestExpireDict(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.clock: FakeClock = FakeClock()
+
+    async def test_item(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, clock=self.clock, a=1)
+        expire_dict['b'] = 2
+
+        self.assertEqual(expire_dict['a'], 1)
+        self.assertEqual(expire_dict.get('b'), 2)
+        self.assertEqual(expire_dict.setdefault('c', 3), 3)
+        self.assertEqual(expire_dict.pop('c'), 3)
+        self.assertIsNone(expire_dict.get('c'))
+        del expire_dict['b']
+        self.assertNotIn('b', expire_dict)
+        self.assertEqual(list(expire_dict), ['a'])
+
+    async def test_expire(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, clock=self.clock, a=1, b=2)
+        self.clock.now = 9
+        self.assertEqual(expire_dict['a'], 1)
+
+        self.clock.now = 10
+        self.assertNotIn('b', expire_dict)
+        with self.assertRaises(KeyError):
+            value: int = expire_dict['b']
+
+        self.clock.now = 18
+        self.assertEqual(expire_dict.expire(), 0)
+        self.clock.now = 19
+        self.assertEqual(expire_dict.expire(), 1)
+        self.assertEqual(len(expire_dict), 0)
+
+    async def test_life_time_per_item(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, clock=self.clock)
+        expire_dict.set('short', 1, life_time=1)
+        expire_dict['long'] = 2
+        expire_dict.set('longer', 3, life_time=100)
+
+        self.clock.now = 1
+        self.assertNotIn('short', expire_dict)
+        self.assertEqual(expire_dict.expire(), 1)
+        self.clock.now = 10
+        self.assertEqual(expire_dict.expire(), 1)
+        self.assertEqual(list(expire_dict), ['longer'])
+
+    async def test_lru_eviction(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, max_count=2, clock=self.clock, a=1, b=2)
+        self.assertEqual(expire_dict['a'], 1)
+        expire_dict['c'] = 3
+
+        self.assertEqual(list(expire_dict), ['a', 'c'])
+
+    async def test_lfu_eviction(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, max_count=2, eviction=Eviction.LFU, clock=self.clock,
+                                                       a=1, b=2)
+        for key in ['a', 'b', 'a']:
+            value: int = expire_dict[key]
+
+        expire_dict['c'] = 3
+        expire_dict['d'] = 4
+
+        self.assertEqual(list(expire_dict), ['a', 'd'])
+
+    async def test_size_eviction(self):
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, 5, max_size=10, sizeof=len, clock=self.clock)
+        for key in ['a', 'b', 'c']:
+            expire_dict[key] = 'test'
+
+        self.assertEqual(list(expire_dict), ['b', 'c'])
+        self.assertEqual(expire_dict.get_stats().size, 10)
+
+    async def test_expired_before_eviction(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, max_count=2, clock=self.clock)
+        expire_dict.set('a', 1, life_time=1)
+        expire_dict['b'] = 2
+        self.clock.now = 1
+        expire_dict['c'] = 3
+
+        self.assertEqual(list(expire_dict), ['b', 'c'])
+        self.assertEqual(expire_dict.get_stats(), ExpireDictStats(0, 0, 1, 0, 2, 0))
+
+    async def test_stats(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, 5, max_count=1, clock=self.clock, a=1)
+        expire_dict.get('a')
+        expire_dict.get('b')
+        expire_dict['b'] = 2
+        self.clock.now = 10
+        expire_dict.get('b')
+
+        stats: ExpireDictStats = expire_dict.get_stats()
+        self.assertEqual(stats, ExpireDictStats(hits=1, misses=2, expirations=1, evictions=1, count=0, size=0))
+        self.assertEqual(stats.hit_ratio, 1 / 3)
+        expire_dict.reset_stats()
+        self.assertEqual(expire_dict.get_stats().hits, 0)
+
+    def test_per_item_life_times(self):
+        expire_dict: ExpireDict[int, int] = ExpireDict(10, None, clock=self.clock)
+        for key in range(1, 6):
+            expire_dict.set(key, key, life_time=key)
+
+        expire_dict[0] = 0
+        self.clock.now = 1.5
+        self.assertEqual(expire_dict[2], 2)
+        self.assertEqual(expire_dict.expire(), 1)
+        self.assertEqual(len(expire_dict._overrides), 4)
+
+        self.clock.now = 3
+        self.assertEqual(expire_dict.expire(), 1)
+        self.assertEqual(sorted(expire_dict), [0, 2, 4, 5])
+        self.clock.now = 10
+        self.assertEqual(expire_dict.expire(), 4)
+        self.assertEqual(len(expire_dict._overrides), 0)
+
+    async def test_refresh_ahead(self):
+        loads: List[str] = []
+
+        async def load(key: str) -> str:
+            loads.append(key)
+            return f'{key}{len(loads)}'
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, refresh_ratio=0.5, clock=self.clock)
+        self.assertEqual(await expire_dict.fetch('a'), 'a1')
+        self.clock.now = 4
+        self.assertEqual(expire_dict['a'], 'a1')
+        self.assertNotIn('a', expire_dict._loads)
+
+        self.clock.now = 5
+        self.assertEqual(expire_dict['a'], 'a1')
+        self.assertEqual(expire_dict['a'], 'a1')
+        await asyncio.sleep(0)
+        self.assertEqual(expire_dict['a'], 'a2')
+        self.assertEqual(loads, ['a', 'a'])
+
+    async def test_failed_refresh(self):
+        async def fail(key: str) -> str:
+            raise ValueError(key)
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=fail, max_age=20, clock=self.clock)
+        expire_dict['a'] = 'a0'
+        for now in [5, 10, 15]:
+            self.clock.now = now
+            with self.assertLogs('expire_dict', 'WARNING'):
+                self.assertEqual(expire_dict['a'], 'a0')
+                for _ in range(2):
+                    await asyncio.sleep(0)
+
+            with self.assertNoLogs('expire_dict', 'WARNING'):
+                self.assertEqual(expire_dict['a'], 'a0')
+                for _ in range(2):
+                    await asyncio.sleep(0)
+
+        self.assertEqual(expire_dict._dict['a'].refresh_time, 17)
+        self.clock.now = 20
+        self.assertNotIn('a', expire_dict)
+        with self.assertRaises(ValueError):
+            await expire_dict.fetch('a')
+
+    async def test_refresh_after_delete(self):
+        loaded: asyncio.Event = asyncio.Event()
+
+        async def load(key: str) -> str:
+            await loaded.wait()
+            return key
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, max_age=20, clock=self.clock)
+        expire_dict['a'] = expire_dict['b'] = 'x'
+        self.clock.now = 5
+        self.assertEqual([expire_dict['a'], expire_dict['b']], ['x', 'x'])
+        del expire_dict['a']
+        expire_dict['b'] = 'y'
+        loaded.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        self.assertNotIn('a', expire_dict)
+        self.assertEqual(expire_dict['b'], 'y')
+        with self.assertRaises(KeyError):
+            await ExpireDict(10, None).fetch('a')
+
+    def test_expire_after_max_age(self):
+        async def load(key: str) -> str:
+            return key
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, max_age=12, clock=self.clock)
+        expire_dict['a'] = 'a0'
+        expire_dict['b'] = 'b0'
+        self.clock.now = 8
+        self.assertEqual(expire_dict['a'], 'a0')
+        self.clock.now = 12
+        self.assertEqual(expire_dict.expire(), 2)
+        self.assertEqual(len(expire_dict), 0)
+
+    async def test_fetch_single_flight(self):
+        loads: List[str] = []
+
+        async def load(key: str) -> str:
+            loads.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, clock=self.clock)
+        self.assertEqual(await asyncio.gather(*[expire_dict.fetch('a') for _ in range(4)]), ['a'] * 4)
+        self.assertEqual(loads, ['a'])
+
+    async def test_auto_expire(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(0.01, 0.01)
+        expire_dict['a'] = 1
+        self.assertIsNotNone(expire_dict._expire_handler)
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(expire_dict), 0)
+        self.assertIsNone(expire_dict._expire_handler)
+
+
+class TestExpireDictSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock: FakeClock = FakeClock()
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.path: Text = os.path.join(self.directory.name, 'snapshot.json')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_dump_and_load(self):
+        expire_dict: ExpireDict[str, Item] = ExpireDict(10, None, clock=self.clock, a=Item('a', 1))
+        expire_dict.set('b', Item('b', 2), life_time=100)
+        expire_dict.set('c', Item('c', 3), life_time=1)
+        self.clock.now = 1
+        expire_dict.dump_snapshot(self.path)
+        self.assertEqual(os.listdir(self.directory.name), ['snapshot.json'])
+
+        clock: FakeClock = FakeClock()
+        loaded_dict: ExpireDict[str, Item] = ExpireDict(10, None, clock=clock)
+        self.assertEqual(loaded_dict.load_snapshot(self.path, decode=get_deserializer(Item)), 2)
+        self.assertEqual(loaded_dict['b'], Item('b', 2))
+        self.assertEqual(sorted(loaded_dict), ['a', 'b'])
+
+        clock.now = 9
+        self.assertEqual(loaded_dict.expire(), 1)
+        self.assertEqual(list(loaded_dict), ['b'])
+
+    def test_load_into_other_life_time(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, None, clock=self.clock, a=1)
+        expire_dict.set('b', 2, life_time=20)
+        expire_dict.dump_snapshot(self.path)
+
+        loaded_dict: ExpireDict[str, int] = ExpireDict(20, None, clock=self.clock)
+        self.assertEqual(loaded_dict.load_snapshot(self.path), 2)
+        self.assertEqual([len(loaded_dict._queue), len(loaded_dict._overrides)], [1, 1])
+        self.clock.now = 5
+        self.assertEqual([loaded_dict['a'], loaded_dict['b']], [1, 2])
+
+        self.clock.now = 15
+        self.assertEqual(loaded_dict.expire(), 1)
+        self.assertEqual(list(loaded_dict), ['b'])
+
+    def test_drop_expired_meanwhile(self):
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, None, clock=self.clock, a=1)
+        expire_dict.set('b', 2, life_time=100)
+        with patch('expire_dict.time', return_value=1000):
+            expire_dict.dump_snapshot(self.path)
+
+        loaded_dict: ExpireDict[str, int] = ExpireDict(10, None, clock=self.clock)
+        with patch('expire_dict.time', return_value=1050):
+            self.assertEqual(loaded_dict.load_snapshot(self.path), 1)
+
+        self.clock.now = 49
+        self.assertEqual(loaded_dict.expire(), 0)
+        self.clock.now = 50
+        self.assertEqual(loaded_dict.expire(), 1)
+
+    def test_load_into_items(self):
+        snapshot_dict: ExpireDict[str, int] = ExpireDict(10, None, clock=self.clock, a=1, b=2)
+        self.clock.now = 3
+        snapshot_dict.dump_snapshot(self.path)
+        self.clock.now = 5
+        expire_dict: ExpireDict[str, int] = ExpireDict(10, None, clock=self.clock, b=20, c=30)
+        self.assertEqual(expire_dict.load_snapshot(self.path), 2)
+        self.assertEqual(expire_dict['b'], 2)
+
+        self.clock.now = 12
+        self.assertEqual(expire_dict.expire(), 1)
+        self.assertEqual(list(expire_dict), ['c', 'b'])
+
+        bounded_dict: ExpireDict[str, int] = ExpireDict(10, None, max_count=1, clock=self.clock)
+        self.assertEqual(bounded_dict.load_snapshot(self.path), 2)
+        self.assertEqual(bounded_dict.get_stats().evictions, 1)
+        self.assertEqual(len(bounded_dict), 1)
+
+    def test_ages(self):
+        async def load(key: str) -> str:
+            return key
+
+        expire_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, max_age=20, clock=self.clock, a='a')
+        self.clock.now = 5
+        expire_dict.dump_snapshot(self.path)
+
+        loaded_dict: ExpireDict[str, str] = ExpireDict(10, None, loader=load, max_age=20, clock=self.clock)
+        loaded_dict.load_snapshot(self.path)
+        for now in [9, 15, 19.5]:
+            self.clock.now = now
+            self.assertEqual(loaded_dict['a'], 'a')
+
+        self.clock.now = 20
+        self.assertNotIn('a', loaded_dict)
+
+    def test_keys(self):
+        keys: List[Any] = ['a', 1, 1.5, False, None, ('a', 1), (('a', (1.0, False)), ()), frozenset('ab'), (Item, 'a')]
+        expire_dict: ExpireDict[Any, int] = ExpireDict(10, None, clock=self.clock)
+        for index, key in enumerate(keys):
+            expire_dict[key] = index
+
+        expire_dict.dump_snapshot(self.path, pauses_gc=True)
+        loaded_dict: ExpireDict[Any, int] = ExpireDict(10, None, clock=self.clock)
+        loaded_dict.load_snapshot(self.path)
+        self.assertEqual([loaded_dict[key] for key in keys], list(range(len(keys))))
+
+        loaded_dict = ExpireDict(10, None, clock=self.clock)
+        loaded_dict.load_snapshot(self.path, decode_key=lambda key: f'{key}')
+        self.assertEqual(loaded_dict['a'], 0)
+
+        expire_dict[object()] = 0
+        with self.assertRaises(TypeError):
+            expire_dict.dump_snapshot(self.path)
+
+        expire_dict.dump_snapshot(self.path, encode_key=repr)
+        self.assertEqual(loaded_dict.load_snapshot(self.path), len(keys) + 1)
+
+    def test_memoize_cache(self):
+        @memoize
+        def get_name(item: Item, suffix: Text = '') -> Text:
+            calls.append(item)
+            return item.name + suffix
+
+        calls: List[Item] = []
+        self.assertEqual([get_name(Item('a', 1)), get_name(Item('a', 1), suffix='b')], ['a', 'ab'])
+        get_name.cache.dump_snapshot(self.path)
+        get_name.cache_clear()
+        get_name.cache.load_snapshot(self.path)
+        self.assertEqual([get_name(Item('a', 1)), get_name(Item('a', 1), suffix='b')], ['a', 'ab'])
+        self.assertEqual(len(calls), 2)
+
+
+class TestShardedExpireDict(unittest.TestCase):
+    def test_item(self):
+        clock: FakeClock = FakeClock()
+        expire_dict: ShardedExpireDict[int, int] = ShardedExpireDict(10, 5, shards_count=4, clock=clock)
+        try:
+            for key in range(10):
+                expire_dict[key] = key
+
+            expire_dict.set(10, 10, life_time=1)
+            self.assertEqual(expire_dict[3], 3)
+            self.assertEqual(expire_dict.setdefault(11, 11), 11)
+            self.assertEqual(expire_dict.pop(11), 11)
+            self.assertEqual(sorted(expire_dict), list(range(11)))
+
+            clock.now = 1
+            self.assertNotIn(10, expire_dict)
+            self.assertEqual(expire_dict.expire(), 1)
+            self.assertEqual(len(expire_dict), 10)
+        finally:
+            expire_dict.close()
+
+    def test_threads(self):
+        expire_dict: ShardedExpireDict[int, int] = ShardedExpireDict(10, 5, max_count=1000)
+
+        def use(offset: int):
+            for key in range(offset, offset + 1000):
+                expire_dict[key] = key
+                expire_dict.get(key - 1)
+
+        threads: List[Thread] = [Thread(target=use, args=(offset * 1000,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(len(expire_dict), 1000 + 16)
+        self.assertEqual(expire_dict.get_stats().hits + expire_dict.get_stats().misses, 4000)
+        expire_dict.close()
+
+    def test_thread_sweeper(self):
+        expire_dict: ShardedExpireDict[str, int] = ShardedExpireDict(0.01, 0.01, a=1)
+        sleep(0.1)
+        self.assertEqual(len(expire_dict), 0)
+        expire_dict.close()
+
+    def test_task_sweeper(self):
+        async def use_in_loop():
+            expire_dict: ShardedExpireDict[str, int] = ShardedExpireDict(0.01, 0.01, sweeper=Sweeper.TASK, a=1)
+            await asyncio.sleep(0.1)
+            self.assertEqual(len(expire_dict), 0)
+            expire_dict.close()
+
+        asyncio.run(use_in_loop())
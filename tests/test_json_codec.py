@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, IntEnum
+import json
+from typing import Any, Callable, List, NamedTuple, Text
+import unittest
+from uuid import UUID
+
+from json_data import (DeserializingFailError, JsonBackend, SerializingFailError, create_json_backend, from_json_bytes,
+                       from_json_bytes_to, get_json_backend, set_json_backend, to_json_bytes_from, to_json_from)
+from json_data.json_codec import _create_orjson_backend, _create_ujson_backend, _stdlib_backend
+from slotdataclass import slotdataclass
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.default_backend: JsonBackend = get_json_backend()
+
+    def tearDown(self) -> None:
+        set_json_backend(self.default_backend)
+
+    def test_bytes_serialize(self):
+        for backend in (self.default_backend, create_json_backend('json', json.dumps, json.loads)):
+            set_json_backend(backend)
+            item: Container = Container([SlotItem(1, 'test'), SlotItem(2, 'test2')], TupleItem(Color.RED, [1, 2]))
+            self.assertEqual(json.loads(to_json_bytes_from(item)), to_json_from(item))
+            self.assertEqual(from_json_bytes(to_json_bytes_from(item)), to_json_from(item))
+
+    def test_same_bytes_on_backends(self):
+        class Moment(datetime):
+            pass
+
+        class Name(str):
+            pass
+
+        class Level(IntEnum):
+            HIGH = 2
+
+        class Priority(Enum):
+            HIGH = 'high'
+
+        to_json_from.register(Moment, lambda moment: moment.strftime('%Y/%m/%d'))
+        to_json_from.register(Priority, lambda priority: priority.name.lower())
+        data: Any = {'moment': Moment(2020, 1, 2, 3, 4, 5), 'datetime': datetime(2020, 1, 2), 'name': Name('name'),
+                     'level': Level.HIGH, 'priority': Priority.HIGH,
+                     'id': UUID('12345678-1234-5678-1234-567812345678'), 'items': [SlotItem(1, 'test')]}
+        expected: Any = {'moment': '2020/01/02', 'datetime': '2020-01-02T00:00:00', 'name': 'name', 'level': 2,
+                         'priority': 'high', 'id': '12345678-1234-5678-1234-567812345678',
+                         'items': [{'a': 1, 'b': 'test'}]}
+        for backend in (_create_orjson_backend(), _create_ujson_backend(), _stdlib_backend):
+            if backend is None:
+                continue
+
+            set_json_backend(backend)
+            self.assertEqual(json.loads(to_json_bytes_from(data)), expected, backend.name)
+
+    def test_special_value_serialize(self):
+        moment: datetime = datetime(2020, 1, 2, 3, 4, 5)
+        self.assertEqual(from_json_bytes(to_json_bytes_from({'moment': moment})), {'moment': moment.isoformat()})
+        self.assertEqual(from_json_bytes(b''), None)
+
+    def test_bytes_deserialize(self):
+        item: Container = Container([SlotItem(1, 'test')], TupleItem(Color.RED, [1, 2]))
+        self.assertEqual(from_json_bytes_to(Container, to_json_bytes_from(item)), item)
+
+        with self.assertRaises(DeserializingFailError):
+            from_json_bytes_to(Container, b'{"items": [')
+
+    def test_no_serializable_value(self):
+        @dataclass
+        class NoSerializableItem:
+            a: int
+            b: Callable
+
+        with self.assertRaises(SerializingFailError):
+            to_json_bytes_from(NoSerializableItem(1, print))
+
+
+class Color(Enum):
+    RED = 'red'
+
+
+@slotdataclass
+@dataclass
+class SlotItem:
+    a: int
+    b: Text
+
+
+class TupleItem(NamedTuple):
+    color: Color
+    values: List[int]
+
+
+@dataclass
+class Container:
+    items: List[SlotItem]
+    tuple_item: TupleItem
@@ -0,0 +1,73 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List, Text
+import unittest
+
+from json_data import (MISSED_VARIABLES_MESSAGE, DeserializingFailError, JsonArrayParser, JsonFormat, ValidationFinding,
+                       async_iterate_json_array_to, get_validation_report, iterate_json_array_to,
+                       reset_validation_report, to_json_bytes_from)
+from logger import intercept_log
+
+
+class TestJsonStream(unittest.TestCase):
+    def test_parse_chunks(self):
+        json_data: JsonFormat = [{'a': 1, 'b': 'x]", {'}, [1, [2, []]], 'a\\"b,', None, True, -1.5, {}]
+        body: bytes = to_json_bytes_from(json_data)
+        for size in (1, 3, len(body)):
+            parser: JsonArrayParser = JsonArrayParser()
+            elements: List[JsonFormat] = []
+            for chunk in split(body, size):
+                elements.extend(parser.feed(chunk))
+
+            parser.close()
+            self.assertEqual(elements, json_data)
+
+    def test_yield_on_complete(self):
+        parser: JsonArrayParser = JsonArrayParser()
+        self.assertEqual(parser.feed(b' [{"a": 1'), [])
+        self.assertEqual(parser.feed(b'}, {"a"'), [{'a': 1}])
+        self.assertEqual(parser.feed(b': 2}, 3'), [{'a': 2}])
+        self.assertEqual(parser.feed(b']'), [3])
+        self.assertTrue(parser.is_finished)
+
+    def test_iterate_items(self):
+        body: bytes = b'[{"a": 1, "b": "test"}, {"a": 2, "b": "test2"}]'
+        items: Iterator[Item] = iterate_json_array_to(Item, split(body, 4))
+        self.assertEqual(next(items), Item(1, 'test'))
+        self.assertEqual(list(items), [Item(2, 'test2')])
+
+        async def get_chunks() -> AsyncIterator[bytes]:
+            for chunk in split(body, 4):
+                yield chunk
+
+        async def get_items() -> List[Item]:
+            return [item async for item in async_iterate_json_array_to(Item, get_chunks())]
+
+        self.assertEqual(asyncio.run(get_items()), [Item(1, 'test'), Item(2, 'test2')])
+
+    def test_one_summary_per_stream(self):
+        reset_validation_report()
+        body: bytes = b'[{"a": 1}, {"a": 2}, {"a": 3}]'
+        messages: List[Text] = []
+        with intercept_log(messages.append, needs_full_format_log=False):
+            items: List[Item] = list(iterate_json_array_to(Item, split(body, 4)))
+
+        self.assertEqual([item.a for item in items], [1, 2, 3])
+        self.assertEqual(len(messages), 1)
+        self.assertIn(f"{MISSED_VARIABLES_MESSAGE} of Item: b (3)", messages[0])
+        self.assertEqual(get_validation_report(), {ValidationFinding(MISSED_VARIABLES_MESSAGE, Item, 'b'): 3})
+
+    def test_invalid_stream(self):
+        for body in (b'[1,]', b'[,1]', b'{}', b'[1 2]', b'[{} 1]', b'[1}', b'[1] 2', b'[1', b'[{]'):
+            with self.assertRaises(DeserializingFailError):
+                list(iterate_json_array_to(int, split(body, 2)))
+
+
+@dataclass
+class Item:
+    a: int
+    b: Text
+
+
+def split(body: bytes, size: int) -> Iterator[bytes]:
+    return (body[index:index + size] for index in range(0, len(body), size))
@@ -0,0 +1,188 @@
+import asyncio
+from dataclasses import dataclass, make_dataclass
+from threading import Event, Thread
+from typing import Any, List
+import unittest
+
+from memoize import memoize
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Interruption(BaseException):
+    pass
+
+
+class TestMemoize(unittest.IsolatedAsyncioTestCase):
+    def test_function(self):
+        calls: List[int] = []
+
+        @memoize
+        def double(value: int) -> int:
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual([double(1), double(1), double(value=1), double(2)], [2, 2, 2, 4])
+        self.assertEqual(calls, [1, 1, 2])
+        double.cache_clear()
+        double(1)
+        self.assertEqual(calls, [1, 1, 2, 1])
+
+    def test_dataclass_argument(self):
+        calls: List[Point] = []
+
+        @memoize(life_time=10)
+        def get_sum(point: Point) -> int:
+            calls.append(point)
+            return point.x + point.y
+
+        self.assertEqual([get_sum(Point(1, 2)), get_sum(Point(1, 2)), get_sum(Point(2, 1))], [3, 3, 3])
+        self.assertEqual(calls, [Point(1, 2), Point(2, 1)])
+
+    def test_equal_arguments_of_other_types(self):
+        @memoize
+        def get_type(value: Any) -> type:
+            return type(value)
+
+        arguments: List[Any] = [1, True, 1.0, [1], [True], {'a': 1}, {'a': 1.0}, [['a', 1]], 1, [1]]
+        self.assertEqual([get_type(argument) for argument in arguments],
+                         [int, bool, float, list, list, dict, dict, list, int, list])
+        self.assertEqual(len(get_type.cache), 8)
+
+    def test_container_arguments(self):
+        @memoize
+        def get_sum(values: Any) -> int:
+            return sum(values)
+
+        arguments: List[Any] = [(1, 2), (3, 4), frozenset([1, 2]), {3, 4}, frozenset([3, 4]), (1, 2)]
+        self.assertEqual([get_sum(argument) for argument in arguments], [3, 7, 3, 7, 7, 3])
+        self.assertEqual(len(get_sum.cache), 5)
+
+    def test_classes_of_the_same_name(self):
+        @memoize
+        def get_type(value: Any) -> type:
+            return type(value)
+
+        OtherPoint: type = make_dataclass('Point', [('x', int), ('y', int)])
+        self.assertEqual([get_type(Point(1, 2)), get_type(OtherPoint(1, 2))], [Point, OtherPoint])
+
+    def test_error(self):
+        calls: List[int] = []
+
+        def fail(value: int):
+            calls.append(value)
+            raise ValueError(value)
+
+        for caches_error, expected_calls in [(False, [1, 1]), (True, [1])]:
+            calls.clear()
+            fail_memoized = memoize(fail, caches_error=caches_error)
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    fail_memoized(1)
+
+            self.assertEqual(calls, expected_calls)
+
+    def test_threads_single_flight(self):
+        calls: List[int] = []
+        started: Event = Event()
+        finishes: Event = Event()
+
+        @memoize
+        def wait(value: int) -> int:
+            calls.append(value)
+            started.set()
+            finishes.wait()
+            return value
+
+        results: List[int] = []
+        threads: List[Thread] = [Thread(target=lambda: results.append(wait(1))) for _ in range(4)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+
+        finishes.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [1] * 4)
+        self.assertEqual(calls, [1])
+
+    def test_threads_interruption(self):
+        started: Event = Event()
+        finishes: Event = Event()
+
+        @memoize(caches_error=True)
+        def interrupt(value: int):
+            started.set()
+            finishes.wait()
+            raise Interruption(value)
+
+        results: List[BaseException] = []
+
+        def call():
+            try:
+                interrupt(1)
+            except Interruption as e:
+                results.append(e)
+
+        threads: List[Thread] = [Thread(target=call) for _ in range(4)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+
+        finishes.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len(interrupt.cache), 0)
+
+    async def test_coroutine_function_single_flight(self):
+        calls: List[int] = []
+
+        @memoize
+        async def wait(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        self.assertEqual(await asyncio.gather(*[wait(1) for _ in range(4)], wait(2)), [1, 1, 1, 1, 2])
+        self.assertEqual(await wait(1), 1)
+        self.assertEqual(calls, [1, 2])
+
+    async def test_coroutine_function_error(self):
+        calls: List[int] = []
+
+        @memoize
+        async def fail(value: int):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            raise ValueError(value)
+
+        results: list = await asyncio.gather(fail(1), fail(1), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        with self.assertRaises(ValueError):
+            await fail(1)
+
+        self.assertEqual(calls, [1, 1])
+
+    async def test_cancelled_caller(self):
+        calls: List[int] = []
+
+        @memoize
+        async def wait(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        first: asyncio.Task = asyncio.ensure_future(wait(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await wait(1), 1)
+        self.assertEqual(calls, [1])
@@ -0,0 +1,68 @@
+from copy import copy
+from typing import Text
+import unittest
+
+from dispatch_instrumentation import DispatchStats
+from methoddispatcher import methoddispatcher
+
+
+class Dispatched:
+    @methoddispatcher
+    def describe(self, value: object) -> Text:
+        return 'object'
+
+    @describe.register(int)
+    def _(self, value: int) -> Text:
+        return 'int'
+
+    @methoddispatcher((1, 2))
+    def combine(self, x: object, y: object) -> Text:
+        return 'object, object'
+
+    @combine.register(int, int)
+    def _(self, x: int, y: int) -> Text:
+        return 'int, int'
+
+    @combine.register
+    def _(self, x: str, y: object) -> Text:
+        return 'str, object'
+
+    @combine.register((str, bool))
+    def _(self, x: str, y: bool) -> Text:
+        return 'str, bool'
+
+
+class TestMethodDispatcher(unittest.TestCase):
+    def test_dispatch(self):
+        self.assertEqual(Dispatched().describe(1), 'int')
+        self.assertEqual(Dispatched().describe('a'), 'object')
+
+    def test_multiple_arguments_dispatch(self):
+        dispatched: Dispatched = Dispatched()
+        self.assertEqual(dispatched.combine(1, 2), 'int, int')
+        self.assertEqual(dispatched.combine(True, 2), 'int, int')
+        self.assertEqual(dispatched.combine(1, 'a'), 'object, object')
+        self.assertEqual(dispatched.combine('a', 1), 'str, object')
+        self.assertEqual(dispatched.combine('a', True), 'str, bool')
+        self.assertEqual(Dispatched.combine.dispatch((str, bool)).__name__, '_')
+
+    def test_bound_to_copy(self):
+        dispatched: Dispatched = Dispatched()
+        dispatched.describe(1)
+        copied: Dispatched = copy(dispatched)
+        self.assertIs(copied.describe.__self__, copied)
+        self.assertEqual(vars(dispatched), {})
+
+    def test_instrument(self):
+        Dispatched.describe.instrument()
+        try:
+            for value in (1, True, 'a'):
+                Dispatched().describe(value)
+
+            stats: DispatchStats = Dispatched.describe.get_dispatch_stats()
+            self.assertEqual(stats.case_hits, {int: 1, bool: 1})
+            self.assertEqual(stats.default_hits, 1)
+        finally:
+            Dispatched.describe.instrument(False)
+
+        self.assertIsNone(Dispatched.describe.get_dispatch_stats())
@@ -0,0 +1,72 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Text
+import unittest
+
+from json_data import (MISSED_VARIABLES_MESSAGE, DeserializingFailError, JsonFormat, LazyObject, ValidationFinding,
+                       async_from_data_to, from_data_to, get_validation_report, reset_validation_report,
+                       set_parallel_deserialization)
+from logger import intercept_log
+
+
+class TestParallelDeserialization(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_parallel_deserialization()
+
+    def test_parallel_deserialize(self):
+        json_data: JsonFormat = [{'a': index, 'b': f'test{index}'} for index in range(10)]
+        for executor in (ThreadPoolExecutor(2), ProcessPoolExecutor(2)):
+            with executor:
+                set_parallel_deserialization(threshold=4, chunk_size=3, executor=executor)
+                self.assertEqual(asyncio.run(async_from_data_to(List[Item], json_data)),
+                                 from_data_to(List[Item], json_data))
+                self.assertEqual(asyncio.run(async_from_data_to(Item, json_data)), from_data_to(Item, json_data))
+
+    def test_parallel_deserialize_error(self):
+        json_data: JsonFormat = [{'a': 1, 'b': 'test'}, {'a': 'x', 'b': 'test'}, 1, {'a': 'y', 'b': 'test'}]
+        with ThreadPoolExecutor(2) as executor:
+            set_parallel_deserialization(threshold=2, chunk_size=1, executor=executor)
+            with self.assertRaises(DeserializingFailError) as context:
+                asyncio.run(async_from_data_to(List[Item], json_data))
+
+        self.assertIn("'x: str'", str(context.exception))
+
+    def test_parallel_report(self):
+        reset_validation_report()
+        json_data: JsonFormat = [{'a': index} for index in range(10)]
+        messages: List[Text] = []
+        for executor in (ThreadPoolExecutor(2), ProcessPoolExecutor(2)):
+            with executor, intercept_log(messages.append, needs_full_format_log=False):
+                set_parallel_deserialization(threshold=4, chunk_size=3, executor=executor)
+                asyncio.run(async_from_data_to(List[Item], json_data))
+
+        self.assertEqual(len(messages), 2)
+        self.assertIn(f"{MISSED_VARIABLES_MESSAGE} of Item: b (10)", messages[0])
+        self.assertEqual(get_validation_report(), {ValidationFinding(MISSED_VARIABLES_MESSAGE, Item, 'b'): 20})
+
+    def test_parallel_options(self):
+        json_data: JsonFormat = [{'a': 1, 'b': 'test'} for _ in range(10)]
+        with ThreadPoolExecutor(2) as executor:
+            set_parallel_deserialization(threshold=4, chunk_size=3, executor=executor)
+            items: List[Item] = asyncio.run(async_from_data_to(List[Item], json_data, interns=True))
+            self.assertTrue(all(item.b is items[0].b for item in items))
+            items = asyncio.run(async_from_data_to(List[Item], json_data, lazy=True))
+            self.assertIsInstance(items[0], LazyObject)
+
+    def test_unpicklable_deserialize(self):
+        @dataclass
+        class LocalItem:
+            a: int
+
+        json_data: JsonFormat = [{'a': index} for index in range(10)]
+        with ProcessPoolExecutor(2) as executor:
+            set_parallel_deserialization(threshold=4, chunk_size=3, executor=executor)
+            self.assertEqual(asyncio.run(async_from_data_to(List[LocalItem], json_data)),
+                             [LocalItem(index) for index in range(10)])
+
+
+@dataclass
+class Item:
+    a: int
+    b: Text
@@ -0,0 +1,84 @@
+from array import array
+from dataclasses import dataclass
+import pickle
+from typing import NamedTuple, Optional, Text
+import unittest
+
+from json_data import DeserializingFailError, RecordArray, from_data_to, serializing_option, to_json_from
+from slotdataclass import slotdataclass
+
+
+@slotdataclass
+class SlotItem:
+    a: int
+    b: float
+    c: Optional[Text] = None
+
+
+class TupleItem(NamedTuple):
+    a: int
+    b: Text
+
+
+class TestRecordArray(unittest.TestCase):
+    def test_sequence(self):
+        records: RecordArray[SlotItem] = RecordArray(SlotItem, [SlotItem(1, 0.5), SlotItem(2, 1.5, 'test')])
+        records.append(SlotItem(3, 2.5))
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1], SlotItem(2, 1.5, 'test'))
+        self.assertEqual(records[-1], SlotItem(3, 2.5))
+        self.assertEqual(list(records[1:]), [SlotItem(2, 1.5, 'test'), SlotItem(3, 2.5)])
+        self.assertEqual(records.column('a'), array('q', [1, 2, 3]))
+        self.assertEqual(records.column('c'), [None, 'test', None])
+        with self.assertRaises(IndexError):
+            item: SlotItem = records[3]
+
+        records[0] = SlotItem(4, 3.5)
+        self.assertEqual(records[0], SlotItem(4, 3.5))
+        self.assertEqual(pickle.loads(pickle.dumps(records)), records)
+
+    def test_overflow(self):
+        records: RecordArray[TupleItem] = RecordArray(TupleItem, [TupleItem(1, 'test')])
+        records.append(TupleItem(2 ** 70, 'test'))
+
+        self.assertEqual(records[1], TupleItem(2 ** 70, 'test'))
+        self.assertEqual(records.column('a'), [1, 2 ** 70])
+
+    def test_not_record(self):
+        @dataclass
+        class Item:
+            a: int
+
+        with self.assertRaises(TypeError):
+            RecordArray(dict)
+
+        with self.assertRaises(TypeError):
+            RecordArray(Item, [TupleItem(1, 'test')])
+
+    def test_deserialize(self):
+        data = [{'a': 1, 'b': 0.5, 'c': 'test'}, {'a': 2, 'b': 1.5}]
+        records: RecordArray[SlotItem] = from_data_to(RecordArray[SlotItem], data)
+
+        self.assertTrue(isinstance(records, RecordArray))
+        self.assertEqual(list(records), [SlotItem(1, 0.5, 'test'), SlotItem(2, 1.5)])
+        with self.assertRaises(DeserializingFailError):
+            from_data_to(RecordArray[SlotItem], {'a': 1, 'b': 0.5})
+
+        with self.assertRaises(DeserializingFailError):
+            from_data_to(RecordArray[SlotItem], [{'a': 'test', 'b': 0.5, 'c': None}])
+
+    def test_deserialize_with_class_option(self):
+        @serializing_option(interns=True)
+        class InternedItem(NamedTuple):
+            a: int
+            b: Text
+
+        data = [{'a': index, 'b': ''.join(['te', 'st'])} for index in range(2)]
+        records: RecordArray[InternedItem] = from_data_to(RecordArray[InternedItem], data)
+        self.assertEqual(list(records), [InternedItem(0, 'test'), InternedItem(1, 'test')])
+        self.assertIs(records[0].b, records[1].b)
+
+    def test_serialize(self):
+        records: RecordArray[TupleItem] = RecordArray(TupleItem, [TupleItem(1, 'test'), TupleItem(2, 'test2')])
+        self.assertEqual(to_json_from(records), [{'a': 1, 'b': 'test'}, {'a': 2, 'b': 'test2'}])
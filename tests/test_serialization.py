@@ -4,7 +4,7 @@ from typing import Any, Callable, Dict, List, NamedTuple, Text
 import unittest
 
 from json_data import JsonFormat, JsonList, JsonObject, SerializingFailError
-from json_data import to_json_from
+from json_data import Serializer, get_serializer, to_json_from
 from slotdataclass import slotdataclass
 
 
@@ -153,6 +153,28 @@ class TestSerialization(unittest.TestCase):
         serialized_data2: int = to_json_from(item2)
         self.assertEqual(serialized_data2, MyEnum.A.value)
 
+    def test_cached_serializer(self):
+        class NamedTupleItem(NamedTuple):
+            a: int
+            b: List[int]
+
+        serializer: Serializer = get_serializer(NamedTupleItem)
+        self.assertIs(serializer, get_serializer(NamedTupleItem))
+        self.assertEqual(serializer(NamedTupleItem(1, [2, 3])), {'a': 1, 'b': [2, 3]})
+        self.assertEqual(to_json_from(NamedTupleItem(1, [MyIntEnum.A])), {'a': 1, 'b': [MyIntEnum.A.value]})
+
+    def test_register_serialize(self):
+        class Point:
+            def __init__(self, x: int, y: int):
+                self.x: int = x
+                self.y: int = y
+
+        @to_json_from.register(Point)
+        def _(instance: Point) -> JsonFormat:
+            return [instance.x, instance.y]
+
+        self.assertEqual(to_json_from({'point': Point(1, 2)}), {'point': [1, 2]})
+
     def test_no_serializable_value(self):
         @dataclass
         class NoSerializableItem:
@@ -170,6 +192,12 @@ class Item:
     b: Text
 
 
+class MyIntEnum(IntEnum):
+    A = 1
+    B = auto()
+    C = auto()
+
+
 def test_item_1(test_case: unittest.TestCase, item: JsonObject):
     test_case.assertEqual(item, {'a': 1, 'b': 'test'})
 
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Text, Type
+from dataclasses import FrozenInstanceError, dataclass, field
+import pickle
+from typing import Any, Dict, List, Text, Type
 import unittest
+from weakref import ref
 
 from slotdataclass import slotdataclass
 
@@ -46,6 +48,94 @@ class TestSlotdataclass(unittest.TestCase):
 
         test_all(self, SlotSlotClass)
 
+    def test_default(self):
+        @slotdataclass
+        class DefaultClass:
+            a: int
+            b: Text = 'default'
+            c: List[int] = field(default_factory=list)
+
+        data: DefaultClass = DefaultClass(1)
+        self.assertEqual(data.b, 'default')
+        self.assertEqual(data.c, [])
+        self.assertIsNot(data.c, DefaultClass(1).c)
+        test_no_dict(self, DefaultClass)
+
+    def test_frozen_order(self):
+        @slotdataclass(frozen=True, order=True)
+        class FrozenClass:
+            a: int
+            b: Text
+
+        data: FrozenClass = FrozenClass(1, 'asdf')
+        with self.assertRaises(FrozenInstanceError):
+            data.a = 2
+
+        self.assertLess(data, FrozenClass(2, 'asdf'))
+        self.assertEqual(hash(data), hash(FrozenClass(1, 'asdf')))
+        test_all(self, FrozenClass)
+
+    def test_options_of_dataclass(self):
+        @slotdataclass(frozen=True)
+        @dataclass(frozen=True)
+        class FrozenClass:
+            a: int
+
+        with self.assertRaises(FrozenInstanceError):
+            FrozenClass(1).a = 2
+
+        with self.assertRaises(TypeError):
+            @slotdataclass(frozen=True, order=True)
+            @dataclass
+            class OtherClass:
+                a: int
+
+    def test_inheritance(self):
+        @slotdataclass
+        class BaseClass:
+            a: int
+
+            def get(self) -> int:
+                return self.a
+
+        @slotdataclass
+        class DerivedClass(BaseClass):
+            b: Text = 'asdf'
+
+            def get(self) -> int:
+                return super().get() + 1
+
+        data: DerivedClass = DerivedClass(1)
+        self.assertEqual(DerivedClass.__slots__, ('b',))
+        self.assertEqual(data.get(), 2)
+        test_all(self, DerivedClass)
+
+    def test_weakref(self):
+        @slotdataclass(weakref_slot=True)
+        class WeakrefClass:
+            a: int
+            b: Text
+
+        data: WeakrefClass = WeakrefClass(1, 'asdf')
+        self.assertIs(ref(data)(), data)
+        test_all(self, WeakrefClass)
+        with self.assertRaises(TypeError):
+            ref(SlotWithoutWeakref(1))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(FrozenSlotClass(1, 'asdf'))), FrozenSlotClass(1, 'asdf'))
+
+
+@slotdataclass
+class SlotWithoutWeakref:
+    a: int
+
+
+@slotdataclass(frozen=True)
+class FrozenSlotClass:
+    a: int
+    b: Text
+
 
 def test_all(test_case: unittest.TestCase, target_class: Type):
     test_initialize(test_case, target_class)
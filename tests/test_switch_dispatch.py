@@ -1,5 +1,6 @@
 import unittest
 
+from dispatch_instrumentation import DispatchStats
 from switch_dispatch import OverwriteCaseError, switch_dispatch
 
 
@@ -122,3 +123,79 @@ class TestSwitchDispatch(unittest.TestCase):
         self.assertEqual(default(1), 1)
         self.assertEqual(default(2), 20)
         self.assertEqual(default(3), 3000)
+
+    def test_key_case(self):
+        @switch_dispatch(False, key=lambda value: value.lower())
+        def default(value: str) -> str:
+            return 'default'
+
+        @default.register('a')
+        def _(value: str) -> str:
+            return 'a'
+
+        self.assertEqual(default('A'), 'a')
+        self.assertEqual(default('b'), 'default')
+        self.assertEqual(default.dispatch('b'), default.__wrapped__)
+        with self.assertRaises(OverwriteCaseError):
+            @default.register('A')
+            def _(value: str) -> str:
+                return 'A'
+
+        @default.register(lambda value: value.startswith('b'))
+        def _(value: str) -> str:
+            return 'b'
+
+        @default.register('bc')
+        def _(value: str) -> str:
+            return 'bc'
+
+        self.assertEqual(default('b'), 'b')
+        self.assertEqual(default('bc'), 'b')
+
+    def test_unhashable_case(self):
+        @switch_dispatch
+        def default(value: list) -> int:
+            return 1
+
+        @default.register([2])
+        def _(value: list) -> int:
+            return 10
+
+        self.assertEqual(default([1]), 1)
+        self.assertEqual(default([2]), 10)
+
+    def test_instrument(self):
+        @switch_dispatch
+        def default(value: int) -> int:
+            return value * 1
+
+        def is_even(value: int) -> bool:
+            return value % 2 == 0
+
+        @default.register(is_even)
+        def _(value: int) -> int:
+            return value * 10
+
+        @default.register(3)
+        def _(value: int) -> int:
+            return value * 100
+
+        default(3)
+        self.assertIsNone(default.get_dispatch_stats())
+
+        default.instrument()
+        for value in (1, 2, 3, 3, 4):
+            default(value)
+
+        stats: DispatchStats = default.get_dispatch_stats()
+        self.assertEqual(stats.case_hits, {is_even: 2, 3: 2})
+        self.assertEqual(stats.default_hits, 1)
+        self.assertEqual(stats.predicate_evaluations, 3)
+        self.assertLessEqual(0, stats.resolution_seconds)
+
+        default.reset_dispatch_stats()
+        self.assertEqual(default.get_dispatch_stats().case_hits, {})
+
+        default.instrument(False)
+        default(3)
+        self.assertIsNone(default.get_dispatch_stats())